@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Pluggable Kernel Backends
+=========================
+
+The hot kernels of the package behind one registry, so callers can pick an
+implementation at runtime:
+
+    generate_curves   sampled x/y for many configurations
+    batch_metrics     arc length, bounds, symmetry score and closure
+    resample_uniform  equal arc-length resampling of curve batches
+    overlap_add       sum of enveloped sinusoid grains (sonification)
+
+The 'numpy' backend is the reference. It wraps the existing implementations
+(``calculate_batch_metrics`` in ``verify.py``,
+``resample_uniform_arc_length``) and is always available. The 'numba'
+backend compiles single-pass loop kernels with ``numba.njit(parallel=True)``.
+Each curve, block of curves or output chunk is one ``prange`` iteration,
+and samples are computed where they are consumed instead of in temporary
+arrays. It is registered only when numba can be imported.
+
+``get_backend()`` returns the backend named by the ``LISSAJOUS_BACKEND``
+environment variable, otherwise the first available of ``PREFERENCE``.
+
+Usage:
+    backend = get_backend()               # 'numba' if installed, else 'numpy'
+    metrics = backend.batch_metrics(1.0, 1.0, a, b, delta, num_points=1000)
+
+    python lissajous_backends.py --curves 20000 --points 1000
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from lissajous_resample import resample_uniform_arc_length
+from verify import calculate_batch_metrics
+
+try:
+    import numba
+    prange = numba.prange
+except ImportError:
+    numba = None
+    prange = range
+
+KERNELS = ('generate_curves', 'batch_metrics', 'resample_uniform', 'overlap_add')
+METRIC_NAMES = ('arc_length', 'x_min', 'x_max', 'y_min', 'y_max', 'symmetry_score', 'closure')
+PREFERENCE = ('numba', 'numpy')
+
+
+class Backend:
+    """
+    A named set of kernel implementations.
+
+    Every kernel takes and returns the same arguments in all backends; see
+    the 'numpy' reference functions in this module for their signatures.
+    """
+
+    def __init__(self, name: str, generate_curves: Callable, batch_metrics: Callable,
+                 resample_uniform: Callable, overlap_add: Callable):
+        self.name = name
+        self.generate_curves = generate_curves
+        self.batch_metrics = batch_metrics
+        self.resample_uniform = resample_uniform
+        self.overlap_add = overlap_add
+
+    def __repr__(self) -> str:
+        return f"Backend({self.name!r})"
+
+
+BACKENDS: Dict[str, Backend] = {}
+
+
+def register_backend(backend: Backend) -> None:
+    """Add or replace a backend in the registry."""
+    BACKENDS[backend.name] = backend
+
+
+def available_backends() -> List[str]:
+    """Names of the registered backends."""
+    return list(BACKENDS)
+
+
+def get_backend(name: Optional[str] = None) -> Backend:
+    """
+    Look up a backend.
+
+    Args:
+        name: Backend name (default: ``$LISSAJOUS_BACKEND``, else the first
+            registered entry of ``PREFERENCE``)
+
+    Returns:
+        The ``Backend``
+    """
+    name = name or os.environ.get('LISSAJOUS_BACKEND')
+    if name is None:
+        name = next(n for n in PREFERENCE if n in BACKENDS)
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown or unavailable backend {name!r}; "
+                         f"available: {available_backends()}")
+    return BACKENDS[name]
+
+
+def _thread_count() -> int:
+    """Threads that ``prange`` loops run on (1 without numba)."""
+    return numba.get_num_threads() if numba is not None else 1
+
+
+def _parameters(*params) -> Tuple[np.ndarray, ...]:
+    """Broadcast curve parameters to contiguous 1-D float arrays."""
+    return tuple(np.ascontiguousarray(p.ravel()) for p in np.broadcast_arrays(
+        *(np.asarray(p, dtype=float) for p in params)))
+
+
+# NumPy reference backend
+
+def _numpy_generate_curves(amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift,
+                           num_points: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample ``LissajousGeometry`` curves for many configurations.
+
+    Args:
+        amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift:
+            Curve parameters (broadcast together)
+        num_points: Samples per curve over [0, 2π]
+
+    Returns:
+        Tuple of (x, y), each of shape (n_curves, num_points)
+    """
+    A, B, a, b, delta = _parameters(amplitude_x, amplitude_y, frequency_x, frequency_y,
+                                    phase_shift)
+    t = np.linspace(0, 2 * np.pi, num_points)
+    return (A[:, None] * np.sin(a[:, None] * t + delta[:, None]),
+            B[:, None] * np.sin(b[:, None] * t))
+
+
+def _numpy_batch_metrics(amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift,
+                         num_points: int = 1000) -> Dict[str, np.ndarray]:
+    """Sampled metrics as returned by ``calculate_batch_metrics``."""
+    return calculate_batch_metrics(amplitude_x, amplitude_y, frequency_x, frequency_y,
+                                   phase_shift, num_points=num_points)
+
+
+def _numpy_resample_uniform(x: np.ndarray, y: np.ndarray,
+                            num_samples: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Equal arc-length resampling as in ``resample_uniform_arc_length``."""
+    return resample_uniform_arc_length(x, y, num_samples)
+
+
+def _numpy_overlap_add(frequencies: np.ndarray, starts: np.ndarray, envelope: np.ndarray,
+                       length: int, sample_rate: float, harmonics: Sequence[int] = (1,),
+                       phase: float = 0.0, batch_size: int = 256) -> np.ndarray:
+    """
+    Sum enveloped sinusoid grains into one signal.
+
+    Grain v contributes, at sample starts[v] + n for 0 ≤ n < len(envelope),
+
+        envelope[n] · mean_k sin(2π k frequencies[v] n / sample_rate + phase)
+
+    Args:
+        frequencies: Grain frequencies in Hz
+        starts: Grain start samples (may lie outside the output)
+        envelope: Amplitude envelope shared by all grains
+        length: Output length in samples
+        sample_rate: Sample rate in Hz
+        harmonics: Harmonic numbers k averaged per grain
+        phase: Phase offset of every harmonic
+        batch_size: Grains rendered at once
+
+    Returns:
+        float64 signal of ``length`` samples
+    """
+    frequencies = np.asarray(frequencies, dtype=float)
+    starts = np.asarray(starts, dtype=np.int64)
+    envelope = np.asarray(envelope, dtype=float)
+    k = np.asarray(harmonics, dtype=float)
+    n = np.arange(len(envelope))
+    out = np.zeros(length)
+    if len(k) == 0:
+        return out
+
+    for first in range(0, len(frequencies), batch_size):
+        rows = slice(first, first + batch_size)
+        omega = 2 * np.pi * k[None, :] * frequencies[rows, None] / sample_rate
+        grains = envelope * np.sin(omega[:, :, None] * n + phase).mean(axis=1)
+        index = starts[rows, None] + n
+        valid = (index >= 0) & (index < length)
+        out += np.bincount(index[valid], weights=grains[valid], minlength=length)
+    return out
+
+
+register_backend(Backend('numpy', _numpy_generate_curves, _numpy_batch_metrics,
+                         _numpy_resample_uniform, _numpy_overlap_add))
+
+
+# Loop kernels for the compiled backend. They run unchanged (and slowly) as
+# plain Python, with prange falling back to range.
+
+def _curves_kernel(A, B, a, b, delta, t, x, y):
+    for i in prange(A.shape[0]):
+        for j in range(t.shape[0]):
+            x[i, j] = A[i] * math.sin(a[i] * t[j] + delta[i])
+            y[i, j] = B[i] * math.sin(b[i] * t[j])
+
+
+def _metrics_kernel(A, B, a, b, delta, t, out):
+    n = t.shape[0]
+    half = n // 2
+    for i in prange(A.shape[0]):
+        # Walk inward from both ends at once: every sample is evaluated
+        # once and meets its mirror sample t[n - 1 - j] for the symmetry sum
+        x0 = A[i] * math.sin(a[i] * t[0] + delta[i])
+        y0 = B[i] * math.sin(b[i] * t[0])
+        x1 = A[i] * math.sin(a[i] * t[n - 1] + delta[i])
+        y1 = B[i] * math.sin(b[i] * t[n - 1])
+        px0, py0, px1, py1 = x0, y0, x1, y1
+        length = 0.0
+        x_min = min(x0, x1)
+        x_max = max(x0, x1)
+        y_min = min(y0, y1)
+        y_max = max(y0, y1)
+        dev_x = 2 * abs(x0 + x1)
+        dev_y = 2 * abs(y0 + y1)
+        for j in range(1, half):
+            lx = A[i] * math.sin(a[i] * t[j] + delta[i])
+            ly = B[i] * math.sin(b[i] * t[j])
+            hx = A[i] * math.sin(a[i] * t[n - 1 - j] + delta[i])
+            hy = B[i] * math.sin(b[i] * t[n - 1 - j])
+            length += math.hypot(lx - px0, ly - py0) + math.hypot(hx - px1, hy - py1)
+            x_min = min(x_min, lx, hx)
+            x_max = max(x_max, lx, hx)
+            y_min = min(y_min, ly, hy)
+            y_max = max(y_max, ly, hy)
+            dev_x += 2 * abs(lx + hx)
+            dev_y += 2 * abs(ly + hy)
+            px0, py0, px1, py1 = lx, ly, hx, hy
+        if n % 2:
+            mx = A[i] * math.sin(a[i] * t[half] + delta[i])
+            my = B[i] * math.sin(b[i] * t[half])
+            length += math.hypot(mx - px0, my - py0) + math.hypot(px1 - mx, py1 - my)
+            x_min = min(x_min, mx)
+            x_max = max(x_max, mx)
+            y_min = min(y_min, my)
+            y_max = max(y_max, my)
+            dev_x += 2 * abs(mx)
+            dev_y += 2 * abs(my)
+        else:
+            length += math.hypot(px1 - px0, py1 - py0)
+
+        max_deviation = max(abs(x_min), abs(x_max), abs(y_min), abs(y_max))
+        out[i, 0] = length
+        out[i, 1] = x_min
+        out[i, 2] = x_max
+        out[i, 3] = y_min
+        out[i, 4] = y_max
+        if max_deviation > 0:
+            symmetry = 1 - (dev_x / n + dev_y / n) / (4 * max_deviation)
+            out[i, 5] = min(max(symmetry, 0.0), 1.0)
+            out[i, 6] = math.hypot(x0 - x1, y0 - y1) / max_deviation
+        else:
+            out[i, 5] = 1.0
+            out[i, 6] = 0.0
+
+
+def _resample_kernel(x, y, fractions, scratch, s_out, x_out, y_out):
+    rows = x.shape[0]
+    n = x.shape[1]
+    m = fractions.shape[0]
+    workers = scratch.shape[0]
+    per_worker = (rows + workers - 1) // workers
+    # Parallel over contiguous row blocks, each reusing its own scratch row
+    # for the cumulative arc length instead of allocating one per curve
+    for w in prange(workers):
+        cumulative = scratch[w]
+        for r in range(w * per_worker, min((w + 1) * per_worker, rows)):
+            cumulative[0] = 0.0
+            for j in range(1, n):
+                cumulative[j] = cumulative[j - 1] + math.hypot(x[r, j] - x[r, j - 1],
+                                                                y[r, j] - y[r, j - 1])
+            total = cumulative[n - 1]
+            scale = total if total > 0 else 1.0
+            index = 0
+            for k in range(m):
+                f = fractions[k]
+                while index < n - 2 and cumulative[index + 1] / scale <= f:
+                    index += 1
+                lo = cumulative[index] / scale
+                span = cumulative[index + 1] / scale - lo
+                weight = (f - lo) / span if span > 0 else 0.0
+                weight = min(max(weight, 0.0), 1.0)
+                x_out[r, k] = x[r, index] + weight * (x[r, index + 1] - x[r, index])
+                y_out[r, k] = y[r, index] + weight * (y[r, index + 1] - y[r, index])
+                s_out[r, k] = f * total
+
+
+def _overlap_add_kernel(frequencies, starts, envelope, harmonics, phase, sample_rate,
+                        chunk, out):
+    length = out.shape[0]
+    grain = envelope.shape[0]
+    count = harmonics.shape[0]
+    # Parallel over output chunks, so no two threads write the same sample
+    for c in prange((length + chunk - 1) // chunk):
+        lo = c * chunk
+        hi = min(lo + chunk, length)
+        for v in range(frequencies.shape[0]):
+            first = max(lo, starts[v])
+            last = min(hi, starts[v] + grain)
+            for i in range(first, last):
+                n = i - starts[v]
+                acc = 0.0
+                for h in range(count):
+                    acc += math.sin(2 * np.pi * harmonics[h] * frequencies[v] / sample_rate * n
+                                    + phase)
+                out[i] += envelope[n] * acc / count
+
+
+def _loop_backend(name: str, jit: Callable[[Callable], Callable]) -> Backend:
+    """Wrap the loop kernels, compiled with ``jit``, in the reference signatures."""
+    curves_kernel = jit(_curves_kernel)
+    metrics_kernel = jit(_metrics_kernel)
+    resample_kernel = jit(_resample_kernel)
+    overlap_add_kernel = jit(_overlap_add_kernel)
+
+    def generate_curves(amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift,
+                        num_points: int = 1000):
+        params = _parameters(amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift)
+        x = np.empty((len(params[0]), num_points))
+        y = np.empty_like(x)
+        curves_kernel(*params, np.linspace(0, 2 * np.pi, num_points), x, y)
+        return x, y
+
+    def batch_metrics(amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift,
+                      num_points: int = 1000):
+        if num_points < 2:
+            raise ValueError("num_points must be at least 2")
+        params = _parameters(amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift)
+        out = np.empty((len(params[0]), len(METRIC_NAMES)))
+        metrics_kernel(*params, np.linspace(0, 2 * np.pi, num_points), out)
+        return {name: out[:, i].copy() for i, name in enumerate(METRIC_NAMES)}
+
+    def resample_uniform(x, y, num_samples: int):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same shape")
+        if x.shape[-1] < 2:
+            raise ValueError("At least 2 points are required")
+        if num_samples < 2:
+            raise ValueError("num_samples must be at least 2")
+        out_shape = x.shape[:-1] + (num_samples,)
+        x_rows = np.ascontiguousarray(x.reshape(-1, x.shape[-1]))
+        y_rows = np.ascontiguousarray(y.reshape(-1, x.shape[-1]))
+        s, xs, ys = (np.empty((len(x_rows), num_samples)) for _ in range(3))
+        scratch = np.empty((max(min(_thread_count(), len(x_rows)), 1), x_rows.shape[1]))
+        resample_kernel(x_rows, y_rows, np.linspace(0.0, 1.0, num_samples), scratch, s, xs, ys)
+        return s.reshape(out_shape), xs.reshape(out_shape), ys.reshape(out_shape)
+
+    def overlap_add(frequencies, starts, envelope, length: int, sample_rate: float,
+                    harmonics: Sequence[int] = (1,), phase: float = 0.0, chunk: int = 4096):
+        out = np.zeros(length)
+        if len(harmonics) == 0:
+            return out
+        overlap_add_kernel(np.ascontiguousarray(frequencies, dtype=float),
+                           np.ascontiguousarray(starts, dtype=np.int64),
+                           np.ascontiguousarray(envelope, dtype=float),
+                           np.asarray(harmonics, dtype=float), float(phase),
+                           float(sample_rate), chunk, out)
+        return out
+
+    return Backend(name, generate_curves, batch_metrics, resample_uniform, overlap_add)
+
+
+if numba is not None:
+    register_backend(_loop_backend('numba', numba.njit(parallel=True, cache=True)))
+
+
+def benchmark_backends(num_curves: int = 20000, num_points: int = 1000,
+                       resample_points: int = 512, num_grains: int = 2000,
+                       repeats: int = 3,
+                       backends: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Time every kernel on every backend.
+
+    Each kernel is called once to warm up (JIT compilation) and then timed
+    as the best of ``repeats`` calls.
+
+    Args:
+        num_curves: Curves for generate_curves, batch_metrics and resample_uniform
+        num_points: Samples per curve
+        resample_points: Output samples per resampled curve
+        num_grains: Grains for overlap_add (0.25 s each at 48 kHz, 20 ms apart)
+        repeats: Timed calls per kernel
+        backends: Backend names (default: all available)
+
+    Returns:
+        Dictionary mapping backend name to {kernel: seconds}
+    """
+    rng = np.random.default_rng(0)
+    a = rng.integers(1, 10, num_curves).astype(float)
+    b = rng.integers(1, 10, num_curves).astype(float)
+    delta = rng.uniform(0, np.pi, num_curves)
+    x, y = get_backend('numpy').generate_curves(1.0, 1.0, a, b, delta, num_points)
+    frequencies = rng.uniform(220.0, 880.0, num_grains)
+    starts = np.arange(num_grains) * 960
+    envelope = np.hanning(12000)
+    length = int(starts[-1]) + len(envelope)
+
+    calls = {
+        'generate_curves': lambda k: k.generate_curves(1.0, 1.0, a, b, delta, num_points),
+        'batch_metrics': lambda k: k.batch_metrics(1.0, 1.0, a, b, delta, num_points),
+        'resample_uniform': lambda k: k.resample_uniform(x, y, resample_points),
+        'overlap_add': lambda k: k.overlap_add(frequencies, starts, envelope, length, 48000.0,
+                                               (1, 2)),
+    }
+    results = {}
+    for name in backends or available_backends():
+        backend = get_backend(name)
+        timings = {}
+        for kernel in KERNELS:
+            calls[kernel](backend)
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                calls[kernel](backend)
+                best = min(best, time.perf_counter() - start)
+            timings[kernel] = best
+        results[name] = timings
+    return results
+
+
+def main():
+    """Command-line entry point: print a backend comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark the kernel backends")
+    parser.add_argument("--curves", type=int, default=20000, help="Curves per batch")
+    parser.add_argument("--points", type=int, default=1000, help="Samples per curve")
+    parser.add_argument("--grains", type=int, default=2000, help="Grains for overlap_add")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed calls per kernel")
+    args = parser.parse_args()
+
+    results = benchmark_backends(args.curves, args.points, num_grains=args.grains,
+                                 repeats=args.repeats)
+    names = list(results)
+    print(f"{'kernel':<18}" + "".join(f"{name:>12}" for name in names))
+    for kernel in KERNELS:
+        print(f"{kernel:<18}" + "".join(f"{results[name][kernel] * 1000:>10.1f}ms"
+                                        for name in names))
+    if numba is None:
+        print("(numba not installed; only the NumPy reference backend is available)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
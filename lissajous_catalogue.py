@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Indexed Catalogue of Rational-Ratio Lissajous Curves
+====================================================
+
+Precomputes metrics for every reduced frequency ratio p:q with
+max(p, q) ≤ N over a grid of phase shifts, so curves can be found by their
+properties without regenerating every candidate:
+
+    catalogue = LissajousCatalogue("catalogue")
+    rows = catalogue.query(max_order=12, arc_length=(20, 25),
+                           symmetry_score=(0.9, None))
+
+The table is columnar: one ``.npy`` file per column, opened with
+``mmap_mode='r'``, plus a sorted copy and the matching row ids per column
+for O(log n) range lookups and top-k scans. ``extend`` adds the ratios of
+a larger N and merges them into the existing sorted indexes.
+
+Columns live in a generation directory ``gen_NNNNNN``; ``meta.json`` names
+the current one. ``extend`` writes a complete new generation and then
+replaces ``meta.json`` atomically, so a crash at any point leaves the
+previous generation intact and consistent.
+
+All curves use unit amplitudes and span t in [0, 2π], matching the
+defaults of ``LissajousGeometry``.
+"""
+
+import json
+import os
+import shutil
+from math import gcd
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from lissajous_backends import get_backend
+from verify import analytic_arc_length
+
+CATALOGUE_VERSION = 1
+METRICS_BATCH = 1024
+
+COLUMNS = {
+    'p': np.int32,
+    'q': np.int32,
+    'phase_shift': np.float64,
+    'arc_length': np.float64,
+    'x_min': np.float64,
+    'x_max': np.float64,
+    'y_min': np.float64,
+    'y_max': np.float64,
+    'symmetry_score': np.float64,
+    'closure': np.float64,
+}
+
+
+def reduced_ratios(max_order: int, min_order: int = 0) -> List[Tuple[int, int]]:
+    """
+    List reduced ratios p:q with min_order < max(p, q) ≤ max_order.
+
+    Args:
+        max_order: Largest frequency allowed
+        min_order: Ratios whose larger frequency is ≤ this are skipped
+
+    Returns:
+        List of (p, q) pairs with gcd(p, q) == 1
+    """
+    return [(p, q)
+            for p in range(1, max_order + 1)
+            for q in range(1, max_order + 1)
+            if max(p, q) > min_order and gcd(p, q) == 1]
+
+
+def compute_metrics(p: np.ndarray, q: np.ndarray, phase: np.ndarray,
+                    num_points: int = 1000,
+                    tolerance: float = 1e-8,
+                    backend: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute catalogue metrics for a batch of unit-amplitude curves.
+
+    Sampled metrics come from the kernel backend's ``batch_metrics`` on
+    ``num_points`` samples; the arc length is integrated with
+    ``analytic_arc_length``. A curve whose quadrature hits its panel cap
+    raises RuntimeError rather than storing an unconverged length.
+
+    Args:
+        p: Frequencies in x
+        q: Frequencies in y
+        phase: Phase shifts
+        num_points: Samples per curve for the sampled metrics
+        tolerance: Relative tolerance of the arc-length quadrature
+        backend: Kernel backend name (default: ``get_backend()``)
+
+    Returns:
+        Dictionary of column arrays (see ``COLUMNS``)
+    """
+    metrics = get_backend(backend).batch_metrics(1.0, 1.0, p, q, phase, num_points=num_points)
+    metrics['arc_length'] = np.atleast_1d(analytic_arc_length(1.0, 1.0, p, q, phase,
+                                                              tolerance=tolerance, strict=True))
+    metrics['p'] = p
+    metrics['q'] = q
+    metrics['phase_shift'] = phase
+    return {name: np.asarray(metrics[name], dtype=dtype) for name, dtype in COLUMNS.items()}
+
+
+class LissajousCatalogue:
+    """
+    Memory-mapped columnar catalogue with sorted per-column indexes.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Open an existing catalogue.
+
+        Args:
+            directory: Directory written by ``LissajousCatalogue.build``
+        """
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json")) as f:
+            self.meta = json.load(f)
+        if self.meta['version'] != CATALOGUE_VERSION:
+            raise ValueError(f"Unsupported catalogue version {self.meta['version']}")
+        self._open()
+
+    @staticmethod
+    def _generation_dir(directory: str, generation: Optional[int]) -> str:
+        # Catalogues written before generations kept columns at the top level
+        if generation is None:
+            return directory
+        return os.path.join(directory, f"gen_{generation:06d}")
+
+    def _open(self):
+        self.path = self._generation_dir(self.directory, self.meta.get('generation'))
+        self.columns = {name: self._load(f"{name}.npy") for name in COLUMNS}
+        self.sorted_values = {name: self._load(f"{name}.sorted.npy") for name in COLUMNS}
+        self.sorted_rows = {name: self._load(f"{name}.rows.npy") for name in COLUMNS}
+
+    def _load(self, filename: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, filename), mmap_mode='r')
+
+    @classmethod
+    def build(cls, directory: str, max_order: int, phase_steps: int = 16,
+              num_points: int = 1000) -> 'LissajousCatalogue':
+        """
+        Compute a new catalogue and write it to ``directory``.
+
+        Args:
+            directory: Output directory (created if missing)
+            max_order: Largest frequency N; all reduced p:q with p, q ≤ N
+            phase_steps: Phase shifts per ratio, evenly spaced over [0, π)
+            num_points: Samples per curve for the sampled metrics
+
+        Returns:
+            The opened catalogue
+        """
+        meta = {'version': CATALOGUE_VERSION, 'max_order': 0, 'generation': 0,
+                'phase_steps': phase_steps, 'num_points': num_points, 'rows': 0}
+        path = cls._generation_dir(directory, 0)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.makedirs(path)
+        empty = {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+        for name, values in empty.items():
+            cls._write_column(path, name, values, values, np.empty(0, dtype=np.int64))
+        cls._write_meta(directory, meta)
+
+        catalogue = cls(directory)
+        catalogue.extend(max_order)
+        return catalogue
+
+    @staticmethod
+    def _write_column(path: str, name: str, values: np.ndarray,
+                      sorted_values: np.ndarray, sorted_rows: np.ndarray):
+        # Only ever called on a staging generation; meta.json makes it live
+        for suffix, array in (("", values), (".sorted", sorted_values), (".rows", sorted_rows)):
+            np.save(os.path.join(path, f"{name}{suffix}.npy"), np.ascontiguousarray(array))
+
+    @staticmethod
+    def _write_meta(directory: str, meta: Dict):
+        path = os.path.join(directory, "meta.json")
+        with open(path + ".tmp", 'w') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def __len__(self) -> int:
+        return self.meta['rows']
+
+    def extend(self, max_order: int) -> int:
+        """
+        Add all ratios with the current max_order < max(p, q) ≤ ``max_order``.
+
+        New rows are appended to every column; each sorted index is updated
+        by merging the sorted new values into the existing order, so the
+        existing rows are never recomputed or re-sorted. All columns are
+        written to a new generation directory that only becomes current
+        when ``meta.json`` is replaced, so an interrupted extend leaves the
+        catalogue as it was and can simply be run again. Metrics are
+        computed ``METRICS_BATCH`` configurations at a time.
+
+        Args:
+            max_order: New largest frequency N
+
+        Returns:
+            Number of rows added
+        """
+        ratios = reduced_ratios(max_order, self.meta['max_order'])
+        if not ratios:
+            return 0
+
+        phases = np.arange(self.meta['phase_steps']) * (np.pi / self.meta['phase_steps'])
+        pq = np.array(ratios, dtype=np.int64)
+        p = np.repeat(pq[:, 0], len(phases))
+        q = np.repeat(pq[:, 1], len(phases))
+        phase = np.tile(phases, len(pq))
+        chunks = [compute_metrics(p[i:i + METRICS_BATCH], q[i:i + METRICS_BATCH],
+                                  phase[i:i + METRICS_BATCH], num_points=self.meta['num_points'])
+                  for i in range(0, len(p), METRICS_BATCH)]
+        new = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in COLUMNS}
+
+        offset = len(self)
+        generation = self.meta.get('generation', -1) + 1
+        staging = self._generation_dir(self.directory, generation)
+        # Drop staging left by an interrupted extend and old generations
+        # that could not be removed earlier
+        for entry in os.listdir(self.directory):
+            path = os.path.join(self.directory, entry)
+            if entry.startswith("gen_") and path != self.path:
+                shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(staging)
+        for name in COLUMNS:
+            old_values = np.asarray(self.columns[name])
+            old_sorted = np.asarray(self.sorted_values[name])
+            old_rows = np.asarray(self.sorted_rows[name])
+
+            order = np.argsort(new[name], kind='stable')
+            new_sorted = new[name][order]
+            new_rows = order + offset
+            # Stable merge: new values go after equal old values
+            position = np.searchsorted(old_sorted, new_sorted, side='right')
+            merged_sorted = np.insert(old_sorted, position, new_sorted)
+            merged_rows = np.insert(old_rows, position, new_rows)
+
+            self._write_column(staging, name,
+                               np.concatenate([old_values, new[name]]),
+                               merged_sorted, merged_rows)
+
+        previous = self.path
+        meta = dict(self.meta, max_order=max_order, rows=offset + len(p), generation=generation)
+        self._write_meta(self.directory, meta)
+        self.meta = meta
+        self._open()
+        if previous != self.directory:
+            # Open memory maps keep their data on POSIX; where removal
+            # fails, the next extend retries it
+            shutil.rmtree(previous, ignore_errors=True)
+        return len(p)
+
+    def _range_rows(self, name: str, low: Optional[float], high: Optional[float]) -> np.ndarray:
+        """Row ids with low ≤ column ≤ high, via the sorted index."""
+        values = self.sorted_values[name]
+        start = 0 if low is None else np.searchsorted(values, low, side='left')
+        stop = len(values) if high is None else np.searchsorted(values, high, side='right')
+        return self.sorted_rows[name][start:stop]
+
+    def _ranges(self, max_order: Optional[int], ranges: Dict[str, Tuple]) -> Dict[str, Tuple]:
+        ranges = dict(ranges)
+        for name in ranges:
+            if name not in COLUMNS:
+                raise KeyError(f"Unknown catalogue column: {name}")
+        if max_order is not None:
+            for name in ('p', 'q'):
+                low, high = ranges.get(name, (None, None))
+                ranges[name] = (low, max_order if high is None else min(high, max_order))
+        return ranges
+
+    def query(self, max_order: Optional[int] = None, **ranges: Tuple) -> np.ndarray:
+        """
+        Find rows whose columns fall inside inclusive ranges.
+
+        The most selective range is answered from its sorted index in
+        O(log n); the remaining ranges only filter those candidates.
+
+        Args:
+            max_order: Only ratios with p, q ≤ max_order
+            **ranges: column=(low, high); either bound may be None
+
+        Returns:
+            Sorted array of matching row ids
+        """
+        ranges = self._ranges(max_order, ranges)
+        if not ranges:
+            return np.arange(len(self))
+
+        counts = {}
+        for name, (low, high) in ranges.items():
+            values = self.sorted_values[name]
+            start = 0 if low is None else np.searchsorted(values, low, side='left')
+            stop = len(values) if high is None else np.searchsorted(values, high, side='right')
+            counts[name] = stop - start
+        driver = min(counts, key=counts.get)
+
+        rows = np.sort(self._range_rows(driver, *ranges[driver]))
+        for name, (low, high) in ranges.items():
+            if name == driver or len(rows) == 0:
+                continue
+            values = self.columns[name][rows]
+            keep = np.ones(len(rows), dtype=bool)
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+            rows = rows[keep]
+        return rows
+
+    def top_k(self, column: str, k: int, largest: bool = True,
+              max_order: Optional[int] = None, chunk_size: int = 4096,
+              **ranges: Tuple) -> np.ndarray:
+        """
+        Rows with the k largest (or smallest) values of ``column``.
+
+        Walks the sorted index of ``column`` from the requested end in
+        chunks and stops as soon as k rows pass the optional filters.
+
+        Args:
+            column: Column to rank by
+            k: Number of rows to return
+            largest: Rank descending when True
+            max_order: Only ratios with p, q ≤ max_order
+            chunk_size: Index entries examined per step
+            **ranges: Additional column=(low, high) filters
+
+        Returns:
+            Row ids ordered by rank
+        """
+        if column not in COLUMNS:
+            raise KeyError(f"Unknown catalogue column: {column}")
+        ranges = self._ranges(max_order, ranges)
+        order = self.sorted_rows[column]
+        n = len(order)
+
+        found = []
+        remaining = k
+        for start in range(0, n, chunk_size):
+            if largest:
+                rows = np.asarray(order[max(n - start - chunk_size, 0):n - start])[::-1]
+            else:
+                rows = np.asarray(order[start:start + chunk_size])
+            keep = np.ones(len(rows), dtype=bool)
+            for name, (low, high) in ranges.items():
+                values = self.columns[name][rows]
+                if low is not None:
+                    keep &= values >= low
+                if high is not None:
+                    keep &= values <= high
+            found.append(rows[keep][:remaining])
+            remaining -= len(found[-1])
+            if remaining <= 0:
+                break
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def rows(self, row_ids: np.ndarray) -> List[Dict[str, float]]:
+        """
+        Materialize rows as dictionaries.
+
+        Args:
+            row_ids: Row ids, e.g. from ``query`` or ``top_k``
+
+        Returns:
+            One dictionary per row with a value for every column
+        """
+        row_ids = np.asarray(row_ids, dtype=np.int64)
+        gathered = {name: self.columns[name][row_ids].tolist() for name in COLUMNS}
+        return [{name: gathered[name][i] for name in COLUMNS} for i in range(len(row_ids))]
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Compact Binary Storage for Lissajous Curves
+===========================================
+
+A quantized, delta-encoded and zlib-compressed alternative to the CSV
+datasets. Compared with CSV:
+
+- The t column is dropped; it is implied by num_points (t = linspace(0, 2π)).
+- x and y are quantized to uint16 or uint32 steps across the bounding box
+  from ``LissajousGeometry.calculate_bounding_box``. The maximum
+  reconstruction error is half a step, i.e. (max - min) / (2 * (2^bits - 1)).
+- Consecutive steps are delta-encoded with wrap-around, which is exactly
+  invertible, then byte-shuffled so zlib sees long runs of similar bytes.
+
+File layout (little endian):
+
+    header   8s magic, uint16 version, uint16 bits, uint32 reserved,
+             float64 A, B, a, b, δ, float64 x_min, x_max, y_min, y_max,
+             uint64 point count, uint64 compressed payload size
+    payload  zlib(byte-shuffled x deltas followed by y deltas)
+"""
+
+import struct
+import zlib
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from verify import LissajousGeometry
+
+COMPACT_MAGIC = b"LSJZ\x00\x00\x00\x01"
+COMPACT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHI5d4dQQ")
+_DTYPES = {16: np.dtype('<u2'), 32: np.dtype('<u4')}
+
+
+def _quantize(values: np.ndarray, low: float, high: float, bits: int) -> np.ndarray:
+    """Map values in [low, high] onto integer steps 0 .. 2^bits - 1."""
+    levels = (1 << bits) - 1
+    span = high - low
+    if span <= 0:
+        return np.zeros(len(values), dtype=_DTYPES[bits])
+    steps = np.rint((values - low) * (levels / span))
+    return np.clip(steps, 0, levels).astype(_DTYPES[bits])
+
+
+def _dequantize(steps: np.ndarray, low: float, high: float, bits: int) -> np.ndarray:
+    """Inverse of ``_quantize``."""
+    levels = (1 << bits) - 1
+    return low + steps.astype(float) * ((high - low) / levels)
+
+
+def _encode(steps: np.ndarray) -> bytes:
+    """Delta-encode with wrap-around and byte-shuffle."""
+    deltas = np.empty_like(steps)
+    deltas[0] = steps[0]
+    # Unsigned subtraction wraps modulo 2^bits, which cumsum undoes exactly
+    np.subtract(steps[1:], steps[:-1], out=deltas[1:])
+    return deltas.view(np.uint8).reshape(-1, steps.itemsize).T.tobytes()
+
+
+def _decode(payload: bytes, num_points: int, dtype: np.dtype) -> np.ndarray:
+    """Inverse of ``_encode``."""
+    shuffled = np.frombuffer(payload, dtype=np.uint8).reshape(dtype.itemsize, num_points)
+    deltas = np.ascontiguousarray(shuffled.T).view(dtype).ravel()
+    return np.cumsum(deltas, dtype=dtype)
+
+
+def max_quantization_error(bbox: Dict[str, float], bits: int) -> float:
+    """
+    Maximum per-coordinate reconstruction error for a bounding box.
+
+    Args:
+        bbox: Bounding box as returned by ``calculate_bounding_box``
+        bits: Quantization bits (16 or 32)
+
+    Returns:
+        Half a quantization step of the wider axis (actual errors may
+        exceed it by float64 rounding, i.e. a few ulp)
+    """
+    levels = (1 << bits) - 1
+    span = max(bbox['x_max'] - bbox['x_min'], bbox['y_max'] - bbox['y_min'])
+    return span / (2 * levels)
+
+
+def write_compact_curve(path: str, lissajous: LissajousGeometry,
+                        x: Optional[np.ndarray] = None,
+                        y: Optional[np.ndarray] = None,
+                        bits: int = 16, level: int = 6) -> Dict[str, float]:
+    """
+    Write a curve in the compact binary format.
+
+    Args:
+        path: Output file path
+        lissajous: Curve parameters; its ``num_points`` defines the implied t
+        x: x-coordinates (generated from ``lissajous`` when omitted)
+        y: y-coordinates (generated from ``lissajous`` when omitted)
+        bits: Quantization bits, 16 or 32
+        level: zlib compression level
+
+    Returns:
+        Dictionary with 'bytes' written and the stated 'max_error'
+    """
+    if bits not in _DTYPES:
+        raise ValueError("bits must be 16 or 32")
+    if x is None or y is None:
+        x, y = lissajous.generate_curve()
+    if len(x) != lissajous.num_points or len(y) != lissajous.num_points:
+        raise ValueError("x and y must have num_points samples")
+
+    bbox = lissajous.calculate_bounding_box(x, y)
+    qx = _quantize(np.asarray(x, dtype=float), bbox['x_min'], bbox['x_max'], bits)
+    qy = _quantize(np.asarray(y, dtype=float), bbox['y_min'], bbox['y_max'], bits)
+    payload = zlib.compress(_encode(qx) + _encode(qy), level)
+
+    header = _HEADER.pack(COMPACT_MAGIC, COMPACT_VERSION, bits, 0,
+                          lissajous.A, lissajous.B, lissajous.a, lissajous.b, lissajous.delta,
+                          bbox['x_min'], bbox['x_max'], bbox['y_min'], bbox['y_max'],
+                          lissajous.num_points, len(payload))
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.write(payload)
+
+    return {'bytes': len(header) + len(payload),
+            'max_error': max_quantization_error(bbox, bits)}
+
+
+def read_compact_header(path: str) -> Dict[str, float]:
+    """
+    Read only the header of a compact curve file.
+
+    Args:
+        path: Path to a file written by ``write_compact_curve``
+
+    Returns:
+        Dictionary with curve parameters, bounding box, 'bits',
+        'num_points' and the 'max_error' of the stored coordinates
+    """
+    with open(path, 'rb') as f:
+        return _unpack_header(f.read(_HEADER.size), path)
+
+
+def _unpack_header(raw: bytes, path: str) -> Dict[str, float]:
+    if len(raw) < _HEADER.size:
+        raise ValueError(f"{path} is too short for a compact curve file")
+    (magic, version, bits, _, A, B, a, b, delta,
+     x_min, x_max, y_min, y_max, num_points, payload_size) = _HEADER.unpack(raw[:_HEADER.size])
+    if magic != COMPACT_MAGIC:
+        raise ValueError(f"{path} is not a compact curve file")
+    if version != COMPACT_VERSION:
+        raise ValueError(f"Unsupported compact curve version {version}")
+    bbox = {'x_min': x_min, 'x_max': x_max, 'y_min': y_min, 'y_max': y_max}
+    return {'amplitude_x': A, 'amplitude_y': B, 'frequency_x': a, 'frequency_y': b,
+            'phase_shift': delta, **bbox, 'bits': bits, 'num_points': num_points,
+            'payload_size': payload_size, 'max_error': max_quantization_error(bbox, bits)}
+
+
+def read_compact_curve(path: str) -> Tuple[LissajousGeometry, np.ndarray, np.ndarray]:
+    """
+    Read a compact curve file.
+
+    Args:
+        path: Path to a file written by ``write_compact_curve``
+
+    Returns:
+        Tuple of (lissajous, x, y); ``lissajous.t`` restores the dropped t
+        column and x, y are within ``max_error`` of the written values
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    header = _unpack_header(raw, path)
+    payload = zlib.decompress(raw[_HEADER.size:_HEADER.size + header['payload_size']])
+
+    n = header['num_points']
+    bits = header['bits']
+    dtype = _DTYPES[bits]
+    half = n * dtype.itemsize
+    qx = _decode(payload[:half], n, dtype)
+    qy = _decode(payload[half:], n, dtype)
+
+    lissajous = LissajousGeometry(
+        amplitude_x=header['amplitude_x'],
+        amplitude_y=header['amplitude_y'],
+        frequency_x=header['frequency_x'],
+        frequency_y=header['frequency_y'],
+        phase_shift=header['phase_shift'],
+        num_points=n
+    )
+    x = _dequantize(qx, header['x_min'], header['x_max'], bits)
+    y = _dequantize(qy, header['y_min'], header['y_max'], bits)
+    return lissajous, x, y
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Inverse Fitting of Lissajous Parameters from Recorded Traces
+============================================================
+
+Recovers (A, B, a, b, δ) of the ``LissajousGeometry`` model from sampled
+x/y traces, e.g. oscilloscope recordings, for thousands of traces per call.
+
+A recording rarely starts at t = 0 of the model, so each channel is fitted
+as a free sinusoid
+
+    x(t) = A sin(a t + φx),    y(t) = B sin(b t + φy)
+
+and the result is mapped back to the model by shifting time with
+``t_offset`` = φy / b, which gives δ = φx - a φy / b.
+
+Fitting runs in three vectorized stages over all traces at once:
+
+1. Frequencies are seeded from the dominant FFT peak (``lissajous_spectral``).
+2. Amplitudes and phases at those frequencies follow from a linear
+   least-squares fit of sin/cos pairs.
+3. Levenberg–Marquardt refines (amplitude, frequency, phase) per channel,
+   solving one batched 3 × 3 system per iteration with per-trace damping.
+
+Residuals are reported against the model. Their white-noise level is
+estimated from first differences, which leaves a smooth model error almost
+untouched. Only the remaining systematic part is checked against the
+``ValidationMetrics`` amplitude tolerance, so measurement noise alone does
+not fail a correct fit. This assumes several samples per period.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+from lissajous_spectral import dominant_harmonics
+from verify import ValidationMetrics
+
+
+def _seed(signals: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """FFT frequency seed plus linear least-squares amplitude and phase."""
+    dt = t[1] - t[0]
+    peaks = dominant_harmonics(signals, num_harmonics=1, t_span=dt * len(t), endpoint=False)
+    omega = np.nan_to_num(peaks['frequency'][:, 0], nan=1.0)
+
+    phase_t = omega[:, None] * t
+    s, c = np.sin(phase_t), np.cos(phase_t)
+    ss, cc, sc = np.sum(s * s, -1), np.sum(c * c, -1), np.sum(s * c, -1)
+    sy, cy = np.sum(s * signals, -1), np.sum(c * signals, -1)
+    det = ss * cc - sc * sc
+    det = np.where(np.abs(det) > 1e-300, det, 1.0)
+    p = (cc * sy - sc * cy) / det
+    q = (ss * cy - sc * sy) / det
+    return np.column_stack([np.hypot(p, q), omega, np.arctan2(q, p)])
+
+
+def _levenberg_marquardt(signals: np.ndarray, t: np.ndarray, params: np.ndarray,
+                         max_iterations: int, tolerance: float) -> Dict[str, np.ndarray]:
+    """Refine (amplitude, frequency, phase) rows of ``params`` in place."""
+    m = len(signals)
+    damping = np.full(m, 1e-3)
+    cost = np.sum((params[:, :1] * np.sin(params[:, 1:2] * t + params[:, 2:3]) - signals) ** 2, -1)
+    # Below this the fit is exact to rounding and no step can improve it
+    floor = 1e-24 * np.maximum(np.sum(signals ** 2, -1), 1e-300)
+    active = cost > floor
+    converged = ~active
+    iterations = np.zeros(m, dtype=np.int64)
+
+    for _ in range(max_iterations):
+        rows = np.nonzero(active)[0]
+        if len(rows) == 0:
+            break
+        amplitude, omega, phase = params[rows].T
+        theta = omega[:, None] * t + phase[:, None]
+        sin, cos = np.sin(theta), np.cos(theta)
+        residual = amplitude[:, None] * sin - signals[rows]
+
+        # Jacobian columns: ∂/∂A, ∂/∂a, ∂/∂φ
+        jacobian = np.stack([sin, amplitude[:, None] * t * cos, amplitude[:, None] * cos], axis=-1)
+        normal = np.einsum('rni,rnj->rij', jacobian, jacobian)
+        gradient = np.einsum('rni,rn->ri', jacobian, residual)
+        diagonal = np.einsum('rii->ri', normal)
+        system = normal + (damping[rows, None] * np.maximum(diagonal, 1e-12))[:, :, None] * np.eye(3)
+        step = np.linalg.solve(system, -gradient[:, :, None])[:, :, 0]
+
+        trial = params[rows] + step
+        trial_cost = np.sum((trial[:, :1] * np.sin(trial[:, 1:2] * t + trial[:, 2:3])
+                             - signals[rows]) ** 2, -1)
+        better = trial_cost < cost[rows]
+
+        improved = rows[better]
+        params[improved] = trial[better]
+        relative = (cost[improved] - trial_cost[better]) / np.maximum(cost[improved], 1e-300)
+        cost[improved] = trial_cost[better]
+        damping[improved] = np.maximum(damping[improved] / 10, 1e-12)
+        damping[rows[~better]] *= 10
+        iterations[rows] += 1
+
+        # Converged: the cost no longer moves, is exact to rounding, or the
+        # step is negligible; failed: the damping blew up without progress
+        small_step = np.max(np.abs(step) / np.maximum(np.abs(params[rows]), 1e-12), -1) < 1e-12
+        done = small_step | (cost[rows] <= floor[rows])
+        done[better] |= relative < tolerance
+        converged[rows[done]] = True
+        active[rows[done]] = False
+        active[rows[~better][damping[rows[~better]] > 1e10]] = False
+
+    return {'cost': cost, 'iterations': iterations, 'converged': converged}
+
+
+def fit_lissajous(x: np.ndarray, y: np.ndarray, t: Optional[np.ndarray] = None,
+                  max_iterations: int = 50, tolerance: float = 1e-12,
+                  residual_tolerance: float = ValidationMetrics.AMPLITUDE_TOLERANCE,
+                  batch_size: int = 1024) -> Dict[str, np.ndarray]:
+    """
+    Fit the Lissajous model to one trace or a batch of traces.
+
+    Args:
+        x: Recorded x samples, shape (n_samples,) or (n_traces, n_samples)
+        y: Recorded y samples, same shape as x
+        t: Uniform sample times shared by all traces (default:
+            linspace(0, 2π, n_samples), as in ``generate_curve``)
+        max_iterations: Levenberg–Marquardt iteration limit
+        tolerance: Relative cost decrease below which a trace stops
+        residual_tolerance: Largest acceptable RMS model error, i.e. the
+            residual with its noise part removed (default: the
+            ``ValidationMetrics`` amplitude tolerance)
+        batch_size: Traces fitted at once
+
+    Returns:
+        Dictionary of arrays (scalars for 1-D input): 'amplitude_x',
+        'amplitude_y', 'frequency_x', 'frequency_y', 'phase_shift' (in
+        [0, 2π)), 't_offset' (model time = t + t_offset), 'residual_rms',
+        'residual_max', 'residual_noise' (estimated noise RMS),
+        'within_tolerance', 'converged' and 'iterations'
+    """
+    squeeze = np.ndim(x) == 1
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same shape")
+    n = x.shape[-1]
+    if n < 8:
+        raise ValueError("At least 8 samples per trace are required")
+    t = np.linspace(0, 2 * np.pi, n) if t is None else np.asarray(t, dtype=float)
+    if t.shape != (n,):
+        raise ValueError("t must have one entry per sample")
+
+    names = ('amplitude_x', 'amplitude_y', 'frequency_x', 'frequency_y', 'phase_shift',
+             't_offset', 'residual_rms', 'residual_max', 'residual_noise', 'within_tolerance',
+             'converged', 'iterations')
+    result = {name: np.empty(len(x)) for name in names}
+    result['within_tolerance'] = np.empty(len(x), dtype=bool)
+    result['converged'] = np.empty(len(x), dtype=bool)
+    result['iterations'] = np.empty(len(x), dtype=np.int64)
+
+    for start in range(0, len(x), batch_size):
+        rows = slice(start, start + batch_size)
+        # x and y channels are independent sinusoids: fit them as one stack
+        signals = np.concatenate([x[rows], y[rows]])
+        params = _seed(signals, t)
+        fit = _levenberg_marquardt(signals, t, params, max_iterations, tolerance)
+
+        # Canonical form: positive amplitude and frequency
+        flip = params[:, 1] < 0
+        params[flip, 1:] *= -1
+        params[flip, 2] += np.pi
+        negative = params[:, 0] < 0
+        params[negative, 0] *= -1
+        params[negative, 2] += np.pi
+
+        k = len(signals) // 2
+        (amp_x, omega_x, phi_x), (amp_y, omega_y, phi_y) = params[:k].T, params[k:].T
+        t_offset = phi_y / omega_y
+        delta = np.mod(phi_x - omega_x * t_offset, 2 * np.pi)
+
+        # Residuals of the model curve at model time t + t_offset
+        tau = t + t_offset[:, None]
+        rx = amp_x[:, None] * np.sin(omega_x[:, None] * tau + delta[:, None]) - x[rows]
+        ry = amp_y[:, None] * np.sin(omega_y[:, None] * tau) - y[rows]
+        distance = np.hypot(rx, ry)
+
+        result['amplitude_x'][rows] = amp_x
+        result['amplitude_y'][rows] = amp_y
+        result['frequency_x'][rows] = omega_x
+        result['frequency_y'][rows] = omega_y
+        result['phase_shift'][rows] = delta
+        result['t_offset'][rows] = t_offset
+        rms = np.sqrt(np.mean(distance ** 2, axis=-1))
+        # White noise of variance σ² gives first differences of variance
+        # 2σ², while a smooth model error barely changes between samples
+        noise = np.sqrt(np.mean(np.diff(rx, axis=-1) ** 2 + np.diff(ry, axis=-1) ** 2, axis=-1) / 2)
+        systematic = np.sqrt(np.maximum(rms ** 2 - noise ** 2, 0.0))
+        result['residual_rms'][rows] = rms
+        result['residual_max'][rows] = np.max(distance, axis=-1)
+        result['residual_noise'][rows] = noise
+        result['within_tolerance'][rows] = systematic <= residual_tolerance
+        result['converged'][rows] = fit['converged'][:k] & fit['converged'][k:]
+        result['iterations'][rows] = np.maximum(fit['iterations'][:k], fit['iterations'][k:])
+
+    if squeeze:
+        return {name: values[0].item() for name, values in result.items()}
+    return result
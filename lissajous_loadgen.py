@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Local Load Generator for the Lissajous HTTP Service
+===================================================
+
+Opens ``concurrency`` keep-alive connections to ``lissajous_server.py`` and
+sends GET requests over them as fast as responses arrive, cycling through
+a list of paths. Reports throughput and latency percentiles.
+
+Usage:
+    python lissajous_server.py --port 8080 &
+    python lissajous_loadgen.py --port 8080 --concurrency 64 --requests 20000 \\
+        "/curve?a=3&b=2" "/metrics?a=5&b=4" "/glyph?text=HELLO"
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+DEFAULT_PATHS = ("/curve?a=3&b=2", "/metrics?a=5&b=4", "/glyph?text=HELLO")
+
+
+async def _fetch(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 host: str, path: str) -> int:
+    """Send one keep-alive GET and read the full response; return its status."""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Connection closed by server")
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def run_load_test(host: str = "127.0.0.1", port: int = 8080,
+                        paths: Sequence[str] = DEFAULT_PATHS,
+                        concurrency: int = 32, requests: int = 10000) -> Dict[str, float]:
+    """
+    Drive the service with concurrent keep-alive clients.
+
+    Args:
+        host: Server host
+        port: Server port
+        paths: Request paths, cycled in order
+        concurrency: Number of simultaneous connections
+        requests: Total number of requests
+
+    Returns:
+        Dictionary with 'requests', 'errors', 'seconds', 'requests_per_second'
+        and latency percentiles 'p50_ms', 'p90_ms', 'p99_ms'
+    """
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for i in counter:
+                start = time.perf_counter()
+                status = await _fetch(reader, writer, host, paths[i % len(paths)])
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+
+    percentiles = np.percentile(latencies, [50, 90, 99]) * 1000 if latencies else [0.0] * 3
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'seconds': seconds,
+        'requests_per_second': len(latencies) / seconds if seconds > 0 else 0.0,
+        'p50_ms': float(percentiles[0]),
+        'p90_ms': float(percentiles[1]),
+        'p99_ms': float(percentiles[2]),
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the Lissajous HTTP service")
+    parser.add_argument("paths", nargs="*", default=list(DEFAULT_PATHS), help="Request paths")
+    parser.add_argument("--host", default="127.0.0.1", help="Server host")
+    parser.add_argument("--port", type=int, default=8080, help="Server port")
+    parser.add_argument("--concurrency", type=int, default=32, help="Simultaneous connections")
+    parser.add_argument("--requests", type=int, default=10000, help="Total requests")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load_test(args.host, args.port, args.paths,
+                                       args.concurrency, args.requests))
+    print(f"{result['requests']} requests in {result['seconds']:.2f} s "
+          f"({result['requests_per_second']:.0f} req/s), {result['errors']} errors")
+    print(f"latency p50 {result['p50_ms']:.2f} ms, p90 {result['p90_ms']:.2f} ms, "
+          f"p99 {result['p99_ms']:.2f} ms")
+    return 0 if result['errors'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
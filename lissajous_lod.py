@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Multi-Resolution Level-of-Detail Pyramids for Lissajous Curves
+==============================================================
+
+Builds a pyramid of progressively simplified versions of a curve so that
+zoomed-out views can be served in O(pixels) instead of O(points):
+
+- Min/max envelope decimation: per index bucket, keep the points holding
+  the minimum and maximum x and y. This is a coarse decimation that keeps
+  the bounding box exactly but gives no bound on the shape in between.
+- Ramer–Douglas–Peucker simplification at several tolerances, which
+  bounds the distance between the simplified and the full curve.
+
+All levels are stored in one binary ``.lod`` file with an offset index, so
+``LODPyramid`` can memory-map the file and read only the level it needs.
+
+File layout (little endian):
+
+    header   8s magic, uint32 version, uint32 level count
+    index    per level: uint32 kind, uint32 reserved, float64 parameter,
+             uint64 point count, uint64 byte offset of the level data
+    data     per level: float64 (n, 2) array of interleaved x, y
+"""
+
+import struct
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+LOD_MAGIC = b"LSJLOD\x00\x01"
+LOD_VERSION = 1
+
+LEVEL_FULL = 0
+LEVEL_ENVELOPE = 1
+LEVEL_RDP = 2
+LEVEL_KINDS = {LEVEL_FULL: 'full', LEVEL_ENVELOPE: 'envelope', LEVEL_RDP: 'rdp'}
+
+_HEADER = struct.Struct("<8sII")
+_INDEX_ENTRY = struct.Struct("<IIdQQ")
+
+
+def minmax_envelope(x: np.ndarray, y: np.ndarray, num_buckets: int) -> np.ndarray:
+    """
+    Select the indices of a min/max envelope decimation.
+
+    The points are split into ``num_buckets`` consecutive index buckets
+    and, per bucket, the points with the minimum and maximum x and y are
+    kept (at most four per bucket, plus both curve endpoints). This is a
+    coarse decimation: the buckets are ranges of the curve parameter, not
+    screen columns, so one bucket can span the whole drawing and the
+    result preserves the bounding box and each bucket's extremes but not
+    the shape between them. Use ``rdp_simplify`` for a distance bound.
+
+    Args:
+        x: x-coordinates
+        y: y-coordinates
+        num_buckets: Number of index buckets
+
+    Returns:
+        Sorted array of kept indices
+    """
+    n = len(x)
+    if num_buckets <= 0:
+        raise ValueError("num_buckets must be positive")
+    if n <= 4 * num_buckets:
+        return np.arange(n)
+
+    bucket_size = -(-n // num_buckets)
+    rows = -(-n // bucket_size)
+    padded = rows * bucket_size
+    starts = np.arange(rows) * bucket_size
+
+    kept = [np.array([0, n - 1])]
+    for values in (x, y):
+        grid = np.full(padded, np.nan)
+        grid[:n] = values
+        grid = grid.reshape(rows, bucket_size)
+        kept.append(starts + np.nanargmin(grid, axis=1))
+        kept.append(starts + np.nanargmax(grid, axis=1))
+    return np.unique(np.concatenate(kept))
+
+
+def rdp_simplify(x: np.ndarray, y: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Select the indices kept by Ramer–Douglas–Peucker simplification.
+
+    The recursion is processed breadth-first: every pass computes the
+    distances of all points inside all still-open segments at once and
+    splits each segment at its farthest point, so the Python-level loop
+    runs once per recursion depth rather than once per segment.
+
+    Args:
+        x: x-coordinates
+        y: y-coordinates
+        tolerance: Maximum allowed distance between a dropped point and
+            the simplified polyline (in curve units)
+
+    Returns:
+        Sorted array of kept indices
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= 2:
+        return np.arange(n)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    starts = np.array([0])
+    ends = np.array([n - 1])
+
+    while len(starts) > 0:
+        lengths = ends - starts - 1
+        active = lengths > 0
+        starts, ends, lengths = starts[active], ends[active], lengths[active]
+        if len(starts) == 0:
+            break
+
+        # Flatten the interiors of all open segments
+        segment = np.repeat(np.arange(len(starts)), lengths)
+        first = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        index = starts[segment] + 1 + np.arange(len(segment)) - first
+
+        x0, y0 = x[starts[segment]], y[starts[segment]]
+        cx = x[ends[segment]] - x0
+        cy = y[ends[segment]] - y0
+        px = x[index] - x0
+        py = y[index] - y0
+        # Distance to the chord segment rather than its infinite line, so
+        # retraced stretches (e.g. the 1:1 diagonal) are not dropped as
+        # collinear; closed curves have a zero chord and use the distance
+        # to the start point
+        chord2 = cx * cx + cy * cy
+        u = np.clip((px * cx + py * cy) / np.where(chord2 > 0, chord2, 1.0), 0.0, 1.0)
+        distance = np.hypot(px - u * cx, py - u * cy)
+
+        # Farthest point per segment; interiors are contiguous, so a
+        # reduceat gives the maxima and the first match per segment wins
+        peak = np.maximum.reduceat(distance, np.cumsum(lengths) - lengths)
+        candidates = np.nonzero(distance == peak[segment])[0]
+        _, first_match = np.unique(segment[candidates], return_index=True)
+        farthest = candidates[first_match]
+        split = peak > tolerance
+
+        pivots = index[farthest[split]]
+        keep[pivots] = True
+        starts = np.concatenate([starts[split], pivots])
+        ends = np.concatenate([pivots, ends[split]])
+
+    return np.nonzero(keep)[0]
+
+
+def build_lod_pyramid(x: np.ndarray, y: np.ndarray,
+                      envelope_buckets: Sequence[int] = (64, 256),
+                      rdp_tolerances: Sequence[float] = (0.01, 0.001)
+                      ) -> List[Dict]:
+    """
+    Build the level-of-detail pyramid for one curve.
+
+    Args:
+        x: x-coordinates
+        y: y-coordinates
+        envelope_buckets: Bucket counts for min/max envelope levels
+        rdp_tolerances: RDP tolerances as fractions of the bounding-box
+            diagonal
+
+    Returns:
+        List of level dictionaries with 'kind', 'parameter', 'x' and 'y',
+        ordered from the full curve to the coarsest level. For RDP levels
+        'parameter' is the absolute tolerance in curve units.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    diagonal = float(np.hypot(np.ptp(x), np.ptp(y)))
+
+    levels = [{'kind': 'full', 'parameter': 0.0, 'x': x, 'y': y}]
+    for tolerance in sorted(rdp_tolerances):
+        absolute = tolerance * diagonal
+        kept = rdp_simplify(x, y, absolute)
+        levels.append({'kind': 'rdp', 'parameter': absolute, 'x': x[kept], 'y': y[kept]})
+    for buckets in sorted(envelope_buckets, reverse=True):
+        kept = minmax_envelope(x, y, buckets)
+        levels.append({'kind': 'envelope', 'parameter': float(buckets),
+                       'x': x[kept], 'y': y[kept]})
+
+    levels.sort(key=lambda level: -len(level['x']))
+    return levels
+
+
+def write_lod_pyramid(path: str, levels: List[Dict]) -> None:
+    """
+    Write pyramid levels to a single binary file with an offset index.
+
+    Args:
+        path: Output file path
+        levels: Levels as returned by ``build_lod_pyramid``
+    """
+    kind_codes = {name: code for code, name in LEVEL_KINDS.items()}
+    offset = _HEADER.size + _INDEX_ENTRY.size * len(levels)
+
+    index = []
+    for level in levels:
+        n_points = len(level['x'])
+        index.append(_INDEX_ENTRY.pack(kind_codes[level['kind']], 0,
+                                       float(level['parameter']), n_points, offset))
+        offset += n_points * 2 * 8
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(LOD_MAGIC, LOD_VERSION, len(levels)))
+        f.write(b"".join(index))
+        for level in levels:
+            data = np.column_stack([level['x'], level['y']]).astype('<f8')
+            f.write(data.tobytes())
+
+
+class LODPyramid:
+    """
+    Memory-mapped reader for ``.lod`` files.
+
+    Only the header and index are read on open; level data is mapped on
+    first access, so fetching a coarse level never touches the pages of
+    the full-resolution curve.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a pyramid file and read its index.
+
+        Args:
+            path: Path to a file written by ``write_lod_pyramid``
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, version, n_levels = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != LOD_MAGIC:
+                raise ValueError(f"{path} is not a LOD pyramid file")
+            if version != LOD_VERSION:
+                raise ValueError(f"Unsupported LOD pyramid version {version}")
+            entries = [_INDEX_ENTRY.unpack(f.read(_INDEX_ENTRY.size)) for _ in range(n_levels)]
+
+        self.levels = [
+            {'kind': LEVEL_KINDS[kind], 'parameter': parameter,
+             'num_points': n_points, 'offset': offset}
+            for kind, _, parameter, n_points, offset in entries
+        ]
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def get_level(self, level: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the (x, y) coordinates of one level as read-only views.
+
+        Args:
+            level: Level number (0 is the full curve)
+
+        Returns:
+            Tuple of (x, y) numpy arrays backed by the memory map
+        """
+        if level not in self._cache:
+            entry = self.levels[level]
+            data = np.memmap(self.path, dtype='<f8', mode='r',
+                             offset=entry['offset'], shape=(entry['num_points'], 2))
+            self._cache[level] = (data[:, 0], data[:, 1])
+        return self._cache[level]
+
+    def select_level(self, max_points: int) -> int:
+        """
+        Pick the most detailed level with at most ``max_points`` points.
+
+        Args:
+            max_points: Point budget, e.g. a small multiple of the view
+                width in pixels
+
+        Returns:
+            Level number; the coarsest level if none fits the budget
+        """
+        for level, entry in enumerate(self.levels):
+            if entry['num_points'] <= max_points:
+                return level
+        return len(self.levels) - 1
+
+    def for_viewport(self, width_pixels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch the coordinates to draw a view ``width_pixels`` wide.
+
+        Picks the most detailed level with at most 4 × width points. This
+        is a point budget only; envelope levels are coarse decimations and
+        are not guaranteed to look like the full curve at that width.
+
+        Args:
+            width_pixels: View width in pixels
+
+        Returns:
+            Tuple of (x, y) numpy arrays
+        """
+        return self.get_level(self.select_level(4 * width_pixels))
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+3D Lissajous Rotors and Mesh Generation
+=======================================
+
+Extends ``LissajousGeometry`` with a third channel
+
+    x(t) = A sin(a t + δ),   y(t) = B sin(b t),   z(t) = C sin(c t + δz)
+
+and turns the space curve into triangle meshes:
+
+- ``tube_mesh`` sweeps a circle of radius r along the curve in a
+  rotation-minimizing frame, so the rings do not twist at inflections.
+- ``revolution_mesh`` revolves the curve about a coordinate axis into a
+  solid of revolution.
+
+Both meshes are regular (rows × cols) vertex grids whose faces follow from
+index arithmetic, so vertices and faces of any block of rows are computed
+with broadcasting alone. ``write_ply`` and ``write_stl`` size the output
+file up front and fill it through ``np.memmap`` one block of rows at a
+time, which keeps memory bounded for meshes of tens of millions of
+triangles. Files are written to ``path.tmp`` and renamed when complete.
+
+Usage:
+    rotor = LissajousRotor(frequency_x=3, frequency_y=2, frequency_z=5)
+    write_ply("rotor.ply", tube_mesh(rotor, radius=0.05, rows=20000, sides=32))
+
+    python lissajous_mesh.py --a 3 --b 2 --c 5 --tube 0.05 --output rotor.stl
+"""
+
+import argparse
+import os
+import sys
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+
+from verify import LissajousGeometry
+
+PLY_VERTEX_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4'), ('z', '<f4')])
+PLY_FACE_DTYPE = np.dtype([('count', 'u1'), ('vertex_indices', '<i4', (3,))])
+STL_TRIANGLE_DTYPE = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)),
+                               ('attribute', '<u2')])
+AXES = {'x': 0, 'y': 1, 'z': 2}
+FRAME_BLOCK = 65536
+
+
+class LissajousRotor(LissajousGeometry):
+    """
+    Lissajous curve with a third (z) frequency.
+
+    The x and y channels are those of ``LissajousGeometry``, so the 2D
+    metrics apply to the projection onto the xy-plane.
+    """
+
+    def __init__(self, amplitude_x: float = 1.0, amplitude_y: float = 1.0,
+                 amplitude_z: float = 1.0, frequency_x: float = 3.0,
+                 frequency_y: float = 2.0, frequency_z: float = 5.0,
+                 phase_shift: float = np.pi/2, phase_z: float = 0.0,
+                 num_points: int = 1000):
+        """
+        Initialize rotor parameters.
+
+        Args:
+            amplitude_x: Amplitude in x-direction
+            amplitude_y: Amplitude in y-direction
+            amplitude_z: Amplitude in z-direction
+            frequency_x: Frequency ratio in x-direction
+            frequency_y: Frequency ratio in y-direction
+            frequency_z: Frequency ratio in z-direction
+            phase_shift: Phase shift δ of x (in radians)
+            phase_z: Phase shift δz of z (in radians)
+            num_points: Number of points to generate
+        """
+        super().__init__(amplitude_x, amplitude_y, frequency_x, frequency_y,
+                         phase_shift, num_points)
+        self.C = amplitude_z
+        self.c = frequency_z
+        self.delta_z = phase_z
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the curve has period 2π (integer frequencies)."""
+        return all(float(f).is_integer() for f in (self.a, self.b, self.c))
+
+    def evaluate_3d(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the space curve at arbitrary parameter values.
+
+        Args:
+            t: Parameter values
+
+        Returns:
+            Tuple of (x, y, z) numpy arrays
+        """
+        x, y = self.evaluate(t)
+        z = self.C * np.sin(self.c * t + self.delta_z)
+        return x, y, z
+
+    def generate_curve_3d(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Generate space curve coordinates at ``self.t``.
+
+        Returns:
+            Tuple of (x, y, z) numpy arrays
+        """
+        return self.evaluate_3d(self.t)
+
+    def evaluate_derivatives_3d(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the analytic first and second derivatives of the space curve.
+
+        Args:
+            t: Parameter values
+
+        Returns:
+            Tuple of (velocity, acceleration) arrays of shape (len(t), 3)
+        """
+        dx, dy, ddx, ddy = self.evaluate_derivatives(t)
+        phase_z = self.c * t + self.delta_z
+        dz = self.C * self.c * np.cos(phase_z)
+        ddz = -self.C * self.c**2 * np.sin(phase_z)
+        return np.stack([dx, dy, dz], axis=-1), np.stack([ddx, ddy, ddz], axis=-1)
+
+
+class GridMesh:
+    """
+    Triangle mesh over a regular (rows × cols) vertex grid.
+
+    Vertex (i, j) has index i * cols + j. Columns always wrap around; rows
+    wrap when ``closed_rows`` is set. Each grid cell gives two triangles.
+    """
+
+    def __init__(self, rows: int, cols: int, closed_rows: bool,
+                 vertex_rows: Callable[[np.ndarray], np.ndarray]):
+        """
+        Args:
+            rows: Number of vertex rows (samples along the curve)
+            cols: Number of vertex columns (around the tube or axis)
+            closed_rows: Connect the last row back to the first
+            vertex_rows: Maps an array of row indices to vertices of shape
+                (len(indices), cols, 3)
+        """
+        if rows < 2 or cols < 3:
+            raise ValueError("A grid mesh needs at least 2 rows and 3 columns")
+        self.rows = rows
+        self.cols = cols
+        self.closed_rows = closed_rows
+        self.vertex_rows = vertex_rows
+
+    @property
+    def face_rows(self) -> int:
+        """Number of rows of grid cells."""
+        return self.rows if self.closed_rows else self.rows - 1
+
+    @property
+    def num_vertices(self) -> int:
+        return self.rows * self.cols
+
+    @property
+    def num_faces(self) -> int:
+        return 2 * self.face_rows * self.cols
+
+    def faces(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Triangles of cell rows [start, stop).
+
+        Args:
+            start: First cell row
+            stop: End cell row (default: all)
+
+        Returns:
+            int64 array of shape (2 * (stop - start) * cols, 3)
+        """
+        stop = self.face_rows if stop is None else stop
+        i = np.arange(start, stop)[:, None]
+        j = np.arange(self.cols)[None, :]
+        v00 = i * self.cols + j
+        v01 = i * self.cols + (j + 1) % self.cols
+        v10 = ((i + 1) % self.rows) * self.cols + j
+        v11 = ((i + 1) % self.rows) * self.cols + (j + 1) % self.cols
+        triangles = np.stack([np.stack([v00, v01, v11], axis=-1),
+                              np.stack([v00, v11, v10], axis=-1)], axis=2)
+        return triangles.reshape(-1, 3)
+
+    def vertices(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Vertices of rows [start, stop).
+
+        Args:
+            start: First row
+            stop: End row (default: all)
+
+        Returns:
+            float64 array of shape ((stop - start) * cols, 3)
+        """
+        stop = self.rows if stop is None else stop
+        return self.vertex_rows(np.arange(start, stop)).reshape(-1, 3)
+
+
+def _curve_parameter(rows: int, closed: bool) -> np.ndarray:
+    """Row parameters covering one period, without a duplicate seam row if closed."""
+    return np.linspace(0, 2 * np.pi, rows, endpoint=not closed)
+
+
+def _reference_normal(tangent: np.ndarray) -> np.ndarray:
+    """Unit vectors normal to ``tangent``, from the coordinate axis least aligned with it."""
+    axis = np.eye(3)[np.argmin(np.abs(tangent), axis=-1)]
+    normal = axis - np.sum(axis * tangent, -1, keepdims=True) * tangent
+    return normal / np.linalg.norm(normal, axis=-1, keepdims=True)
+
+
+def _frame_rows(rotor: LissajousRotor, t: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Centers, unit tangents and the reference frame (u, w = tangent × u) at ``t``."""
+    center = np.stack(rotor.evaluate_3d(t), axis=-1)
+    velocity, _ = rotor.evaluate_derivatives_3d(t)
+    tangent = velocity / np.maximum(np.linalg.norm(velocity, axis=-1, keepdims=True), 1e-300)
+    u = _reference_normal(tangent)
+    return center, tangent, u, np.cross(tangent, u)
+
+
+def _rotation_minimizing_angles(rotor: LissajousRotor, t: np.ndarray, closed: bool) -> np.ndarray:
+    """
+    Angle of a rotation-minimizing normal in the reference frame of each row.
+
+    The normal is carried from row to row by the double reflection method
+    (Wang et al., "Computation of Rotation Minimizing Frames", 2008). The
+    two reflections compose to a rotation that maps the normal plane of
+    row i onto that of row i + 1, so each step adds a fixed angle in the
+    reference frames, whatever the normal. Steps are evaluated in blocks
+    of FRAME_BLOCK rows and summed with the running angle carried from
+    block to block. On a closed curve the leftover rotation at the seam
+    (the frame's holonomy) is spread evenly over the rows.
+
+    Args:
+        rotor: Space curve
+        t: Row parameters
+        closed: Whether the last row connects back to the first
+
+    Returns:
+        Angles φ such that the normal of row i is cos φ_i u_i + sin φ_i w_i
+    """
+    rows = len(t)
+    steps = rows if closed else rows - 1
+    angles = np.zeros(rows + 1)
+    for start in range(0, steps, FRAME_BLOCK):
+        stop = min(start + FRAME_BLOCK, steps)
+        center, tangent, u, w = _frame_rows(rotor, t[np.arange(start, stop + 1) % rows])
+        x0, x1, t0, t1, u0 = center[:-1], center[1:], tangent[:-1], tangent[1:], u[:-1]
+
+        # Reflect in the plane bisecting the chord, then in the one taking
+        # the reflected tangent onto the next tangent
+        v1 = x1 - x0
+        c1 = np.sum(v1 * v1, -1, keepdims=True)
+        scale = np.where(c1 > 0, 2 / np.where(c1 > 0, c1, 1), 0)
+        u_reflected = u0 - scale * np.sum(v1 * u0, -1, keepdims=True) * v1
+        t_reflected = t0 - scale * np.sum(v1 * t0, -1, keepdims=True) * v1
+        v2 = t1 - t_reflected
+        c2 = np.sum(v2 * v2, -1, keepdims=True)
+        scale = np.where(c2 > 1e-30, 2 / np.where(c2 > 1e-30, c2, 1), 0)
+        image = u_reflected - scale * np.sum(v2 * u_reflected, -1, keepdims=True) * v2
+
+        step = np.arctan2(np.sum(image * w[1:], -1), np.sum(image * u[1:], -1))
+        angles[start + 1:stop + 1] = angles[start] + np.cumsum(step)
+
+    if closed:
+        seam = (angles[rows] + np.pi) % (2 * np.pi) - np.pi
+        angles[:rows] -= seam * np.arange(rows) / rows
+    return angles[:rows]
+
+
+def tube_mesh(rotor: LissajousRotor, radius: float = 0.05, rows: Optional[int] = None,
+              sides: int = 16, closed: Optional[bool] = None) -> GridMesh:
+    """
+    Sweep a circle along the rotor curve.
+
+    The cross-section is placed in a rotation-minimizing frame, which turns
+    only as much as the tangent does. Unlike the Frenet frame it does not
+    flip where the curvature vanishes, so planar rotors are not pinched at
+    their inflections. Triangles face outward wherever the radius is below
+    the local radius of curvature; beyond it the tube folds over.
+
+    The frame is propagated along the whole curve when the mesh is built,
+    which keeps one angle (8 bytes) per row in memory.
+
+    Args:
+        rotor: Space curve
+        radius: Tube radius
+        rows: Samples along the curve (default: ``rotor.num_points``)
+        sides: Vertices around the tube
+        closed: Join the tube ends (default: ``rotor.is_closed``)
+
+    Returns:
+        ``GridMesh`` with rows × sides vertices
+    """
+    rows = rotor.num_points if rows is None else rows
+    closed = rotor.is_closed if closed is None else closed
+    t = _curve_parameter(rows, closed)
+    frame_angles = _rotation_minimizing_angles(rotor, t, closed)
+    angle = 2 * np.pi * np.arange(sides) / sides
+    cos, sin = np.cos(angle), np.sin(angle)
+
+    def vertex_rows(indices: np.ndarray) -> np.ndarray:
+        center, tangent, u, w = _frame_rows(rotor, t[indices])
+        phi = frame_angles[indices, None]
+        normal = np.cos(phi) * u + np.sin(phi) * w
+        binormal = np.cross(tangent, normal)
+
+        offset = cos[None, :, None] * normal[:, None, :] + sin[None, :, None] * binormal[:, None, :]
+        return center[:, None, :] + radius * offset
+
+    return GridMesh(rows, sides, closed, vertex_rows)
+
+
+def revolution_mesh(rotor: LissajousRotor, segments: int = 64, rows: Optional[int] = None,
+                    axis: str = 'z', closed: Optional[bool] = None) -> GridMesh:
+    """
+    Revolve the rotor curve about a coordinate axis.
+
+    Args:
+        rotor: Space curve (for a planar profile use ``amplitude_z=0``)
+        segments: Angular steps of the revolution
+        rows: Samples along the curve (default: ``rotor.num_points``)
+        axis: Axis of revolution, 'x', 'y' or 'z'
+        closed: Join the first and last profile rows (default: ``rotor.is_closed``)
+
+    Returns:
+        ``GridMesh`` with rows × segments vertices
+    """
+    if axis not in AXES:
+        raise ValueError(f"axis must be one of {sorted(AXES)}")
+    rows = rotor.num_points if rows is None else rows
+    closed = rotor.is_closed if closed is None else closed
+    t = _curve_parameter(rows, closed)
+    k = AXES[axis]
+    u, v = (k + 1) % 3, (k + 2) % 3
+    angle = 2 * np.pi * np.arange(segments) / segments
+    cos, sin = np.cos(angle), np.sin(angle)
+
+    def vertex_rows(indices: np.ndarray) -> np.ndarray:
+        point = np.stack(rotor.evaluate_3d(t[indices]), axis=-1)
+        out = np.empty((len(indices), segments, 3))
+        out[:, :, k] = point[:, k, None]
+        out[:, :, u] = point[:, u, None] * cos - point[:, v, None] * sin
+        out[:, :, v] = point[:, u, None] * sin + point[:, v, None] * cos
+        return out
+
+    return GridMesh(rows, segments, closed, vertex_rows)
+
+
+def _preallocate(path: str, size: int, header: bytes) -> None:
+    """Create ``path`` with ``header`` followed by zeros up to ``size`` bytes."""
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.truncate(size)
+
+
+def write_ply(path: str, mesh: GridMesh, chunk_rows: int = 4096) -> Dict[str, int]:
+    """
+    Write a mesh as binary little-endian PLY.
+
+    Args:
+        path: Output file path
+        mesh: Mesh to write
+        chunk_rows: Grid rows generated per block
+
+    Returns:
+        Dictionary with 'vertices', 'faces' and 'bytes'
+    """
+    header = (
+        "ply\nformat binary_little_endian 1.0\ncomment Lissajous rotor mesh\n"
+        f"element vertex {mesh.num_vertices}\n"
+        "property float x\nproperty float y\nproperty float z\n"
+        f"element face {mesh.num_faces}\n"
+        "property list uchar int vertex_indices\nend_header\n"
+    ).encode('ascii')
+    if mesh.num_vertices > np.iinfo(np.int32).max:
+        raise ValueError("PLY int vertex indices cannot address this many vertices")
+    face_offset = len(header) + mesh.num_vertices * PLY_VERTEX_DTYPE.itemsize
+    size = face_offset + mesh.num_faces * PLY_FACE_DTYPE.itemsize
+    _preallocate(path + ".tmp", size, header)
+
+    vertices = np.memmap(path + ".tmp", dtype=PLY_VERTEX_DTYPE, mode='r+',
+                         offset=len(header), shape=(mesh.num_vertices,))
+    for start in range(0, mesh.rows, chunk_rows):
+        stop = min(start + chunk_rows, mesh.rows)
+        block = vertices[start * mesh.cols:stop * mesh.cols]
+        block.view('<f4').reshape(-1, 3)[:] = mesh.vertices(start, stop)
+    vertices.flush()
+    del vertices
+
+    faces = np.memmap(path + ".tmp", dtype=PLY_FACE_DTYPE, mode='r+',
+                      offset=face_offset, shape=(mesh.num_faces,))
+    per_row = 2 * mesh.cols
+    for start in range(0, mesh.face_rows, chunk_rows):
+        stop = min(start + chunk_rows, mesh.face_rows)
+        block = faces[start * per_row:stop * per_row]
+        block['count'] = 3
+        block['vertex_indices'] = mesh.faces(start, stop)
+    faces.flush()
+    del faces
+
+    os.replace(path + ".tmp", path)
+    return {'vertices': mesh.num_vertices, 'faces': mesh.num_faces, 'bytes': size}
+
+
+def read_ply(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Memory-map a PLY file written by ``write_ply``.
+
+    Args:
+        path: PLY file path
+
+    Returns:
+        Tuple of (vertices (n, 3) float32, faces (m, 3) int32), both read-only views
+    """
+    counts = {}
+    with open(path, 'rb') as f:
+        if f.readline() != b"ply\n" or f.readline() != b"format binary_little_endian 1.0\n":
+            raise ValueError("Not a binary little-endian PLY file")
+        while True:
+            line = f.readline()
+            if not line:
+                raise ValueError("Truncated PLY header")
+            if line == b"end_header\n":
+                break
+            if line.startswith(b"element "):
+                _, name, count = line.split()
+                counts[name.decode()] = int(count)
+        offset = f.tell()
+
+    n, m = counts.get('vertex', 0), counts.get('face', 0)
+    vertices = np.memmap(path, dtype=PLY_VERTEX_DTYPE, mode='r', offset=offset, shape=(n,))
+    faces = np.memmap(path, dtype=PLY_FACE_DTYPE, mode='r',
+                      offset=offset + n * PLY_VERTEX_DTYPE.itemsize, shape=(m,))
+    return vertices.view('<f4').reshape(n, 3), faces['vertex_indices']
+
+
+def write_stl(path: str, mesh: GridMesh, chunk_rows: int = 4096) -> Dict[str, int]:
+    """
+    Write a mesh as binary STL with per-triangle normals.
+
+    Args:
+        path: Output file path
+        mesh: Mesh to write
+        chunk_rows: Grid rows generated per block
+
+    Returns:
+        Dictionary with 'faces' and 'bytes'
+    """
+    header = b"Lissajous rotor mesh".ljust(80, b"\0") + np.uint32(mesh.num_faces).astype('<u4').tobytes()
+    size = len(header) + mesh.num_faces * STL_TRIANGLE_DTYPE.itemsize
+    _preallocate(path + ".tmp", size, header)
+
+    triangles = np.memmap(path + ".tmp", dtype=STL_TRIANGLE_DTYPE, mode='r+',
+                          offset=len(header), shape=(mesh.num_faces,))
+    per_row = 2 * mesh.cols
+    for start in range(0, mesh.face_rows, chunk_rows):
+        stop = min(start + chunk_rows, mesh.face_rows)
+        # Vertex rows start .. stop inclusive (wrapping), renumbered locally
+        local = mesh.vertex_rows(np.arange(start, stop + 1) % mesh.rows).reshape(-1, 3)
+        corners = local[_local_faces(mesh, start, stop)]
+        normal = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        length = np.linalg.norm(normal, axis=-1, keepdims=True)
+        normal = np.divide(normal, length, out=np.zeros_like(normal), where=length > 0)
+
+        block = triangles[start * per_row:stop * per_row]
+        block['normal'] = normal
+        block['vertices'] = corners
+    triangles.flush()
+    del triangles
+
+    os.replace(path + ".tmp", path)
+    return {'faces': mesh.num_faces, 'bytes': size}
+
+
+def _local_faces(mesh: GridMesh, start: int, stop: int) -> np.ndarray:
+    """Faces of cell rows [start, stop) indexed into vertex rows start .. stop."""
+    faces = mesh.faces(start, stop)
+    row = faces // mesh.cols
+    # The closing cell row refers to row 0, stored locally after row stop - 1
+    local_row = np.where(row < start, stop, row) - start
+    return local_row * mesh.cols + faces % mesh.cols
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Generate 3D Lissajous rotor meshes")
+    parser.add_argument("--a", type=float, default=3.0, help="x frequency")
+    parser.add_argument("--b", type=float, default=2.0, help="y frequency")
+    parser.add_argument("--c", type=float, default=5.0, help="z frequency")
+    parser.add_argument("--delta", type=float, default=np.pi / 2, help="x phase shift")
+    parser.add_argument("--delta-z", type=float, default=0.0, help="z phase shift")
+    parser.add_argument("--tube", type=float, default=None,
+                        help="Tube radius (default: revolve about --axis instead)")
+    parser.add_argument("--axis", choices=sorted(AXES), default='z', help="Axis of revolution")
+    parser.add_argument("--rows", type=int, default=4000, help="Samples along the curve")
+    parser.add_argument("--cols", type=int, default=32, help="Tube sides or revolution segments")
+    parser.add_argument("--output", default="rotor.ply", help="Output .ply or .stl path")
+    args = parser.parse_args()
+
+    rotor = LissajousRotor(frequency_x=args.a, frequency_y=args.b, frequency_z=args.c,
+                           phase_shift=args.delta, phase_z=args.delta_z)
+    if args.tube is not None:
+        mesh = tube_mesh(rotor, args.tube, args.rows, args.cols)
+    else:
+        mesh = revolution_mesh(rotor, args.cols, args.rows, args.axis)
+    writer = write_stl if args.output.lower().endswith(".stl") else write_ply
+    result = writer(args.output, mesh)
+    print(f"Wrote {result['faces']} triangles ({result['bytes'] / 1e6:.1f} MB) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Uniform Arc-Length Resampling for Lissajous Curves
+==================================================
+
+Resamples curves so that consecutive points are equally spaced along the
+curve rather than equally spaced in t, as needed for pen plotters and
+constant-speed animation.
+
+The cumulative arc-length table is built from the same chord lengths as
+``LissajousGeometry.calculate_arc_length`` and inverted with
+``np.searchsorted`` plus linear interpolation. Batched curves are handled
+in one searchsorted call, and ``stream_uniform_arc_length`` processes the
+curve in fixed-size chunks so memory stays bounded at millions of points.
+"""
+
+import numpy as np
+from typing import Iterator, Optional, Tuple
+
+from verify import LissajousGeometry
+
+
+def resample_uniform_arc_length(x: np.ndarray, y: np.ndarray,
+                                num_samples: int
+                                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resample one or many curves to points equally spaced in arc length.
+
+    Args:
+        x: x-coordinates, shape (n_points,) or (n_curves, n_points)
+        y: y-coordinates, same shape as x
+        num_samples: Number of output points per curve (including both ends)
+
+    Returns:
+        Tuple of (s, x, y) where s is the arc-length position of every
+        output point; all arrays have shape (..., num_samples)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same shape")
+    if x.shape[-1] < 2:
+        raise ValueError("At least 2 points are required")
+    if num_samples < 2:
+        raise ValueError("num_samples must be at least 2")
+
+    batch_shape = x.shape[:-1]
+    n_points = x.shape[-1]
+    x_rows = x.reshape(-1, n_points)
+    y_rows = y.reshape(-1, n_points)
+    cumulative = LissajousGeometry.calculate_cumulative_arc_length(x_rows, y_rows)
+    total = cumulative[:, -1]
+    n_rows = len(total)
+
+    # Normalize every row to [0, 1] and shift row r to [2r, 2r + 1] so a
+    # single searchsorted over the flattened table serves the whole batch
+    safe_total = np.where(total > 0, total, 1.0)
+    offsets = 2.0 * np.arange(n_rows)[:, None]
+    table = (cumulative / safe_total[:, None] + offsets).ravel()
+    fractions = np.linspace(0.0, 1.0, num_samples)
+    targets = fractions[None, :] + offsets
+
+    row_start = (np.arange(n_rows) * n_points)[:, None]
+    index = np.searchsorted(table, targets.ravel(), side='right').reshape(n_rows, num_samples) - 1
+    index = np.clip(index, row_start, row_start + n_points - 2)
+
+    lo = table[index]
+    span = table[index + 1] - lo
+    weight = np.where(span > 0, (targets - lo) / np.where(span > 0, span, 1.0), 0.0)
+    weight = np.clip(weight, 0.0, 1.0)
+
+    x_flat = x_rows.ravel()
+    y_flat = y_rows.ravel()
+    x_new = x_flat[index] + weight * (x_flat[index + 1] - x_flat[index])
+    y_new = y_flat[index] + weight * (y_flat[index + 1] - y_flat[index])
+    s = fractions[None, :] * total[:, None]
+
+    out_shape = batch_shape + (num_samples,)
+    return s.reshape(out_shape), x_new.reshape(out_shape), y_new.reshape(out_shape)
+
+
+def iter_curve_chunks(lissajous: LissajousGeometry, chunk_size: int = 65536
+                      ) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Generate the curve in consecutive chunks of the uniform t grid.
+
+    The chunks cover the same ``num_points`` samples of [0, 2π] as
+    ``lissajous.t`` without materializing the full array.
+
+    Args:
+        lissajous: Curve to generate
+        chunk_size: Maximum number of points per chunk
+
+    Yields:
+        Tuples of (t, x, y) numpy arrays
+    """
+    n = lissajous.num_points
+    step = 2 * np.pi / (n - 1) if n > 1 else 0.0
+    for start in range(0, n, chunk_size):
+        t = np.arange(start, min(start + chunk_size, n)) * step
+        if start + chunk_size >= n and n > 1:
+            t[-1] = 2 * np.pi
+        x, y = lissajous.evaluate(t)
+        yield t, x, y
+
+
+def stream_uniform_arc_length(lissajous: LissajousGeometry, num_samples: int,
+                              chunk_size: int = 65536,
+                              total_length: Optional[float] = None
+                              ) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Resample ``lissajous`` to equal arc-length spacing in bounded memory.
+
+    Runs in two linear passes over ``iter_curve_chunks``: the first sums
+    the chord lengths (skipped when ``total_length`` is given), the second
+    walks the cumulative table chunk by chunk and emits the output points
+    that fall inside each chunk. Memory use is O(chunk_size) regardless of
+    ``num_points`` and ``num_samples``, as long as ``num_samples`` is not
+    much larger than ``num_points``.
+
+    Args:
+        lissajous: Curve to resample; its ``num_points`` sets the input grid
+        num_samples: Number of output points (including both ends)
+        chunk_size: Number of input points processed at once
+        total_length: Polyline length of the curve, if already known
+
+    Yields:
+        Tuples of (s, x, y) numpy arrays; concatenated they equal the
+        in-memory ``resample_uniform_arc_length`` result
+    """
+    if num_samples < 2:
+        raise ValueError("num_samples must be at least 2")
+    if lissajous.num_points < 2:
+        raise ValueError("At least 2 points are required")
+
+    if total_length is None:
+        total_length = 0.0
+        last = None
+        for _, x, y in iter_curve_chunks(lissajous, chunk_size):
+            if last is not None:
+                x = np.concatenate([[last[0]], x])
+                y = np.concatenate([[last[1]], y])
+            total_length += float(np.sum(np.hypot(np.diff(x), np.diff(y))))
+            last = (x[-1], y[-1])
+
+    spacing = total_length / (num_samples - 1)
+    next_sample = 0
+    offset = 0.0
+    last = None
+    n_chunks = -(-lissajous.num_points // chunk_size)
+
+    for chunk, (_, x, y) in enumerate(iter_curve_chunks(lissajous, chunk_size)):
+        if last is not None:
+            x = np.concatenate([[last[0]], x])
+            y = np.concatenate([[last[1]], y])
+        last = (x[-1], y[-1])
+        if len(x) < 2:
+            continue
+
+        cumulative = offset + LissajousGeometry.calculate_cumulative_arc_length(x, y)
+        offset = cumulative[-1]
+
+        if chunk == n_chunks - 1:
+            stop = num_samples
+        else:
+            stop = min(int(np.floor(offset / spacing)) + 1 if spacing > 0 else num_samples,
+                       num_samples)
+        if stop <= next_sample:
+            continue
+
+        k = np.arange(next_sample, stop)
+        s = k / (num_samples - 1) * total_length
+        index = np.clip(np.searchsorted(cumulative, s, side='right') - 1, 0, len(x) - 2)
+        span = cumulative[index + 1] - cumulative[index]
+        weight = np.where(span > 0, (s - cumulative[index]) / np.where(span > 0, span, 1.0), 0.0)
+        weight = np.clip(weight, 0.0, 1.0)
+        yield (s,
+               x[index] + weight * (x[index + 1] - x[index]),
+               y[index] + weight * (y[index + 1] - y[index]))
+        next_sample = stop
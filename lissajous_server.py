@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Asyncio HTTP Service for Lissajous Curves, Glyphs and Metrics
+=============================================================
+
+A standard-library-only backend for the website-store front-end
+(``index.html`` / ``app.js``), replacing pre-generated CSVs:
+
+    GET /curve?A=1&B=1&a=3&b=2&delta=1.5708&n=1000[&format=npy]
+    GET /metrics?A=1&B=1&a=3&b=2&delta=1.5708&n=1000
+    GET /glyph?text=HELLO&n=1000&cycles=1[&format=npy]
+    GET /health
+
+Numeric parameters are range-checked (see ``BOUNDS``; frequencies up to
+``MAX_FREQUENCY``), and request bodies over ``MAX_BODY`` bytes are refused.
+Curves and glyphs are returned as compact JSON ({"x": [...], "y": [...]},
+rounded to ``precision`` decimals) or as a binary ``.npy`` (n, 2) float64
+array with ``format=npy``.
+
+The event loop only parses requests and writes responses. Generation and
+encoding run in a process pool, and encoded responses are kept in an LRU
+cache keyed by the normalized query (parsed, defaulted and sorted
+parameters, so ``a=3`` and ``a=3.0&b=2`` hit the same entry). Concurrent
+misses for the same key share one computation, and a pool broken by a
+dead worker is replaced once per failure. Connections are kept
+alive, so cached shapes are served at thousands of requests per second
+by a single process; see ``lissajous_loadgen.py`` to measure it.
+
+Usage:
+    python lissajous_server.py --port 8080 --workers 4 --cache-size 4096
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from resonant_alphabet import F0, SEMITONE_RANGE, glyph_curve
+from verify import LissajousGeometry
+
+MAX_POINTS = 1_000_000
+MAX_TEXT_LENGTH = 256
+MAX_REQUEST_LINE = 8192
+MAX_HEADERS = 100
+MAX_BODY = 65536
+MAX_FREQUENCY = 1000.0
+MAX_AMPLITUDE = 1e6
+
+# Query parameters per endpoint: name -> (type, default)
+CURVE_PARAMETERS = {
+    'A': (float, 1.0), 'B': (float, 1.0), 'a': (float, 3.0), 'b': (float, 2.0),
+    'delta': (float, np.pi / 2), 'n': (int, 1000),
+    'format': (str, 'json'), 'precision': (int, 6),
+}
+METRICS_PARAMETERS = {name: CURVE_PARAMETERS[name] for name in ('A', 'B', 'a', 'b', 'delta', 'n')}
+GLYPH_PARAMETERS = {
+    'text': (str, ''), 'n': (int, 1000), 'cycles': (float, 1.0),
+    'f0': (float, F0), 'R': (float, SEMITONE_RANGE),
+    'format': (str, 'json'), 'precision': (int, 6),
+}
+
+# Inclusive value ranges of numeric parameters; frequencies are bounded so
+# the sampled and integrated curves stay within a worker's memory
+BOUNDS = {
+    'A': (-MAX_AMPLITUDE, MAX_AMPLITUDE), 'B': (-MAX_AMPLITUDE, MAX_AMPLITUDE),
+    'a': (-MAX_FREQUENCY, MAX_FREQUENCY), 'b': (-MAX_FREQUENCY, MAX_FREQUENCY),
+    'delta': (-1e6, 1e6), 'cycles': (0.0, 1000.0), 'f0': (0.0, 20000.0),
+    'R': (-120.0, 120.0), 'precision': (0, 17), 'n': (2, MAX_POINTS),
+}
+# Parameters that must also be strictly positive
+POSITIVE = ('cycles', 'f0')
+
+Response = Tuple[int, str, bytes]
+
+
+class RequestError(ValueError):
+    """Invalid request; rendered as an error response (400 by default)."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def _parse_query(query: str, spec: Dict[str, Tuple[type, object]]) -> Tuple[Tuple[str, object], ...]:
+    """Parse, type and default query parameters into a hashable cache key."""
+    given = dict(parse_qsl(query, keep_blank_values=True))
+    unknown = set(given) - set(spec)
+    if unknown:
+        raise RequestError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+
+    params = {}
+    for name, (kind, default) in spec.items():
+        if name not in given:
+            params[name] = default
+            continue
+        try:
+            value = kind(given[name])
+        except ValueError:
+            raise RequestError(f"Parameter {name!r} must be {kind.__name__}")
+        if kind is float and not np.isfinite(value):
+            raise RequestError(f"Parameter {name!r} must be finite")
+        if name in BOUNDS and not BOUNDS[name][0] <= value <= BOUNDS[name][1]:
+            raise RequestError(f"{name} must be between {BOUNDS[name][0]:g} and {BOUNDS[name][1]:g}")
+        if name in POSITIVE and not value > 0:
+            raise RequestError(f"{name} must be positive")
+        params[name] = value
+
+    if params.get('format', 'json') not in ('json', 'npy'):
+        raise RequestError("format must be 'json' or 'npy'")
+    if len(params.get('text', '')) > MAX_TEXT_LENGTH:
+        raise RequestError(f"text is limited to {MAX_TEXT_LENGTH} characters")
+    if params.get('format') == 'npy':
+        # Binary output is not rounded; keep one cache entry per shape
+        params['precision'] = spec['precision'][1]
+    return tuple(sorted(params.items()))
+
+
+def _encode_points(x: np.ndarray, y: np.ndarray, output_format: str, precision: int) -> Response:
+    if output_format == 'npy':
+        buffer = io.BytesIO()
+        np.save(buffer, np.column_stack([x, y]))
+        return 200, 'application/octet-stream', buffer.getvalue()
+    body = json.dumps({'x': np.round(x, precision).tolist(), 'y': np.round(y, precision).tolist()},
+                      separators=(',', ':'))
+    return 200, 'application/json', body.encode()
+
+
+def _json(payload: Dict, status: int = 200) -> Response:
+    return status, 'application/json', json.dumps(payload, separators=(',', ':')).encode()
+
+
+# Endpoint handlers run in worker processes, so they are module-level
+# functions of the normalized parameters
+
+def compute_curve(params: Dict) -> Response:
+    """Generate a curve and encode it."""
+    lissajous = LissajousGeometry(params['A'], params['B'], params['a'], params['b'],
+                                  params['delta'], params['n'])
+    x, y = lissajous.generate_curve()
+    return _encode_points(x, y, params['format'], params['precision'])
+
+
+def compute_metrics(params: Dict) -> Response:
+    """Compute curve metrics."""
+    lissajous = LissajousGeometry(params['A'], params['B'], params['a'], params['b'],
+                                  params['delta'], params['n'])
+    x, y = lissajous.generate_curve()
+    bbox = lissajous.calculate_bounding_box(x, y)
+    group = lissajous.calculate_symmetry_group(x, y)
+    return _json({
+        'arc_length': lissajous.calculate_arc_length(x, y),
+        'analytic_arc_length': lissajous.calculate_analytic_arc_length(),
+        **bbox,
+        'symmetry_score': lissajous.calculate_symmetry_score(x, y),
+        'symmetry_group': group['group'],
+        'rotation_order': None if np.isinf(group['rotation_order']) else group['rotation_order'],
+        'reflection_axes': group['reflection_axes'],
+    })
+
+
+def compute_glyph(params: Dict) -> Response:
+    """Render the Resonant Alphabet glyph of a text and encode it."""
+    _, x, y = glyph_curve(params['text'], params['n'], params['cycles'],
+                          params['f0'], params['R'])
+    return _encode_points(x, y, params['format'], params['precision'])
+
+
+ENDPOINTS: Dict[str, Tuple[Dict, Callable[[Dict], Response]]] = {
+    '/curve': (CURVE_PARAMETERS, compute_curve),
+    '/metrics': (METRICS_PARAMETERS, compute_metrics),
+    '/glyph': (GLYPH_PARAMETERS, compute_glyph),
+}
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 431: 'Request Header Fields Too Large',
+           500: 'Internal Server Error'}
+
+
+class ResponseCache:
+    """
+    LRU cache of encoded responses bounded by entry count and total bytes.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Response]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple) -> Optional[Response]:
+        """Return the cached response for ``key`` and mark it recently used."""
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key: Tuple, response: Response) -> None:
+        """Store a response, evicting least recently used entries as needed."""
+        size = len(response[2])
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        if key in self._entries:
+            self.bytes -= len(self._entries.pop(key)[2])
+        self._entries[key] = response
+        self.bytes += size
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= len(evicted[2])
+
+
+class LissajousService:
+    """
+    Asyncio HTTP/1.1 server with a process pool and a response cache.
+    """
+
+    def __init__(self, workers: Optional[int] = None, cache_size: int = 4096,
+                 cache_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            workers: Worker processes for generation (default: all cores;
+                0 computes in the event loop's default thread pool)
+            cache_size: Maximum number of cached responses
+            cache_bytes: Maximum total size of cached responses
+        """
+        self.workers = os.cpu_count() if workers is None else workers
+        self.cache = ResponseCache(cache_size, cache_bytes)
+        self.requests = 0
+        self._executor: Optional[Executor] = None
+        self._pending: Dict[Tuple, asyncio.Future] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """
+        Start listening.
+
+        Args:
+            host: Interface to bind
+            port: TCP port (0 picks a free port)
+
+        Returns:
+            The asyncio server; ``self.port`` holds the bound port
+        """
+        if self.workers:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._server = await asyncio.start_server(self._handle_connection, host, port,
+                                                  limit=MAX_REQUEST_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    async def close(self) -> None:
+        """Stop listening and shut the worker pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict:
+        """Request and cache counters."""
+        return {'requests': self.requests, 'cache_entries': len(self.cache),
+                'cache_bytes': self.cache.bytes, 'cache_hits': self.cache.hits,
+                'cache_misses': self.cache.misses, 'in_flight': len(self._pending)}
+
+    async def handle(self, method: str, target: str) -> Tuple[Response, str]:
+        """
+        Produce the response for one request.
+
+        Args:
+            method: HTTP method
+            target: Request target (path and query)
+
+        Returns:
+            Tuple of ((status, content type, body), cache status)
+        """
+        self.requests += 1
+        url = urlsplit(target)
+        if url.path == '/health':
+            return _json({'status': 'ok', **self.stats()}), 'BYPASS'
+        if url.path not in ENDPOINTS:
+            return _json({'error': f"Unknown endpoint {url.path}"}, 404), 'BYPASS'
+        if method != 'GET':
+            return _json({'error': "Only GET is supported"}, 405), 'BYPASS'
+
+        spec, compute = ENDPOINTS[url.path]
+        try:
+            key = (url.path,) + _parse_query(url.query, spec)
+        except RequestError as e:
+            return _json({'error': str(e)}, 400), 'BYPASS'
+
+        response = self.cache.get(key)
+        if response is not None:
+            return response, 'HIT'
+
+        # Identical concurrent misses wait for the same computation; the
+        # shield keeps it running if the first client disconnects
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._compute(compute, dict(key[1:])))
+            self._pending[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        try:
+            return await asyncio.shield(future), 'MISS'
+        except Exception as e:
+            return _json({'error': f"{type(e).__name__}: {e}"}, 500), 'MISS'
+
+    async def _compute(self, compute: Callable[[Dict], Response], params: Dict) -> Response:
+        """Run ``compute`` in the pool, replacing the pool once if a worker died."""
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        try:
+            return await loop.run_in_executor(executor, compute, params)
+        except BrokenProcessPool:
+            # A worker was killed (e.g. by the OOM killer) and the pool
+            # refuses all further work; the first failing request replaces it
+            if self._executor is executor:
+                executor.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return await loop.run_in_executor(self._executor, compute, params)
+
+    def _finish(self, key: Tuple, future: asyncio.Future) -> None:
+        del self._pending[key]
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> Optional[Tuple[list, Dict[str, str]]]:
+        """
+        Read a request line and its headers.
+
+        Lines longer than MAX_REQUEST_LINE and more than MAX_HEADERS headers
+        raise RequestError (400 for the request line, 431 for headers), as
+        do a Transfer-Encoding (400) and a body over MAX_BODY bytes (413).
+        Smaller bodies are read and discarded.
+
+        Returns:
+            Tuple of (request line fields, lower-cased headers), or None at EOF
+        """
+        try:
+            request_line = await reader.readline()
+        except ValueError:
+            # readline reports a LimitOverrunError as ValueError
+            raise RequestError("Request line too long")
+        if not request_line:
+            return None
+        headers = {}
+        for count in range(MAX_HEADERS + 1):
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise RequestError("Header line too long", 431)
+            if line in (b'\r\n', b'\n', b''):
+                break
+            if count == MAX_HEADERS:
+                raise RequestError(f"More than {MAX_HEADERS} headers", 431)
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = headers.get('content-length', '0')
+        if 'transfer-encoding' in headers or not length.isdigit():
+            raise RequestError("Only bodies with a Content-Length are supported")
+        if int(length) > MAX_BODY:
+            raise RequestError(f"Request bodies are limited to {MAX_BODY} bytes", 413)
+        if int(length) > 0:
+            # Bodies are not used by any endpoint; skip them
+            await reader.readexactly(int(length))
+        return request_line.decode('latin-1').split(), headers
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await self._read_head(reader)
+                except RequestError as e:
+                    # The rest of the stream cannot be framed; reply and close
+                    response, cache_status = _json({'error': str(e)}, e.status), 'BYPASS'
+                    keep_alive = False
+                else:
+                    if request is None:
+                        break
+                    parts, headers = request
+                    if len(parts) != 3:
+                        response, cache_status = _json({'error': "Malformed request line"}, 400), 'BYPASS'
+                        keep_alive = False
+                    else:
+                        method, target, version = parts
+                        response, cache_status = await self.handle(method, target)
+                        connection = headers.get('connection', '').lower()
+                        keep_alive = (connection == 'keep-alive' if version == 'HTTP/1.0'
+                                      else connection != 'close')
+
+                status, content_type, body = response
+                head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                        f"Content-Type: {content_type}\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Access-Control-Allow-Origin: *\r\n"
+                        f"X-Cache: {cache_status}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+                writer.write(head.encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str, port: int, workers: Optional[int], cache_size: int) -> None:
+    """Run the service until cancelled."""
+    service = LissajousService(workers=workers, cache_size=cache_size)
+    server = await service.start(host, port)
+    print(f"Serving Lissajous API on http://{host}:{service.port} "
+          f"({service.workers} workers, cache {cache_size})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Serve Lissajous curves, glyphs and metrics")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8080, help="TCP port")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--cache-size", type=int, default=4096, help="Cached responses")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
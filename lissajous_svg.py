@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Streaming SVG Export for Lissajous Curves
+=========================================
+
+Writes ``LissajousGeometry`` output as SVG ``<path>`` elements for the
+website-store front-end.
+
+Coordinates are snapped to a fixed-precision integer grid (10^precision
+units per curve unit) and the ``viewBox`` carries the scale, so the path
+data is made of small relative integers ("l dx dy ...") that are formatted
+in vectorized batches instead of point by point. Runs of nearly collinear
+points are removed with Ramer–Douglas–Peucker (``lissajous_lod``) before
+formatting, and the ``d`` attribute is streamed to the file object in
+chunks, so the full path string is never built. The snapped point array
+is still held in memory, because RDP needs the whole curve; memory is
+therefore proportional to the number of input points.
+"""
+
+import numpy as np
+from typing import IO, Iterator, Optional, Sequence, Tuple
+
+from lissajous_lod import rdp_simplify
+from verify import DATASET_CONFIGURATIONS, LissajousGeometry
+
+
+def _snap(x: np.ndarray, y: np.ndarray, precision: int,
+          tolerance: Optional[float]) -> np.ndarray:
+    """
+    Snap a curve to the integer grid and simplify it.
+
+    Returns an (n, 2) int64 array of grid points with y flipped (SVG y
+    points down) and zero-length steps removed. Snapping first collapses
+    dense sampling to at most one point per grid cell, so RDP then runs on
+    far fewer points.
+    """
+    scale = 10 ** precision
+    points = np.empty((len(x), 2), dtype=np.int64)
+    np.rint(x * scale, out=points[:, 0], casting='unsafe')
+    np.rint(y * -scale, out=points[:, 1], casting='unsafe')
+    moved = np.ones(len(points), dtype=bool)
+    moved[1:] = np.any(points[1:] != points[:-1], axis=1)
+    points = points[moved]
+
+    if tolerance is None:
+        # Half a grid unit: below the precision that is written anyway
+        tolerance = 0.5 / scale
+    if tolerance > 0 and len(points) > 2:
+        kept = rdp_simplify(points[:, 0].astype(float), points[:, 1].astype(float),
+                            tolerance * scale)
+        points = points[kept]
+    return points
+
+
+def svg_path_data(x: np.ndarray, y: np.ndarray, precision: int = 3,
+                  tolerance: Optional[float] = None,
+                  chunk_size: int = 65536) -> Iterator[str]:
+    """
+    Generate the ``d`` attribute of an SVG path in chunks.
+
+    Coordinates are in grid units of 10^-precision curve units, matching
+    the ``viewBox`` written by ``write_svg_path``'s callers.
+
+    Args:
+        x: x-coordinates
+        y: y-coordinates
+        precision: Decimal digits kept per coordinate
+        tolerance: Simplification tolerance in curve units (default: half
+            a grid unit; 0 disables simplification)
+        chunk_size: Number of segments formatted per chunk
+
+    Yields:
+        Consecutive pieces of the path data string
+    """
+    points = _snap(np.asarray(x, dtype=float), np.asarray(y, dtype=float),
+                   precision, tolerance)
+    if len(points) == 0:
+        return
+
+    yield f"M{points[0, 0]} {points[0, 1]}"
+    steps = np.diff(points, axis=0)
+    for start in range(0, len(steps), chunk_size):
+        chunk = steps[start:start + chunk_size].ravel().tolist()
+        yield ("l" if start == 0 else " ") + " ".join(map(str, chunk))
+
+
+def _view_box(x: np.ndarray, y: np.ndarray, precision: int,
+              margin: float) -> Tuple[int, int, int, int]:
+    """viewBox (min_x, min_y, width, height) in grid units with a margin."""
+    scale = 10 ** precision
+    x_min, x_max = float(np.min(x)), float(np.max(x))
+    y_min, y_max = float(np.min(y)), float(np.max(y))
+    pad = margin * max(x_max - x_min, y_max - y_min, 1e-12)
+    left = int(np.floor((x_min - pad) * scale))
+    top = int(np.floor((-y_max - pad) * scale))
+    right = int(np.ceil((x_max + pad) * scale))
+    bottom = int(np.ceil((-y_min + pad) * scale))
+    return left, top, right - left, bottom - top
+
+
+def write_svg_path(f: IO[str], x: np.ndarray, y: np.ndarray,
+                   precision: int = 3, tolerance: Optional[float] = None,
+                   stroke: str = "black", chunk_size: int = 65536) -> None:
+    """
+    Stream one ``<path>`` element to a text file object.
+
+    Args:
+        f: Writable text file object
+        x: x-coordinates
+        y: y-coordinates
+        precision: Decimal digits kept per coordinate
+        tolerance: Simplification tolerance in curve units
+        stroke: Stroke color
+        chunk_size: Number of segments formatted per write
+    """
+    f.write('<path fill="none" stroke="')
+    f.write(stroke)
+    f.write('" stroke-width="1" vector-effect="non-scaling-stroke" d="')
+    for piece in svg_path_data(x, y, precision, tolerance, chunk_size):
+        f.write(piece)
+    f.write('"/>\n')
+
+
+def export_svg(f: IO[str], lissajous: LissajousGeometry,
+               x: Optional[np.ndarray] = None, y: Optional[np.ndarray] = None,
+               size: int = 400, precision: int = 3,
+               tolerance: Optional[float] = None, margin: float = 0.05) -> None:
+    """
+    Write a standalone SVG document for one curve.
+
+    Args:
+        f: Writable text file object
+        lissajous: Curve to export
+        x: x-coordinates (generated from ``lissajous`` when omitted)
+        y: y-coordinates (generated from ``lissajous`` when omitted)
+        size: Rendered width and height in pixels
+        precision: Decimal digits kept per coordinate
+        tolerance: Simplification tolerance in curve units
+        margin: Padding around the curve as a fraction of its extent
+    """
+    if x is None or y is None:
+        x, y = lissajous.generate_curve()
+    view_box = " ".join(map(str, _view_box(x, y, precision, margin)))
+    f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+            f'viewBox="{view_box}">\n')
+    write_svg_path(f, x, y, precision, tolerance)
+    f.write('</svg>\n')
+
+
+def export_svg_sprite_sheet(f: IO[str],
+                            configurations: Sequence[Tuple] = DATASET_CONFIGURATIONS,
+                            columns: int = 4, cell_size: int = 200,
+                            num_points: int = 1000, precision: int = 3,
+                            tolerance: Optional[float] = None,
+                            margin: float = 0.05) -> None:
+    """
+    Write many curves into one SVG sprite sheet.
+
+    Every curve becomes a ``<symbol id="lissajous_<name>">`` that the
+    front-end can reference with ``<use href="#lissajous_<name>"/>``; the
+    sheet also lays all symbols out on a grid so it renders on its own.
+
+    Args:
+        f: Writable text file object
+        configurations: (amp_x, amp_y, freq_x, freq_y, phase, name) tuples,
+            as in ``DATASET_CONFIGURATIONS``
+        columns: Number of grid columns
+        cell_size: Width and height of each grid cell in pixels
+        num_points: Points generated per curve before simplification
+        precision: Decimal digits kept per coordinate
+        tolerance: Simplification tolerance in curve units
+        margin: Padding around each curve as a fraction of its extent
+    """
+    rows = -(-len(configurations) // columns)
+    f.write(f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{columns * cell_size}" height="{rows * cell_size}">\n')
+
+    names = []
+    for amp_x, amp_y, freq_x, freq_y, phase, name in configurations:
+        lissajous = LissajousGeometry(amp_x, amp_y, freq_x, freq_y, phase, num_points)
+        x, y = lissajous.generate_curve()
+        view_box = " ".join(map(str, _view_box(x, y, precision, margin)))
+        f.write(f'<symbol id="lissajous_{name}" viewBox="{view_box}">\n')
+        write_svg_path(f, x, y, precision, tolerance)
+        f.write('</symbol>\n')
+        names.append(name)
+
+    for i, name in enumerate(names):
+        row, column = divmod(i, columns)
+        f.write(f'<use href="#lissajous_{name}" xlink:href="#lissajous_{name}" '
+                f'x="{column * cell_size}" y="{row * cell_size}" '
+                f'width="{cell_size}" height="{cell_size}"/>\n')
+    f.write('</svg>\n')
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Out-of-Core Sharded Parameter Sweeps
+====================================
+
+Evaluates curve metrics over Cartesian parameter grids far too large for
+``generate_csv_datasets`` or a single in-memory batch (10^7+ configurations).
+
+The flattened grid is cut into fixed-size shards. Each shard is computed in
+a worker process, written to its own memory-mapped ``.npy`` result file and
+then marked complete with a ``.done`` file, so an interrupted run resumes
+without redoing finished shards. Several machines can share the work through
+a shared directory: machine ``host_index`` of ``num_hosts`` only takes shards
+with ``shard % num_hosts == host_index``. ``merge_shards`` concatenates the
+finished shards into one table.
+
+Usage:
+    # Python: plan once, then run (on every machine) and merge
+    plan_sweep("sweep", {'amplitude_x': [1.0], 'amplitude_y': [1.0],
+                         'frequency_x': range(1, 101), 'frequency_y': range(1, 101),
+                         'phase_shift': np.linspace(0, np.pi, 1000)})
+    run_sweep("sweep")
+    table = merge_shards("sweep")
+
+    # Command line, for an existing plan
+    python lissajous_sweep.py run sweep --workers 8 --host-index 0 --num-hosts 2
+    python lissajous_sweep.py merge sweep
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+from lissajous_backends import get_backend
+
+SWEEP_VERSION = 1
+
+PARAMETERS = ('amplitude_x', 'amplitude_y', 'frequency_x', 'frequency_y', 'phase_shift')
+METRICS = ('arc_length', 'x_min', 'x_max', 'y_min', 'y_max', 'symmetry_score', 'closure')
+RESULT_DTYPE = np.dtype([('config_index', '<i8')] +
+                        [(name, '<f8') for name in PARAMETERS + METRICS])
+
+
+def _manifest_path(directory: str) -> str:
+    return os.path.join(directory, "sweep.json")
+
+
+def _shard_path(directory: str, shard: int) -> str:
+    return os.path.join(directory, "shards", f"shard_{shard:06d}.npy")
+
+
+def _marker_path(directory: str, shard: int) -> str:
+    return os.path.join(directory, "shards", f"shard_{shard:06d}.done")
+
+
+def plan_sweep(directory: str, grid: Dict[str, Sequence[float]],
+               shard_size: int = 100_000, num_points: int = 256) -> Dict:
+    """
+    Write the sweep manifest, or check it against an existing one.
+
+    Args:
+        directory: Sweep directory (shared between machines)
+        grid: Values per parameter; every name in ``PARAMETERS`` is required
+        shard_size: Configurations per shard
+        num_points: Samples per curve for the metrics
+
+    Returns:
+        The manifest dictionary
+    """
+    missing = [name for name in PARAMETERS if name not in grid]
+    if missing:
+        raise ValueError(f"Missing sweep parameters: {missing}")
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive")
+
+    shape = [len(grid[name]) for name in PARAMETERS]
+    total = int(np.prod(shape, dtype=np.int64))
+    manifest = {
+        'version': SWEEP_VERSION,
+        'grid': {name: [float(v) for v in grid[name]] for name in PARAMETERS},
+        'shape': shape,
+        'total': total,
+        'shard_size': shard_size,
+        'num_shards': -(-total // shard_size),
+        'num_points': num_points,
+    }
+
+    os.makedirs(os.path.join(directory, "shards"), exist_ok=True)
+    path = _manifest_path(directory)
+    if os.path.exists(path):
+        existing = load_manifest(directory)
+        if existing != manifest:
+            raise ValueError(f"{path} describes a different sweep; use a new directory")
+        return existing
+
+    with open(path + ".tmp", 'w') as f:
+        json.dump(manifest, f)
+    os.replace(path + ".tmp", path)
+    return manifest
+
+
+def load_manifest(directory: str) -> Dict:
+    """
+    Read the manifest written by ``plan_sweep``.
+
+    Args:
+        directory: Sweep directory
+
+    Returns:
+        The manifest dictionary
+    """
+    with open(_manifest_path(directory)) as f:
+        manifest = json.load(f)
+    if manifest['version'] != SWEEP_VERSION:
+        raise ValueError(f"Unsupported sweep version {manifest['version']}")
+    return manifest
+
+
+def is_shard_done(directory: str, shard: int) -> bool:
+    """Whether ``shard`` has a completion marker."""
+    return os.path.exists(_marker_path(directory, shard))
+
+
+def pending_shards(directory: str, host_index: int = 0, num_hosts: int = 1) -> List[int]:
+    """
+    List this host's shards that have no completion marker yet.
+
+    Args:
+        directory: Sweep directory
+        host_index: Index of this machine, 0 ≤ host_index < num_hosts
+        num_hosts: Number of machines sharing the directory
+
+    Returns:
+        Shard numbers still to compute
+    """
+    manifest = load_manifest(directory)
+    return [shard for shard in range(host_index, manifest['num_shards'], num_hosts)
+            if not is_shard_done(directory, shard)]
+
+
+def process_shard(directory: str, shard: int, batch_size: int = 4096,
+                  backend: Optional[str] = None) -> int:
+    """
+    Compute one shard and mark it complete.
+
+    Rows are written batch by batch into a memory-mapped result file, which
+    is flushed before the ``.done`` marker is created; a shard without a
+    marker is simply recomputed on the next run.
+
+    Args:
+        directory: Sweep directory
+        shard: Shard number
+        batch_size: Configurations evaluated at once
+        backend: Kernel backend name (default: ``get_backend()``)
+
+    Returns:
+        The shard number
+    """
+    manifest = load_manifest(directory)
+    start = shard * manifest['shard_size']
+    stop = min(start + manifest['shard_size'], manifest['total'])
+    values = [np.asarray(manifest['grid'][name]) for name in PARAMETERS]
+
+    kernels = get_backend(backend)
+
+    path = _shard_path(directory, shard)
+    rows = np.lib.format.open_memmap(path + ".tmp", mode='w+', dtype=RESULT_DTYPE,
+                                     shape=(stop - start,))
+    for batch_start in range(start, stop, batch_size):
+        index = np.arange(batch_start, min(batch_start + batch_size, stop))
+        coordinates = np.unravel_index(index, manifest['shape'])
+        params = {name: values[i][coordinates[i]] for i, name in enumerate(PARAMETERS)}
+        metrics = kernels.batch_metrics(*(params[name] for name in PARAMETERS),
+                                        num_points=manifest['num_points'])
+
+        out = rows[batch_start - start:batch_start - start + len(index)]
+        out['config_index'] = index
+        for name in PARAMETERS:
+            out[name] = params[name]
+        for name in METRICS:
+            out[name] = metrics[name]
+    rows.flush()
+    del rows
+    os.replace(path + ".tmp", path)
+
+    marker = _marker_path(directory, shard)
+    with open(marker + ".tmp", 'w') as f:
+        f.write(f"{stop - start}\n")
+    os.replace(marker + ".tmp", marker)
+    return shard
+
+
+def run_sweep(directory: str, workers: Optional[int] = None,
+              host_index: int = 0, num_hosts: int = 1,
+              backend: Optional[str] = None) -> List[int]:
+    """
+    Compute all pending shards of this host, one worker process per core.
+
+    Args:
+        directory: Sweep directory with a manifest from ``plan_sweep``
+        workers: Worker processes (default: all local cores; 1 runs inline)
+        host_index: Index of this machine, 0 ≤ host_index < num_hosts
+        num_hosts: Number of machines sharing the directory
+        backend: Kernel backend name (default: ``get_backend()`` in each worker)
+
+    Returns:
+        Shards computed by this call
+    """
+    if not 0 <= host_index < num_hosts:
+        raise ValueError("host_index must be in [0, num_hosts)")
+    shards = pending_shards(directory, host_index, num_hosts)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(shards) <= 1:
+        return [process_shard(directory, shard, backend=backend) for shard in shards]
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+        return list(executor.map(partial(process_shard, directory, backend=backend), shards))
+
+
+def merge_shards(directory: str, output_path: Optional[str] = None) -> np.ndarray:
+    """
+    Concatenate all finished shards into one table.
+
+    Args:
+        directory: Sweep directory
+        output_path: Merged ``.npy`` file (default: <directory>/results.npy)
+
+    Returns:
+        The merged table, memory-mapped read-only, ordered by config_index
+    """
+    manifest = load_manifest(directory)
+    missing = [shard for shard in range(manifest['num_shards'])
+               if not is_shard_done(directory, shard)]
+    if missing:
+        raise RuntimeError(f"{len(missing)} shards are not finished, e.g. {missing[:5]}")
+
+    output_path = output_path or os.path.join(directory, "results.npy")
+    merged = np.lib.format.open_memmap(output_path + ".tmp", mode='w+', dtype=RESULT_DTYPE,
+                                       shape=(manifest['total'],))
+    for shard in range(manifest['num_shards']):
+        rows = np.load(_shard_path(directory, shard), mmap_mode='r')
+        start = shard * manifest['shard_size']
+        merged[start:start + len(rows)] = rows
+        del rows
+    merged.flush()
+    del merged
+    os.replace(output_path + ".tmp", output_path)
+    return np.load(output_path, mmap_mode='r')
+
+
+def main():
+    """Command-line entry point for running and merging planned sweeps."""
+    parser = argparse.ArgumentParser(description="Run or merge a sharded Lissajous sweep")
+    parser.add_argument("command", choices=["run", "merge", "status"])
+    parser.add_argument("directory", help="Sweep directory containing sweep.json")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--host-index", type=int, default=0, help="Index of this machine")
+    parser.add_argument("--num-hosts", type=int, default=1, help="Machines sharing the directory")
+    parser.add_argument("--output", default=None, help="Merged output path")
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.directory)
+    if args.command == "run":
+        done = run_sweep(args.directory, args.workers, args.host_index, args.num_hosts)
+        print(f"Computed {len(done)} shards")
+    elif args.command == "merge":
+        table = merge_shards(args.directory, args.output)
+        print(f"Merged {len(table)} rows")
+    remaining = len(pending_shards(args.directory))
+    print(f"{manifest['num_shards'] - remaining}/{manifest['num_shards']} shards complete")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+FFT-Based Symmetry Detection for Closed Curves
+==============================================
+
+Detects the rotational and reflective symmetries of closed curves such as
+rational-ratio Lissajous figures, independent of where sampling starts.
+
+A closed curve sampled uniformly over one period is treated as a periodic
+complex signal z(t) = (x - x̄) + i (y - ȳ). A symmetry of the traced figure
+maps the parameterization onto itself up to a shift or a reversal of t:
+
+    z(t + s) = λ z(t)         rotation by arg λ
+    z(s - t) = λ z(t)         rotation by arg λ (orientation reversed)
+    z(t + s) = λ conj(z(t))   reflection about the axis at arg λ / 2
+    z(s - t) = λ conj(z(t))   reflection about the axis at arg λ / 2
+
+with |λ| = 1. For each of the four families the normalized circular
+correlation Σ conj(u) v / Σ|z|² over every shift s is one FFT product; by
+Cauchy–Schwarz its magnitude is 1 exactly when the relation holds, and its
+phase is λ. All shifts are scored in O(n log n) instead of the O(n²) of
+a brute-force shift search, and batches of curves are transformed at once.
+
+The correlations are trigonometric polynomials in s, so they are evaluated
+on an ``upsample``-times finer grid by zero-padding the spectrum and each
+peak is refined by parabolic interpolation; symmetries whose shift or
+reversal centre falls between samples are found as well.
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple, Union
+
+FAMILIES = ('rotation', 'rotation_reversed', 'reflection', 'reflection_reversed')
+
+
+def _prepare(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Centered complex samples of shape (m, n), dropping a repeated endpoint, and the centroids."""
+    z = np.atleast_2d(np.asarray(x, dtype=float) + 1j * np.asarray(y, dtype=float))
+    scale = np.max(np.abs(z), axis=-1, initial=0.0)
+    if z.shape[-1] > 1 and np.all(np.abs(z[:, -1] - z[:, 0]) <= 1e-9 * np.maximum(scale, 1e-300)):
+        # generate_curve samples t = 0 and t = 2π; keep one period exactly once
+        z = z[:, :-1]
+    center = z.mean(axis=-1, keepdims=True)
+    return z - center, center[:, 0]
+
+
+def _interpolate(spectrum: np.ndarray, upsample: int) -> np.ndarray:
+    """Evaluate (1/n) Σ_k P_k e^{2πiks/n} at s = j / upsample via zero-padding."""
+    m, n = spectrum.shape
+    padded = np.zeros((m, n * upsample), dtype=complex)
+    half = (n + 1) // 2
+    padded[:, :half] = spectrum[:, :half]
+    padded[:, n * upsample - (n - half):] = spectrum[:, half:]
+    if n % 2 == 0:
+        # Split the Nyquist term between ±n/2 so the interpolant is the
+        # symmetric trigonometric one
+        padded[:, n // 2] = spectrum[:, n // 2] / 2
+        padded[:, n * upsample - n // 2] = spectrum[:, n // 2] / 2
+    return np.fft.ifft(padded, axis=-1) * upsample
+
+
+def symmetry_correlations(x: np.ndarray, y: np.ndarray,
+                          upsample: int = 4) -> Dict[str, np.ndarray]:
+    """
+    Compute the normalized correlation of every symmetry family.
+
+    Args:
+        x: x-coordinates of one period, shape (n,) or (m, n)
+        y: y-coordinates, same shape as x
+        upsample: Correlation samples per curve sample
+
+    Returns:
+        Dictionary with a complex (m, n * upsample) array per family in
+        ``FAMILIES`` (magnitude = score, phase = λ), 'shift', the
+        positions s in units of samples, and the complex 'center' per curve
+    """
+    z, center = _prepare(x, y)
+    energy = np.sum(np.abs(z) ** 2, axis=-1, keepdims=True)
+    energy = np.where(energy > 0, energy, 1.0)
+
+    Z = np.fft.fft(z, axis=-1)
+    W = np.fft.fft(np.conj(z), axis=-1)
+    # Σ_t conj(u_t) v_{t+s} = ifft(conj(U) V);  Σ_t u_t v_{s-t} = ifft(U V)
+    products = {
+        'rotation': np.conj(Z) * Z,
+        'rotation_reversed': W * Z,
+        'reflection': np.conj(W) * Z,
+        'reflection_reversed': Z * Z,
+    }
+    result = {name: _interpolate(product, upsample) / energy
+              for name, product in products.items()}
+    result['shift'] = np.arange(z.shape[-1] * upsample) / upsample
+    result['center'] = center
+    return result
+
+
+def _peaks(values: np.ndarray, threshold: float):
+    """Parabolically refined local maxima of |values| along the last axis."""
+    score = np.abs(values)
+    left = np.roll(score, 1, axis=-1)
+    right = np.roll(score, -1, axis=-1)
+    rows, cols = np.nonzero((score >= left) & (score > right) & (score >= threshold))
+
+    y0, y1, y2 = left[rows, cols], score[rows, cols], right[rows, cols]
+    curvature = y0 - 2 * y1 + y2
+    offset = np.where(curvature < 0, 0.5 * (y0 - y2) / np.where(curvature < 0, curvature, -1.0), 0.0)
+    refined = y1 - 0.25 * (y0 - y2) * offset
+
+    # Quadratic (Lagrange) interpolation of the complex value gives λ
+    n = values.shape[-1]
+    v0 = values[rows, (cols - 1) % n]
+    v1 = values[rows, cols]
+    v2 = values[rows, (cols + 1) % n]
+    value = v1 + 0.5 * offset * (v2 - v0) + 0.5 * offset ** 2 * (v2 - 2 * v1 + v0)
+    return rows, cols + offset, np.minimum(refined, 1.0), value
+
+
+def _cluster(angles: List[float], scores: List[float], period: float,
+             angle_tolerance: float):
+    """Merge angles equal modulo ``period``, keeping the best score of each."""
+    angles = np.mod(angles, period)
+    angles[period - angles <= angle_tolerance] = 0.0
+    merged = []
+    for angle, score in sorted(zip(angles, scores)):
+        if merged and angle - merged[-1][0] <= angle_tolerance:
+            merged[-1][1] = max(merged[-1][1], score)
+        else:
+            merged.append([angle, score])
+    if len(merged) > 1 and merged[0][0] + period - merged[-1][0] <= angle_tolerance:
+        merged[0][1] = max(merged[0][1], merged.pop()[1])
+    return [float(a) for a, _ in merged], [float(s) for _, s in merged]
+
+
+def _analyze_batch(x: np.ndarray, y: np.ndarray, tolerance: float,
+                   angle_tolerance: float, upsample: int) -> List[Dict]:
+    """``analyze_symmetry`` for one (m, n) batch."""
+    correlations = symmetry_correlations(x, y, upsample)
+    center = correlations['center']
+    threshold = 1.0 - tolerance
+    m = len(x)
+
+    found = {}
+    best = np.zeros(m)
+    continuous = np.zeros(m, dtype=bool)
+    for name in FAMILIES:
+        values = correlations[name]
+        rows, _, scores, lam = _peaks(values, 0.0)
+        angle = np.angle(lam)
+        if name.startswith('rotation'):
+            continuous |= np.min(np.abs(values), axis=-1) >= threshold
+            # λ = 1 only retraces the figure (identity)
+            trivial = np.abs(np.mod(angle + np.pi, 2 * np.pi) - np.pi) <= angle_tolerance
+            np.maximum.at(best, rows[~trivial], scores[~trivial])
+        else:
+            # λ conj(z) reflects about the axis at arg λ / 2
+            angle = angle / 2
+            np.maximum.at(best, rows, scores)
+        keep = scores >= threshold
+        # Peaks come out row by row, so each curve's peaks are one slice
+        bounds = np.searchsorted(rows[keep], np.arange(m + 1))
+        found[name] = (bounds, angle[keep], scores[keep])
+
+    results = []
+    for i in range(m):
+        elements = {}
+        for kind in ('rotation', 'reflection'):
+            angles, scores = [], []
+            for name in (kind, kind + '_reversed'):
+                bounds, angle, score = found[name]
+                angles.extend(angle[bounds[i]:bounds[i + 1]])
+                scores.extend(score[bounds[i]:bounds[i + 1]])
+            period = 2 * np.pi if kind == 'rotation' else np.pi
+            elements[kind] = _cluster(angles, scores, period, angle_tolerance)
+
+        rotations, rotation_scores = elements['rotation']
+        if rotations and rotations[0] <= angle_tolerance:
+            rotations, rotation_scores = rotations[1:], rotation_scores[1:]
+        axes, axis_scores = elements['reflection']
+
+        if continuous[i]:
+            # Every angle is a symmetry (a circle); the peak lists are noise
+            order = np.inf
+            group = 'O(2)' if axes else 'SO(2)'
+            rotations, rotation_scores, axes, axis_scores = [], [], [], []
+        else:
+            order = len(rotations) + 1
+            group = f"{'D' if axes else 'C'}{order}"
+
+        results.append({
+            'group': group,
+            'rotation_order': order,
+            'rotation_angles': rotations,
+            'rotation_scores': rotation_scores,
+            'reflection_axes': axes,
+            'reflection_scores': axis_scores,
+            'center': (float(center[i].real), float(center[i].imag)),
+            'best_score': float(best[i]),
+        })
+    return results
+
+
+def analyze_symmetry(x: np.ndarray, y: np.ndarray, tolerance: float = 1e-6,
+                     angle_tolerance: float = 1e-3, upsample: int = 4,
+                     batch_size: int = 256) -> Union[Dict, List[Dict]]:
+    """
+    Detect the symmetry group of one closed curve or a batch of curves.
+
+    The samples must cover exactly one period uniformly; a final sample
+    repeating the first (as from ``generate_curve``) is dropped. With the
+    default ``upsample`` of 4, symmetries between samples score within
+    1e-6 of 1 for n ≥ 256 samples and frequencies up to 10.
+
+    Args:
+        x: x-coordinates, shape (n,) or (m, n)
+        y: y-coordinates, same shape as x
+        tolerance: A symmetry is accepted when its score is ≥ 1 - tolerance
+        angle_tolerance: Angles closer than this (radians) are merged
+        upsample: Correlation samples per curve sample
+        batch_size: Curves transformed at once
+
+    Returns:
+        Dictionary (list of dictionaries for a batch) with:
+        'group' ('C<m>', 'D<m>', 'SO(2)' or 'O(2)'),
+        'rotation_order' (m; inf for continuous rotations),
+        'rotation_angles' and 'rotation_scores' of non-trivial rotations,
+        'reflection_axes' (angles in [0, π) of axes through the centroid)
+        and 'reflection_scores', 'center' (centroid) and
+        'best_score', the highest non-trivial score (0 to 1)
+    """
+    batched = np.ndim(x) == 2
+    x2 = np.atleast_2d(np.asarray(x, dtype=float))
+    y2 = np.atleast_2d(np.asarray(y, dtype=float))
+
+    results = []
+    for start in range(0, len(x2), batch_size):
+        results.extend(_analyze_batch(x2[start:start + batch_size], y2[start:start + batch_size],
+                                      tolerance, angle_tolerance, upsample))
+    return results if batched else results[0]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Resonant Alphabet Mapping
+=========================
+
+Maps letters to frequencies and Lissajous glyphs as specified in
+"read me Resonant Alphabet":
+
+    v(i) = (i - 12.5) / 12.5        letters A–Z, i = 0 … 25
+    f(v) = f0 · 2^((R/12) v)        root f0 (Hz), range ±R semitones
+
+Each letter drives a stereo Lissajous voice whose left (x) and right (y)
+channels are small integer harmonic sets of its frequency (Section 2.5):
+
+    x(t) = Σ_k∈R_L sin(2π k f t + δ),   y(t) = Σ_k∈R_R sin(2π k f t)
+
+With the defaults R_L = {1}, R_R = {2} and δ = π/2, one letter traces the
+same figure as ``LissajousGeometry(1, 1, 1, 2, π/2)``. A glyph for a text
+sums the voices of its letters, scaled so that |x|, |y| ≤ 1.
+"""
+
+import numpy as np
+from typing import Sequence, Tuple
+
+F0 = 440.0
+SEMITONE_RANGE = 12.0
+LEFT_HARMONICS = (1,)
+RIGHT_HARMONICS = (2,)
+PHASE_SHIFT = np.pi / 2
+GLYPH_BLOCK = 65536
+
+
+def letter_indices(text: str) -> np.ndarray:
+    """
+    Alphabet indices (A = 0 … Z = 25) of the letters in ``text``.
+
+    Case is ignored and all other characters are skipped.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Integer array of indices
+    """
+    codes = np.frombuffer(text.upper().encode('ascii', 'ignore'), dtype=np.uint8)
+    codes = codes[(codes >= ord('A')) & (codes <= ord('Z'))]
+    return codes.astype(np.int64) - ord('A')
+
+
+def letter_value(index: np.ndarray) -> np.ndarray:
+    """Normalized control value v(i) = (i - 12.5) / 12.5."""
+    return (np.asarray(index, dtype=float) - 12.5) / 12.5
+
+
+def frequency(v: np.ndarray, f0: float = F0, semitone_range: float = SEMITONE_RANGE) -> np.ndarray:
+    """Semitone law f(v) = f0 · 2^((R/12) v)."""
+    return f0 * np.exp2((semitone_range / 12.0) * np.asarray(v, dtype=float))
+
+
+def letter_frequencies(text: str, f0: float = F0,
+                       semitone_range: float = SEMITONE_RANGE) -> np.ndarray:
+    """
+    Frequencies (Hz) of the letters in ``text``.
+
+    Args:
+        text: Input text
+        f0: Root frequency in Hz
+        semitone_range: Range R in semitones
+
+    Returns:
+        One frequency per letter
+    """
+    return frequency(letter_value(letter_indices(text)), f0, semitone_range)
+
+
+def glyph_curve(text: str, num_points: int = 1000, cycles: float = 1.0,
+                f0: float = F0, semitone_range: float = SEMITONE_RANGE,
+                left_harmonics: Sequence[int] = LEFT_HARMONICS,
+                right_harmonics: Sequence[int] = RIGHT_HARMONICS,
+                phase_shift: float = PHASE_SHIFT) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Render the Lissajous glyph of a text.
+
+    Args:
+        text: Input text; letters without A–Z give an empty glyph
+        num_points: Number of samples
+        cycles: Duration in periods of the root frequency f0
+        f0: Root frequency in Hz
+        semitone_range: Range R in semitones
+        left_harmonics: Harmonic set R_L of the x channel
+        right_harmonics: Harmonic set R_R of the y channel
+        phase_shift: Phase δ of the x channel
+
+    Returns:
+        Tuple of (t, x, y); t in seconds, x and y with peak |value| ≤ 1
+    """
+    if not f0 > 0 or not cycles > 0:
+        raise ValueError("f0 and cycles must be positive")
+    t = np.linspace(0.0, cycles / f0, num_points)
+    frequencies = letter_frequencies(text, f0, semitone_range)
+    x = np.zeros(num_points)
+    y = np.zeros(num_points)
+
+    # Repeated letters contribute identical voices, so each of the at most
+    # 26 distinct frequencies is evaluated once and weighted by its count.
+    # Samples are processed in blocks to bound the (letters, block) terms.
+    distinct, counts = np.unique(frequencies, return_counts=True)
+    for start in range(0, num_points, GLYPH_BLOCK):
+        phase = 2 * np.pi * np.outer(distinct, t[start:start + GLYPH_BLOCK])
+        for k in left_harmonics:
+            x[start:start + GLYPH_BLOCK] += counts @ np.sin(k * phase + phase_shift)
+        for k in right_harmonics:
+            y[start:start + GLYPH_BLOCK] += counts @ np.sin(k * phase)
+
+    if len(frequencies):
+        x /= len(frequencies) * max(len(left_harmonics), 1)
+        y /= len(frequencies) * max(len(right_harmonics), 1)
+    return t, x, y
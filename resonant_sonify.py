@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Real-Time Streaming Sonification of Text
+========================================
+
+Turns a text stream into stereo PCM using the Resonant Alphabet law
+f(v) = f0 · 2^((R/12) v) (``resonant_alphabet``). Every letter starts a
+voice whose left and right channels are the x and y channels of its
+Lissajous figure, so the output drawn on an XY scope shows the glyphs.
+
+Rendering works on fixed-size blocks without per-sample Python:
+
+- For each letter and harmonic a table e^{i 2π k f n / fs}, n = 0 … B-1,
+  is precomputed once. A voice's block is that table rotated by the
+  voice's phase at the block start, so all active voices are rendered
+  with one gather, one complex multiply and one sum.
+- A precomputed attack/release envelope is gathered per voice the same way.
+
+``TextSonifier.run`` consumes an async text source and puts int16
+(block_size, 2) blocks into a bounded ``asyncio.Queue``; the queue bound
+caps the latency between a letter arriving and its first sample leaving
+the queue. Block render time and lateness against the real-time clock are
+recorded in ``stats``. ``write_wav`` and ``send_to_socket`` drain the queue
+into a WAV file or a local TCP socket, so no audio hardware is needed.
+
+Usage:
+    python resonant_sonify.py "HELLO WORLD" --output hello.wav
+    echo "HELLO" | python resonant_sonify.py --socket 127.0.0.1:9000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import wave
+from typing import AsyncIterable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lissajous_backends import get_backend
+from resonant_alphabet import (F0, LEFT_HARMONICS, PHASE_SHIFT, RIGHT_HARMONICS,
+                               SEMITONE_RANGE, frequency, letter_value)
+
+
+class TextSonifier:
+    """
+    Block-based polyphonic renderer for Resonant Alphabet voices.
+    """
+
+    def __init__(self, sample_rate: int = 48000, block_size: int = 512,
+                 f0: float = F0, semitone_range: float = SEMITONE_RANGE,
+                 left_harmonics: Sequence[int] = LEFT_HARMONICS,
+                 right_harmonics: Sequence[int] = RIGHT_HARMONICS,
+                 phase_shift: float = PHASE_SHIFT,
+                 note_seconds: float = 0.25, letter_seconds: float = 0.08,
+                 attack_seconds: float = 0.005, max_voices: int = 64,
+                 gain: float = 0.25):
+        """
+        Args:
+            sample_rate: Output sample rate in Hz
+            block_size: Frames per emitted block
+            f0: Root frequency in Hz
+            semitone_range: Range R in semitones
+            left_harmonics: Harmonic set of the left (x) channel
+            right_harmonics: Harmonic set of the right (y) channel
+            phase_shift: Phase δ of the left channel
+            note_seconds: Duration of each letter's voice
+            letter_seconds: Spacing between consecutive letters (spaces
+                leave a gap of the same length)
+            attack_seconds: Linear attack and release time
+            max_voices: Simultaneous voices; the oldest is dropped beyond this
+            gain: Output gain applied to the voice sum before clipping
+        """
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.phase_shift = phase_shift
+        self.max_voices = max_voices
+        self.gain = gain
+        self.note_samples = max(int(round(note_seconds * sample_rate)), 1)
+        self.letter_samples = max(int(round(letter_seconds * sample_rate)), 1)
+
+        # Per-letter oscillator tables, shape (26, harmonics, block_size)
+        self.frequencies = frequency(letter_value(np.arange(26)), f0, semitone_range)
+        n = np.arange(block_size)
+        self._harmonics = {}
+        self._tables = {}
+        for side, harmonics in (('left', left_harmonics), ('right', right_harmonics)):
+            k = np.asarray(harmonics, dtype=float)
+            self._harmonics[side] = k
+            omega = 2 * np.pi * self.frequencies[:, None] * k[None, :] / sample_rate
+            self._tables[side] = np.exp(1j * omega[:, :, None] * n)
+
+        # Envelope table, zero-padded by one block on both sides so every
+        # gather index is in range
+        attack = max(int(round(attack_seconds * sample_rate)), 1)
+        envelope = np.ones(self.note_samples)
+        ramp = np.linspace(0.0, 1.0, min(attack, self.note_samples // 2) + 1)[1:]
+        envelope[:len(ramp)] = ramp
+        envelope[len(envelope) - len(ramp):] = np.minimum(envelope[len(envelope) - len(ramp):],
+                                                          ramp[::-1])
+        self._envelope = np.concatenate([np.zeros(block_size), envelope, np.zeros(block_size)])
+
+        self.clock = 0                  # first sample of the next block
+        self._next_slot = 0             # earliest start of the next letter
+        self._letters = np.empty(0, dtype=np.int64)
+        self._starts = np.empty(0, dtype=np.int64)
+        self.stats = {'blocks': 0, 'letters': 0, 'dropped_voices': 0, 'peak_voices': 0,
+                      'render_seconds': 0.0, 'max_render_ms': 0.0,
+                      'late_blocks': 0, 'max_lateness_ms': 0.0}
+
+    @property
+    def block_seconds(self) -> float:
+        """Duration of one block in seconds."""
+        return self.block_size / self.sample_rate
+
+    @property
+    def active_voices(self) -> int:
+        """Voices that are sounding or scheduled."""
+        return len(self._starts)
+
+    def feed(self, text: str) -> int:
+        """
+        Schedule the letters of ``text``.
+
+        Letters are placed ``letter_seconds`` apart, starting no earlier
+        than the next block; whitespace leaves a gap and other characters
+        are ignored.
+
+        Args:
+            text: Text to sonify
+
+        Returns:
+            Number of letters scheduled
+        """
+        letters, starts, self._next_slot = self._schedule(text, max(self._next_slot, self.clock))
+        if letters:
+            self._letters = np.concatenate([self._letters, letters])
+            self._starts = np.concatenate([self._starts, starts])
+            self.stats['letters'] += len(letters)
+        return len(letters)
+
+    def _schedule(self, text: str, slot: int) -> Tuple[List[int], List[int], int]:
+        """Letter indices and start samples from ``slot`` on, plus the next free slot."""
+        letters, starts = [], []
+        for ch in text.upper():
+            if 'A' <= ch <= 'Z':
+                letters.append(ord(ch) - ord('A'))
+                starts.append(slot)
+                slot += self.letter_samples
+            elif ch.isspace():
+                slot += self.letter_samples
+        return letters, starts, slot
+
+    def _side(self, side: str, letters: np.ndarray, offsets: np.ndarray,
+              phase: float) -> np.ndarray:
+        """(voices, block_size) channel signal before the envelope."""
+        k = self._harmonics[side]
+        if len(k) == 0:
+            return np.zeros((len(letters), self.block_size))
+        omega = 2 * np.pi * self.frequencies[letters][:, None] * k[None, :] / self.sample_rate
+        start_phase = np.exp(1j * (omega * offsets[:, None] + phase))
+        signal = np.einsum('vh,vhn->vn', start_phase, self._tables[side][letters])
+        return signal.imag / len(k)
+
+    def render_block(self) -> np.ndarray:
+        """
+        Render the next block and advance the clock.
+
+        Returns:
+            int16 array of shape (block_size, 2): left (x), right (y)
+        """
+        begin = time.perf_counter()
+        end = self.clock + self.block_size
+
+        # Retire finished voices and cap polyphony among sounding ones
+        alive = self._starts + self.note_samples > self.clock
+        self._letters, self._starts = self._letters[alive], self._starts[alive]
+        sounding = np.nonzero(self._starts < end)[0]
+        if len(sounding) > self.max_voices:
+            drop = sounding[:len(sounding) - self.max_voices]
+            keep = np.ones(len(self._starts), dtype=bool)
+            keep[drop] = False
+            self._letters, self._starts = self._letters[keep], self._starts[keep]
+            self.stats['dropped_voices'] += len(drop)
+            sounding = np.nonzero(self._starts < end)[0]
+
+        mix = np.zeros((self.block_size, 2))
+        if len(sounding):
+            letters = self._letters[sounding]
+            offsets = self.clock - self._starts[sounding]
+            index = offsets[:, None] + np.arange(self.block_size) + self.block_size
+            envelope = self._envelope[np.clip(index, 0, len(self._envelope) - 1)]
+            mix[:, 0] = np.sum(envelope * self._side('left', letters, offsets, self.phase_shift), axis=0)
+            mix[:, 1] = np.sum(envelope * self._side('right', letters, offsets, 0.0), axis=0)
+            self.stats['peak_voices'] = max(self.stats['peak_voices'], len(sounding))
+
+        block = (np.clip(mix * self.gain, -1.0, 1.0) * 32767).astype(np.int16)
+        self.clock = end
+
+        elapsed = time.perf_counter() - begin
+        self.stats['blocks'] += 1
+        self.stats['render_seconds'] += elapsed
+        self.stats['max_render_ms'] = max(self.stats['max_render_ms'], elapsed * 1000)
+        return block
+
+    def render_offline(self, text: str, backend: Optional[str] = None) -> np.ndarray:
+        """
+        Render a whole text at once with the ``overlap_add`` kernel.
+
+        Letters are placed as by ``feed`` from sample 0. The streaming
+        state is not touched, and ``max_voices`` does not apply.
+
+        Args:
+            text: Text to sonify
+            backend: Kernel backend name (default: ``get_backend()``)
+
+        Returns:
+            int16 array of shape (n_frames, 2), equal to the streamed blocks
+            up to rounding
+        """
+        letters, starts, _ = self._schedule(text, 0)
+        if not letters:
+            return np.zeros((0, 2), dtype=np.int16)
+
+        kernels = get_backend(backend)
+        frequencies = self.frequencies[letters]
+        envelope = self._envelope[self.block_size:self.block_size + self.note_samples]
+        length = starts[-1] + self.note_samples
+        mix = np.column_stack([
+            kernels.overlap_add(frequencies, starts, envelope, length, self.sample_rate,
+                                self._harmonics[side], phase)
+            for side, phase in (('left', self.phase_shift), ('right', 0.0))])
+        return (np.clip(mix * self.gain, -1.0, 1.0) * 32767).astype(np.int16)
+
+    def pending(self) -> bool:
+        """Whether scheduled or sounding voices remain."""
+        return bool(len(self._starts)) and bool(np.any(self._starts + self.note_samples > self.clock))
+
+    async def run(self, source: AsyncIterable[str], queue: asyncio.Queue,
+                  realtime: bool = True) -> Dict:
+        """
+        Sonify an async text stream into ``queue`` until it ends.
+
+        In real-time mode each block is emitted at its playback time, so
+        the output keeps pace with the sample rate; text that arrives
+        meanwhile is scheduled from the next block on. With
+        ``realtime=False`` blocks are produced as fast as the consumer
+        takes them (e.g. for file output). A ``None`` marks the end.
+
+        If the source raises, the text fed so far is still rendered and
+        the ``None`` sent, so consumers finish; the exception is then
+        re-raised from ``run``.
+
+        Args:
+            source: Async iterable of text chunks
+            queue: Output queue of int16 (block_size, 2) blocks; its
+                maxsize bounds the buffered latency
+            realtime: Pace blocks by the wall clock
+
+        Returns:
+            The ``stats`` dictionary, including 'audio_seconds',
+            'realtime_factor' (audio time / render time) and
+            'latency_bound_ms' (queue capacity plus one block)
+        """
+        finished = asyncio.Event()
+
+        async def read_source():
+            try:
+                async for chunk in source:
+                    self.feed(chunk)
+            finally:
+                finished.set()
+
+        reader = asyncio.create_task(read_source())
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            while not (finished.is_set() and not self.pending()):
+                if realtime:
+                    deadline = start + self.clock / self.sample_rate
+                    delay = deadline - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        lateness = -delay * 1000
+                        self.stats['max_lateness_ms'] = max(self.stats['max_lateness_ms'], lateness)
+                        if lateness > self.block_seconds * 1000:
+                            self.stats['late_blocks'] += 1
+                elif not self.pending():
+                    # Nothing to render until more text arrives
+                    await asyncio.sleep(0)
+                    if not finished.is_set():
+                        await asyncio.wait([reader], timeout=self.block_seconds)
+                    continue
+                await queue.put(self.render_block())
+            await queue.put(None)
+        finally:
+            reader.cancel()
+        if not reader.cancelled() and reader.exception() is not None:
+            raise reader.exception()
+
+        self.stats['audio_seconds'] = self.clock / self.sample_rate
+        self.stats['realtime_factor'] = (self.stats['audio_seconds'] /
+                                         max(self.stats['render_seconds'], 1e-12))
+        capacity = queue.maxsize if queue.maxsize > 0 else float('inf')
+        self.stats['latency_bound_ms'] = (capacity + 1) * self.block_seconds * 1000
+        return self.stats
+
+
+async def iterate_text(text: str) -> AsyncIterable[str]:
+    """Async source yielding one fixed text."""
+    yield text
+
+
+async def write_wav(queue: asyncio.Queue, path: str, sample_rate: int = 48000) -> int:
+    """
+    Drain blocks from ``queue`` into a 16-bit stereo WAV file.
+
+    Args:
+        queue: Queue filled by ``TextSonifier.run``
+        path: Output file path
+        sample_rate: Sample rate written to the header
+
+    Returns:
+        Number of frames written
+    """
+    frames = 0
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        while True:
+            block = await queue.get()
+            if block is None:
+                break
+            f.writeframes(block.astype('<i2').tobytes())
+            frames += len(block)
+    return frames
+
+
+async def send_to_socket(queue: asyncio.Queue, host: str = "127.0.0.1", port: int = 9000) -> int:
+    """
+    Drain blocks from ``queue`` to a TCP socket as raw interleaved s16le PCM.
+
+    Args:
+        queue: Queue filled by ``TextSonifier.run``
+        host: Receiver host
+        port: Receiver port
+
+    Returns:
+        Number of frames sent
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    frames = 0
+    try:
+        while True:
+            block = await queue.get()
+            if block is None:
+                break
+            writer.write(block.astype('<i2').tobytes())
+            await writer.drain()
+            frames += len(block)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return frames
+
+
+async def _stdin_lines() -> AsyncIterable[str]:
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        yield line
+
+
+async def _main(args) -> Dict:
+    sonifier = TextSonifier(sample_rate=args.sample_rate, block_size=args.block_size,
+                            f0=args.f0, semitone_range=args.semitones)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=args.queue_blocks)
+    source = iterate_text(args.text) if args.text else _stdin_lines()
+    if args.socket:
+        host, _, port = args.socket.rpartition(':')
+        sink = send_to_socket(queue, host or "127.0.0.1", int(port))
+    else:
+        sink = write_wav(queue, args.output, args.sample_rate)
+    realtime = bool(args.socket) or args.realtime
+    stats, _ = await asyncio.gather(sonifier.run(source, queue, realtime), sink)
+    return stats
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Sonify text with the Resonant Alphabet")
+    parser.add_argument("text", nargs="?", default=None, help="Text (default: read stdin)")
+    parser.add_argument("--output", default="sonification.wav", help="WAV output path")
+    parser.add_argument("--socket", default=None, help="Stream raw PCM to HOST:PORT instead")
+    parser.add_argument("--realtime", action="store_true", help="Pace file output in real time")
+    parser.add_argument("--sample-rate", type=int, default=48000, help="Sample rate in Hz")
+    parser.add_argument("--block-size", type=int, default=512, help="Frames per block")
+    parser.add_argument("--queue-blocks", type=int, default=4, help="Queue capacity in blocks")
+    parser.add_argument("--f0", type=float, default=F0, help="Root frequency in Hz")
+    parser.add_argument("--semitones", type=float, default=SEMITONE_RANGE, help="Range R")
+    args = parser.parse_args()
+
+    stats = asyncio.run(_main(args))
+    print(f"{stats['letters']} letters, {stats['audio_seconds']:.2f} s of audio, "
+          f"{stats['realtime_factor']:.0f}x real time, peak {stats['peak_voices']} voices")
+    print(f"block render max {stats['max_render_ms']:.2f} ms, "
+          f"{stats['late_blocks']} late blocks, latency bound {stats['latency_bound_ms']:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
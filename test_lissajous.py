@@ -9,9 +9,38 @@ Run with: python test_lissajous.py
 import numpy as np
 import sys
 import os
+import tempfile
+import asyncio
+import json
+import urllib.error
+import urllib.request
+import io
+import time
+import unittest
+import warnings
+import wave
+import xml.etree.ElementTree as ET
 
 # Import from verify.py
-from verify import LissajousGeometry, ValidationMetrics
+from verify import (LissajousGeometry, ValidationMetrics, DATASET_CONFIGURATIONS,
+                    analytic_arc_length, generate_csv_datasets)
+from lissajous_backends import (BACKENDS, KERNELS, _loop_backend, available_backends,
+                                benchmark_backends, get_backend, register_backend)
+from lissajous_catalogue import LissajousCatalogue, compute_metrics, reduced_ratios
+from lissajous_compact import read_compact_curve, read_compact_header, write_compact_curve
+from lissajous_fit import fit_lissajous
+from lissajous_loadgen import run_load_test
+from lissajous_lod import LODPyramid, build_lod_pyramid, minmax_envelope, rdp_simplify, write_lod_pyramid
+from lissajous_mesh import (LissajousRotor, STL_TRIANGLE_DTYPE, read_ply, revolution_mesh,
+                            tube_mesh, write_ply, write_stl)
+from lissajous_resample import resample_uniform_arc_length, stream_uniform_arc_length
+from lissajous_server import LissajousService
+from lissajous_spectral import dominant_harmonics, estimate_frequency_ratios, magnitude_spectrum
+from lissajous_svg import export_svg, export_svg_sprite_sheet, write_svg_path
+from lissajous_sweep import merge_shards, pending_shards, plan_sweep, run_sweep
+from lissajous_symmetry import analyze_symmetry, symmetry_correlations
+from resonant_alphabet import glyph_curve, letter_frequencies
+from resonant_sonify import TextSonifier, iterate_text, send_to_socket, write_wav
 
 
 def test_circle_generation():
@@ -193,6 +222,965 @@ def test_frequency_ratio_effect():
     print("  ✓ PASSED")
 
 
+def test_adaptive_sampling_tolerance():
+    """Test that adaptive sampling keeps every chord within tolerance."""
+    print("Running: test_adaptive_sampling_tolerance")
+    
+    tolerance = 1e-3
+    lissajous = LissajousGeometry(frequency_x=7.0, frequency_y=5.0)
+    t, x, y = lissajous.generate_adaptive_curve(tolerance=tolerance)
+    
+    assert t[0] == 0.0 and abs(t[-1] - 2 * np.pi) < 1e-12, "Parameter range not [0, 2π]"
+    assert np.all(np.diff(t) > 0), "Parameter values not strictly increasing"
+    
+    # Measure the true chord deviation on a fine sub-grid of every segment
+    s = np.linspace(0, 1, 25)[None, :]
+    ts = t[:-1, None] + np.diff(t)[:, None] * s
+    xs, ys = lissajous.evaluate(ts)
+    cx = np.diff(x)[:, None]
+    cy = np.diff(y)[:, None]
+    deviation = np.abs((xs - x[:-1, None]) * cy - (ys - y[:-1, None]) * cx) / np.hypot(cx, cy)
+    assert np.max(deviation) <= tolerance * 1.01, f"Chord deviation too large: {np.max(deviation)}"
+    
+    # Fewer points than the default uniform render, same arc length
+    assert len(t) < lissajous.num_points, f"Adaptive sampling used {len(t)} points"
+    reference = LissajousGeometry(frequency_x=7.0, frequency_y=5.0, num_points=200000)
+    expected = reference.calculate_arc_length(*reference.generate_curve())
+    arc_length = lissajous.calculate_arc_length(x, y)
+    assert abs(arc_length - expected) / expected < 1e-3, f"Arc length off: {arc_length} vs {expected}"
+    print("  ✓ PASSED")
+
+
+def test_analytic_arc_length():
+    """Test quadrature arc length against closed forms and dense polylines."""
+    print("Running: test_analytic_arc_length")
+    
+    # Circle of radius 1 and the retraced diagonal x = y = sin(t)
+    circle = LissajousGeometry(frequency_x=1.0, frequency_y=1.0, phase_shift=np.pi/2)
+    diagonal = LissajousGeometry(frequency_x=1.0, frequency_y=1.0, phase_shift=0.0)
+    assert abs(circle.calculate_analytic_arc_length() - 2 * np.pi) < 1e-10, "Circle length wrong"
+    assert abs(diagonal.calculate_analytic_arc_length() - 4 * np.sqrt(2)) < 1e-10, "Diagonal length wrong"
+    
+    # Polyline length converges to the quadrature result from below
+    lissajous = LissajousGeometry(frequency_x=7.0, frequency_y=5.0, num_points=200000)
+    exact = lissajous.calculate_analytic_arc_length()
+    polyline = lissajous.calculate_arc_length(*lissajous.generate_curve())
+    assert 0 <= exact - polyline < 1e-6, f"Quadrature disagrees with polyline: {exact} vs {polyline}"
+    
+    # Batched call matches scalar calls
+    freq_x = np.array([1.0, 3.0, 5.0, 7.0])
+    freq_y = np.array([1.0, 2.0, 4.0, 5.0])
+    batch = analytic_arc_length(1.0, 1.0, freq_x, freq_y, np.pi / 3)
+    assert batch.shape == (4,), f"Unexpected batch shape: {batch.shape}"
+    for value, fx, fy in zip(batch, freq_x, freq_y):
+        single = analytic_arc_length(1.0, 1.0, fx, fy, np.pi / 3)
+        assert abs(value - single) < 1e-9 * single, "Batched result differs from scalar"
+    
+    # Hitting the panel cap warns with the achieved error bound
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        capped = analytic_arc_length(1.0, 1.0, 7.0, 5.0, np.pi / 2, tolerance=1e-14, max_panels=40)
+    messages = [str(w.message) for w in caught if issubclass(w.category, RuntimeWarning)]
+    assert len(messages) == 1 and "achieved relative error bound" in messages[0], \
+        "Panel cap should warn"
+    assert abs(capped - exact) < 1e-4 * exact, "Capped result should still be close"
+    
+    try:
+        analytic_arc_length(1.0, 1.0, 7.0, 5.0, np.pi / 2, tolerance=1e-14, max_panels=40, strict=True)
+        assert False, "Strict panel cap should raise"
+    except RuntimeError:
+        pass
+    
+    # The cap applies per configuration, so a large batch refines every row
+    many_x = np.tile(np.arange(1.0, 21.0), 25)
+    many_y = np.repeat(np.arange(1.0, 26.0), 20)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        many = analytic_arc_length(1.0, 1.0, many_x, many_y, 0.7, tolerance=1e-8, max_panels=400)
+    reference = analytic_arc_length(1.0, 1.0, many_x, many_y, 0.7, tolerance=1e-12)
+    assert np.max(np.abs(many - reference) / reference) < 1e-7, "Batched rows left unrefined"
+    
+    # The initial grid is checked against the cap before it is allocated
+    for bad in (1e9, np.inf, np.nan):
+        try:
+            analytic_arc_length(1.0, 1.0, bad, 2.0, 0.0)
+            assert False, f"frequency {bad} should raise"
+        except ValueError:
+            pass
+    
+    try:
+        analytic_arc_length(1.0, 1.0, 3.0, 2.0, 0.0, t_max=0.0)
+        assert False, "t_max = 0 should raise"
+    except ValueError:
+        pass
+    print("  ✓ PASSED")
+
+
+def test_uniform_arc_length_resampling():
+    """Test equidistant resampling, batching and chunked streaming."""
+    print("Running: test_uniform_arc_length_resampling")
+    
+    lissajous = LissajousGeometry(frequency_x=7.0, frequency_y=5.0, num_points=20000)
+    x, y = lissajous.generate_curve()
+    s, xs, ys = resample_uniform_arc_length(x, y, 2000)
+    
+    # Consecutive points are equally spaced along the curve; chords only
+    # fall slightly short of the arc in the tightest turns
+    steps = np.hypot(np.diff(xs), np.diff(ys))
+    expected = lissajous.calculate_arc_length(x, y) / 1999
+    assert np.all(steps <= expected * (1 + 1e-9)), "Chord longer than arc step"
+    assert np.median(steps) > 0.999 * expected, "Points not equidistant"
+    assert np.min(steps) > 0.95 * expected, "Points not equidistant"
+    assert abs(s[-1] - lissajous.calculate_arc_length(x, y)) < 1e-9, "Arc-length table wrong"
+    assert xs[0] == x[0] and abs(xs[-1] - x[-1]) < 1e-12, "Endpoints not preserved"
+    
+    # Batched curves match single-curve calls
+    curves = [LissajousGeometry(frequency_x=fx, frequency_y=fy, num_points=3000)
+              for fx, fy in [(1.0, 1.0), (3.0, 2.0), (5.0, 4.0)]]
+    x_batch = np.array([c.generate_curve()[0] for c in curves])
+    y_batch = np.array([c.generate_curve()[1] for c in curves])
+    _, xb, yb = resample_uniform_arc_length(x_batch, y_batch, 500)
+    for i in range(3):
+        _, x1, y1 = resample_uniform_arc_length(x_batch[i], y_batch[i], 500)
+        assert np.allclose(xb[i], x1) and np.allclose(yb[i], y1), "Batch differs from single"
+    
+    # Streaming in small chunks reproduces the in-memory result
+    chunks = list(stream_uniform_arc_length(lissajous, 2000, chunk_size=777))
+    assert np.allclose(np.concatenate([c[1] for c in chunks]), xs), "Streamed x differs"
+    assert np.allclose(np.concatenate([c[2] for c in chunks]), ys), "Streamed y differs"
+    print("  ✓ PASSED")
+
+
+def test_lod_pyramid():
+    """Test LOD pyramid levels and the memory-mapped reader."""
+    print("Running: test_lod_pyramid")
+    
+    lissajous = LissajousGeometry(frequency_x=7.0, frequency_y=5.0, num_points=20000)
+    x, y = lissajous.generate_curve()
+    
+    # RDP: every dropped point lies within tolerance of the simplified polyline
+    tolerance = 1e-3
+    kept = rdp_simplify(x, y, tolerance)
+    assert kept[0] == 0 and kept[-1] == len(x) - 1, "RDP must keep endpoints"
+    assert len(kept) < len(x) // 10, f"RDP kept too many points: {len(kept)}"
+    segment = np.searchsorted(kept, np.arange(len(x)), side='right') - 1
+    segment = np.minimum(segment, len(kept) - 2)
+    x0, y0 = x[kept[segment]], y[kept[segment]]
+    cx, cy = x[kept[segment + 1]] - x0, y[kept[segment + 1]] - y0
+    distance = np.abs((x - x0) * cy - (y - y0) * cx) / np.hypot(cx, cy)
+    assert np.max(distance) <= tolerance, f"RDP deviation too large: {np.max(distance)}"
+    
+    # Retraced curves: the 1:1 diagonal runs 0 → 1 → -1 → 0 along one line,
+    # so its turning points are only kept when distances are measured to
+    # the chord segment rather than its infinite line
+    diagonal = LissajousGeometry(frequency_x=1.0, frequency_y=1.0, phase_shift=0.0, num_points=1001)
+    dx, dy = diagonal.generate_curve()
+    kept = rdp_simplify(dx, dy, tolerance)
+    assert np.isclose(dx[kept].max(), 1.0) and np.isclose(dx[kept].min(), -1.0), \
+        "RDP collapsed the retraced diagonal"
+    
+    # Envelope keeps the exact bounding box
+    envelope = minmax_envelope(x, y, 64)
+    assert len(envelope) <= 4 * 64 + 2, "Envelope too large"
+    assert lissajous.calculate_bounding_box(x[envelope], y[envelope]) == \
+        lissajous.calculate_bounding_box(x, y), "Envelope lost the bounding box"
+    
+    # Round trip through the binary file
+    levels = build_lod_pyramid(x, y)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "curve.lod")
+        write_lod_pyramid(path, levels)
+        pyramid = LODPyramid(path)
+        assert len(pyramid) == len(levels), "Level count mismatch"
+        for i, level in enumerate(levels):
+            lx, ly = pyramid.get_level(i)
+            assert np.array_equal(lx, level['x']) and np.array_equal(ly, level['y']), \
+                f"Level {i} differs after round trip"
+        sizes = [entry['num_points'] for entry in pyramid.levels]
+        assert sizes == sorted(sizes, reverse=True), "Levels not ordered by detail"
+        assert len(pyramid.for_viewport(100)[0]) <= 400, "Viewport level over budget"
+        del lx, ly, pyramid
+    print("  ✓ PASSED")
+
+
+def test_compact_storage_round_trip():
+    """Test the quantized binary format against its stated error bound."""
+    print("Running: test_compact_storage_round_trip")
+    
+    lissajous = LissajousGeometry(amplitude_x=1.5, frequency_x=5.0, frequency_y=4.0)
+    x, y = lissajous.generate_curve()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for bits in (16, 32):
+            path = os.path.join(tmp, f"curve_{bits}.lsjz")
+            info = write_compact_curve(path, lissajous, x, y, bits=bits)
+            header = read_compact_header(path)
+            restored, x2, y2 = read_compact_curve(path)
+            
+            assert header['max_error'] == info['max_error'], "Header error bound mismatch"
+            bound = info['max_error'] * (1 + 1e-9)
+            assert np.max(np.abs(x2 - x)) <= bound, f"x error exceeds bound at {bits} bits"
+            assert np.max(np.abs(y2 - y)) <= bound, f"y error exceeds bound at {bits} bits"
+            assert np.array_equal(restored.t, lissajous.t), "Implied t not restored"
+            assert (restored.A, restored.a, restored.b) == (1.5, 5.0, 4.0), "Parameters not restored"
+        
+        # The 16-bit file is far smaller than the CSV dataset for the same curve
+        generate_csv_datasets(tmp)
+        csv_size = os.path.getsize(os.path.join(tmp, "lissajous_standard_5_4.csv"))
+        compact_size = os.path.getsize(os.path.join(tmp, "curve_16.lsjz"))
+        assert compact_size * 10 <= csv_size, f"Compact file too large: {compact_size} vs {csv_size}"
+    print("  ✓ PASSED")
+
+
+def _parse_svg_path(d):
+    """Decode the 'M x y l dx dy ...' path data written by lissajous_svg."""
+    head, _, tail = d.partition("l")
+    start = np.array(head[1:].split(), dtype=float)
+    steps = np.array(tail.split(), dtype=float).reshape(-1, 2)
+    return np.vstack([start, start + np.cumsum(steps, axis=0)])
+
+
+def test_svg_export():
+    """Test SVG path export accuracy, simplification and sprite sheets."""
+    print("Running: test_svg_export")
+    
+    lissajous = LissajousGeometry(frequency_x=7.0, frequency_y=5.0, num_points=5000)
+    x, y = lissajous.generate_curve()
+    tolerance = 1e-3
+    
+    buffer = io.StringIO()
+    export_svg(buffer, lissajous, x, y, precision=3, tolerance=tolerance)
+    root = ET.fromstring(buffer.getvalue())
+    path = root.find("{http://www.w3.org/2000/svg}path")
+    vertices = _parse_svg_path(path.get("d")) / 1000.0
+    vertices[:, 1] *= -1
+    assert len(vertices) < len(x) // 4, f"Path not simplified: {len(vertices)} vertices"
+    
+    # Every original point lies within tolerance (plus grid rounding) of the path
+    px, py = x[:, None], y[:, None]
+    x0, y0 = vertices[:-1, 0][None, :], vertices[:-1, 1][None, :]
+    cx, cy = np.diff(vertices[:, 0])[None, :], np.diff(vertices[:, 1])[None, :]
+    u = np.clip(((px - x0) * cx + (py - y0) * cy) / (cx**2 + cy**2), 0, 1)
+    distance = np.min(np.hypot(px - x0 - u * cx, py - y0 - u * cy), axis=1)
+    assert np.max(distance) <= tolerance + 1e-3, f"Path deviates: {np.max(distance)}"
+    
+    # Retraced curves keep their turning points
+    diagonal = LissajousGeometry(frequency_x=1.0, frequency_y=1.0, phase_shift=0.0)
+    buffer = io.StringIO()
+    write_svg_path(buffer, *diagonal.generate_curve())
+    d = ET.fromstring(buffer.getvalue()).get("d")
+    assert d == "M0 0l1000 -1000 -2000 2000 1000 -1000", f"Unexpected diagonal path: {d}"
+    
+    # Sprite sheet holds one symbol per configuration
+    buffer = io.StringIO()
+    export_svg_sprite_sheet(buffer, DATASET_CONFIGURATIONS, columns=3)
+    root = ET.fromstring(buffer.getvalue())
+    symbols = root.findall("{http://www.w3.org/2000/svg}symbol")
+    assert len(symbols) == len(DATASET_CONFIGURATIONS), "Missing sprite symbols"
+    assert root.get("width") == "600" and root.get("height") == "400", "Unexpected sheet size"
+    print("  ✓ PASSED")
+
+
+def test_catalogue_queries():
+    """Test catalogue range queries, top-k and incremental extension."""
+    print("Running: test_catalogue_queries")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogue = LissajousCatalogue.build(tmp, max_order=5, phase_steps=8)
+        assert len(catalogue) == len(reduced_ratios(5)) * 8, "Unexpected row count"
+        added = catalogue.extend(7)
+        assert added == len(reduced_ratios(7, 5)) * 8, "Unexpected extension size"
+        assert catalogue.extend(7) == 0, "Re-extending should add nothing"
+        
+        # Reopening sees the same table
+        catalogue = LissajousCatalogue(tmp)
+        columns = {name: np.asarray(values) for name, values in catalogue.columns.items()}
+        
+        # Range query matches a brute-force scan
+        rows = catalogue.query(max_order=6, arc_length=(15, 25), symmetry_score=(0.9, None))
+        expected = np.nonzero((columns['p'] <= 6) & (columns['q'] <= 6) &
+                              (columns['arc_length'] >= 15) & (columns['arc_length'] <= 25) &
+                              (columns['symmetry_score'] >= 0.9))[0]
+        assert len(rows) > 0 and np.array_equal(rows, expected), "Range query mismatch"
+        
+        # Top-k returns the largest values in order
+        top = catalogue.top_k('arc_length', 5, max_order=4)
+        eligible = np.nonzero((columns['p'] <= 4) & (columns['q'] <= 4))[0]
+        best = np.sort(columns['arc_length'][eligible])[::-1][:5]
+        assert np.allclose(columns['arc_length'][top], best), "Top-k mismatch"
+        
+        # Stored metrics agree with LissajousGeometry
+        row = catalogue.rows([len(catalogue) - 1])[0]
+        lissajous = LissajousGeometry(1.0, 1.0, row['p'], row['q'], row['phase_shift'])
+        x, y = lissajous.generate_curve()
+        assert abs(row['symmetry_score'] - lissajous.calculate_symmetry_score(x, y)) < 1e-12, \
+            "Symmetry score mismatch"
+        assert abs(row['arc_length'] - lissajous.calculate_analytic_arc_length()) < 1e-6, \
+            "Arc length mismatch"
+        del catalogue, columns
+    
+    # An extend interrupted after some columns are written leaves the
+    # catalogue unchanged, and re-running it gives the same table as a
+    # fresh build
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogue = LissajousCatalogue.build(os.path.join(tmp, "a"), max_order=4, phase_steps=4)
+        before = {name: np.array(values) for name, values in catalogue.columns.items()}
+        original = LissajousCatalogue._write_column
+        calls = []
+        
+        def crash(*args):
+            calls.append(args[1])
+            if len(calls) == 3:
+                raise OSError("simulated crash")
+            original(*args)
+        
+        LissajousCatalogue._write_column = staticmethod(crash)
+        try:
+            catalogue.extend(6)
+            assert False, "Simulated crash should propagate"
+        except OSError:
+            pass
+        finally:
+            LissajousCatalogue._write_column = staticmethod(original)
+        
+        reopened = LissajousCatalogue(os.path.join(tmp, "a"))
+        assert len(reopened) == len(before['p']), "Interrupted extend changed the row count"
+        for name in before:
+            for table in (reopened.columns, reopened.sorted_values, reopened.sorted_rows):
+                assert len(table[name]) == len(reopened), f"Column {name} out of step"
+            assert np.array_equal(reopened.columns[name], before[name]), f"Column {name} changed"
+        
+        reopened.extend(6)
+        fresh = LissajousCatalogue.build(os.path.join(tmp, "b"), max_order=6, phase_steps=4)
+        assert len(reopened) == len(fresh), "Re-run extend has the wrong row count"
+        for name in before:
+            assert np.array_equal(np.sort(reopened.columns[name]), fresh.sorted_values[name]), \
+                f"Column {name} differs from a fresh build"
+            assert np.array_equal(reopened.columns[name][reopened.sorted_rows[name]],
+                                  reopened.sorted_values[name]), f"Index {name} out of step"
+        generations = [e for e in os.listdir(os.path.join(tmp, "a")) if e.startswith("gen_")]
+        assert len(generations) == 1, f"Stale generations left behind: {generations}"
+        del catalogue, reopened, fresh
+    
+    # Large orders keep every stored arc length converged
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogue = LissajousCatalogue.build(tmp, max_order=40, phase_steps=2)
+        sample = np.arange(0, len(catalogue), 97)
+        p, q, phase, stored = (np.asarray(catalogue.columns[name])[sample]
+                               for name in ('p', 'q', 'phase_shift', 'arc_length'))
+        reference = analytic_arc_length(1.0, 1.0, p, q, phase, tolerance=1e-12)
+        assert np.max(np.abs(stored - reference) / reference) < 1e-7, \
+            "Catalogue arc lengths not converged"
+        del catalogue
+    print("  ✓ PASSED")
+
+
+def test_sharded_sweep_resume_and_merge():
+    """Test sharded sweeps: host partitioning, resume and merge."""
+    print("Running: test_sharded_sweep_resume_and_merge")
+    
+    grid = {'amplitude_x': [1.0, 2.0], 'amplitude_y': [1.0],
+            'frequency_x': [1, 2, 3], 'frequency_y': [1, 2, 3, 4],
+            'phase_shift': np.linspace(0, np.pi, 5)}
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = plan_sweep(tmp, grid, shard_size=25, num_points=200)
+        assert manifest['total'] == 120 and manifest['num_shards'] == 5, "Unexpected plan"
+        assert plan_sweep(tmp, grid, shard_size=25, num_points=200) == manifest, \
+            "Re-planning the same sweep should be accepted"
+        try:
+            plan_sweep(tmp, grid, shard_size=30, num_points=200)
+            assert False, "A different plan should be rejected"
+        except ValueError:
+            pass
+        
+        # Host 0 of 2 takes the even shards; a second run has nothing to do
+        assert run_sweep(tmp, workers=2, host_index=0, num_hosts=2) == [0, 2, 4], \
+            "Host 0 should compute the even shards"
+        assert run_sweep(tmp, workers=2, host_index=0, num_hosts=2) == [], \
+            "Finished shards should be skipped"
+        assert pending_shards(tmp) == [1, 3], "Odd shards should still be pending"
+        try:
+            merge_shards(tmp)
+            assert False, "Merging an unfinished sweep should fail"
+        except RuntimeError:
+            pass
+        
+        assert run_sweep(tmp, workers=1) == [1, 3], "Resume should compute the rest"
+        table = merge_shards(tmp)
+        assert np.array_equal(table['config_index'], np.arange(120)), "Rows out of order"
+        
+        # Rows match the metrics of LissajousGeometry for their parameters
+        for i in (0, 37, 119):
+            row = table[i]
+            lissajous = LissajousGeometry(row['amplitude_x'], row['amplitude_y'],
+                                          row['frequency_x'], row['frequency_y'],
+                                          row['phase_shift'], num_points=200)
+            x, y = lissajous.generate_curve()
+            assert abs(row['arc_length'] - lissajous.calculate_arc_length(x, y)) < 1e-9, \
+                "Arc length mismatch"
+            assert abs(row['symmetry_score'] - lissajous.calculate_symmetry_score(x, y)) < 1e-12, \
+                "Symmetry score mismatch"
+        del table
+    print("  ✓ PASSED")
+
+
+def test_symmetry_detection():
+    """Test FFT symmetry groups, start independence and brute-force agreement."""
+    print("Running: test_symmetry_detection")
+    
+    cases = [
+        ((3, 2, 0.0), 'D2'),          # classic 3:2 figure, mirror in both axes
+        ((3, 2, 0.3), 'D1'),          # generic phase keeps only x → -x
+        ((5, 3, 1.234), 'C2'),        # odd:odd, point symmetric only
+        ((1, 1, 0.5), 'D2'),          # ellipse with diagonal axes
+        ((1, 1, np.pi / 2), 'O(2)'),  # circle
+    ]
+    for (a, b, phase), group in cases:
+        lissajous = LissajousGeometry(1.0, 1.0, a, b, phase, num_points=1001)
+        x, y = lissajous.generate_curve()
+        result = lissajous.calculate_symmetry_group(x, y)
+        assert result['group'] == group, f"{a}:{b} δ={phase}: {result['group']} != {group}"
+    
+    # 3:2 with δ = 0 has axes along x and y and a half-turn rotation
+    lissajous = LissajousGeometry(1.0, 1.0, 3, 2, 0.0, num_points=1001)
+    x, y = lissajous.generate_curve()
+    result = analyze_symmetry(x, y)
+    assert np.allclose(np.sin(result['reflection_axes']), [0, 1], atol=1e-9), "Wrong axes"
+    assert np.allclose(result['rotation_angles'], [np.pi]), "Wrong rotation"
+    
+    # Independent of the sampling start, unlike the flip-based score
+    x, y = x[:-1], y[:-1]
+    for k in (37, 250):
+        shifted = analyze_symmetry(np.roll(x, k), np.roll(y, k))
+        assert shifted['group'] == result['group'], "Result depends on sampling start"
+    
+    # A threefold figure with axes rotated by 0.3 rad
+    t = np.linspace(0, 2 * np.pi, 999, endpoint=False)
+    z = np.exp(0.3j) * (np.exp(1j * t) + 0.3 * np.exp(-2j * t))
+    result = analyze_symmetry(z.real, z.imag)
+    assert result['group'] == 'D3' and result['rotation_order'] == 3, "Expected D3"
+    assert np.allclose(result['reflection_axes'], 0.3 + np.arange(3) * np.pi / 3), "Wrong axes"
+    
+    # Correlations equal an O(n²) brute-force shift search
+    t = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+    z = np.sin(3 * t + 0.7) + 1j * np.sin(2 * t)
+    z = z - z.mean()
+    energy = np.vdot(z, z).real
+    correlations = symmetry_correlations(z.real, z.imag, upsample=1)
+    brute = {
+        'rotation': [np.vdot(z, np.roll(z, -s)) for s in range(64)],
+        'reflection': [np.sum(z * np.roll(z, -s)) for s in range(64)],
+        'rotation_reversed': [np.vdot(z, np.roll(z[::-1], s + 1)) for s in range(64)],
+        'reflection_reversed': [np.sum(z * np.roll(z[::-1], s + 1)) for s in range(64)],
+    }
+    for name, values in brute.items():
+        assert np.allclose(correlations[name][0], np.array(values) / energy, atol=1e-12), \
+            f"{name} correlation mismatch"
+    
+    # Batches give the same answers as single curves
+    phases = np.array([0.0, 0.3, 1.0])
+    t = np.linspace(0, 2 * np.pi, 512, endpoint=False)
+    X = np.sin(3 * t + phases[:, None])
+    Y = np.broadcast_to(np.sin(2 * t), X.shape)
+    batch = analyze_symmetry(X, Y, batch_size=2)
+    for i in range(len(phases)):
+        assert batch[i]['group'] == analyze_symmetry(X[i], Y[i])['group'], "Batch mismatch"
+    print("  ✓ PASSED")
+
+
+def test_spectral_analysis():
+    """Test batched spectra, harmonic extraction and ratio estimates."""
+    print("Running: test_spectral_analysis")
+    
+    # Integer frequencies fall exactly on bins
+    lissajous = LissajousGeometry(1.5, 0.7, 5, 4, 0.4)
+    x, y = lissajous.generate_curve()
+    frequencies, magnitudes = magnitude_spectrum(x, window='rect')
+    assert frequencies[np.argmax(magnitudes)] == 5, "Peak not at frequency 5"
+    assert abs(np.max(magnitudes) - 1.5) < 1e-9, "Peak height should equal the amplitude"
+    estimate = estimate_frequency_ratios(x, y)
+    assert (estimate['p'], estimate['q']) == (5, 4), "Ratio should be 5:4"
+    assert ValidationMetrics.validate_spectral_frequencies(x, y, 5.0, 4.0), "5:4 should validate"
+    assert not ValidationMetrics.validate_spectral_frequencies(x, y, 5.0, 3.0), "5:3 should fail"
+    
+    # Batches of non-integer frequencies are resolved between bins
+    rng = np.random.default_rng(3)
+    freq_x = rng.uniform(3, 20, 200)
+    freq_y = rng.uniform(3, 20, 200)
+    t = np.linspace(0, 2 * np.pi, 1000)
+    X = 2.0 * np.sin(freq_x[:, None] * t + rng.uniform(0, np.pi, (200, 1)))
+    Y = np.sin(freq_y[:, None] * t)
+    estimate = estimate_frequency_ratios(X, Y, batch_size=64)
+    assert np.max(np.abs(estimate['frequency_x'] - freq_x)) < 0.01, "x frequency error too large"
+    assert np.max(np.abs(estimate['frequency_y'] - freq_y)) < 0.01, "y frequency error too large"
+    harmonics = dominant_harmonics(X, num_harmonics=2)
+    assert harmonics['frequency'].shape == (200, 2), "Wrong harmonic shape"
+    assert np.allclose(harmonics['amplitude'][:, 0], 2.0, atol=0.01), "Amplitude error too large"
+    
+    # Two-tone signal: both harmonics found, strongest first
+    signal = np.sin(3 * t) + 0.5 * np.sin(11 * t)
+    harmonics = dominant_harmonics(signal, num_harmonics=2)
+    assert np.allclose(harmonics['frequency'], [3, 11]), "Harmonic frequencies wrong"
+    assert np.allclose(harmonics['amplitude'], [1.0, 0.5]), "Harmonic amplitudes wrong"
+    print("  ✓ PASSED")
+
+
+def test_inverse_fitting():
+    """Test recovery of model parameters from shifted, noisy traces."""
+    print("Running: test_inverse_fitting")
+    
+    # A clean curve from generate_curve is recovered exactly
+    lissajous = LissajousGeometry(1.5, 0.8, 3, 2, 0.7)
+    x, y = lissajous.generate_curve()
+    fit = fit_lissajous(x, y)
+    for name, expected in (('amplitude_x', 1.5), ('amplitude_y', 0.8), ('frequency_x', 3),
+                           ('frequency_y', 2), ('phase_shift', 0.7)):
+        assert abs(fit[name] - expected) < 1e-9, f"{name} not recovered"
+    assert fit['converged'] and fit['within_tolerance'], "Clean fit should pass"
+    
+    # Traces that start at an arbitrary model time, with measurement noise
+    rng = np.random.default_rng(5)
+    m, n = 50, 800
+    params = np.column_stack([rng.uniform(0.5, 2, m), rng.uniform(0.5, 2, m),
+                              rng.uniform(1, 9, m), rng.uniform(1, 9, m),
+                              rng.uniform(0, 2 * np.pi, m)])
+    starts = rng.uniform(0, 3, m)
+    t = np.linspace(0, 2 * np.pi, n)
+    X, Y = np.empty((m, n)), np.empty((m, n))
+    for i, (A, B, a, b, delta) in enumerate(params):
+        X[i], Y[i] = LissajousGeometry(A, B, a, b, delta).evaluate(t + starts[i])
+    noise = 0.002
+    fit = fit_lissajous(X + noise * rng.standard_normal((m, n)),
+                        Y + noise * rng.standard_normal((m, n)), t, batch_size=16)
+    assert fit['converged'].all(), "All fits should converge"
+    assert np.allclose(fit['frequency_x'], params[:, 2], atol=1e-3), "x frequency error"
+    assert np.allclose(fit['frequency_y'], params[:, 3], atol=1e-3), "y frequency error"
+    assert np.allclose(fit['amplitude_x'], params[:, 0], atol=2e-3), "x amplitude error"
+    assert np.all(fit['residual_rms'] < 2 * noise), "Residual above the noise level"
+    
+    # The reported phase and time offset reproduce the trace via the model
+    i = 7
+    model = LissajousGeometry(fit['amplitude_x'][i], fit['amplitude_y'][i],
+                              fit['frequency_x'][i], fit['frequency_y'][i], fit['phase_shift'][i])
+    mx, my = model.evaluate(t + fit['t_offset'][i])
+    assert np.max(np.hypot(mx - X[i], my - Y[i])) < ValidationMetrics.AMPLITUDE_TOLERANCE, \
+        "Model curve does not match the trace"
+    
+    # Noise at the tolerance level passes; a distorted trace does not
+    noisy = fit_lissajous(X + 0.01 * rng.standard_normal((m, n)),
+                          Y + 0.01 * rng.standard_normal((m, n)), t)
+    assert noisy['within_tolerance'].all(), "Correct fits to noisy traces should pass"
+    assert np.allclose(noisy['residual_noise'], 0.01 * np.sqrt(2), rtol=0.15), "Noise estimate off"
+    distorted = fit_lissajous(X + 0.05 * np.sin(3 * params[:, 2, None] * (t + starts[:, None])), Y, t)
+    assert not distorted['within_tolerance'].any(), "Distorted traces should fail"
+    print("  ✓ PASSED")
+
+
+def _http_get(port, path):
+    """Blocking GET returning (status, X-Cache header, body)."""
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}") as response:
+            return response.status, response.headers['X-Cache'], response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers['X-Cache'], e.read()
+
+
+def _http_raw(port, request):
+    """Send raw request bytes and return the response status code."""
+    import socket
+    with socket.create_connection(("127.0.0.1", port)) as sock:
+        sock.sendall(request)
+        return int(sock.makefile('rb').readline().split()[1])
+
+
+def test_http_service():
+    """Test service endpoints, cache normalization and the load generator."""
+    print("Running: test_http_service")
+    
+    # Resonant Alphabet law: A → f0/2, Z → 2·f0 for R = 12
+    assert np.allclose(letter_frequencies("Az"), [220.0, 880.0]), "Letter frequencies wrong"
+    
+    async def scenario():
+        service = LissajousService(workers=0, cache_size=16)
+        await service.start(port=0)
+        loop = asyncio.get_running_loop()
+        get = lambda path: loop.run_in_executor(None, _http_get, service.port, path)
+        try:
+            status, cache, body = await get("/curve?a=3&b=2&delta=0.5&n=50&format=npy")
+            assert (status, cache) == (200, 'MISS'), "First request should miss"
+            points = np.load(io.BytesIO(body))
+            x, y = LissajousGeometry(1.0, 1.0, 3, 2, 0.5, 50).generate_curve()
+            assert np.array_equal(points, np.column_stack([x, y])), "npy curve mismatch"
+            
+            # Same parameters in another order and spelling hit the cache
+            status, cache, _ = await get("/curve?n=50&format=npy&delta=0.50&b=2.0&a=3")
+            assert (status, cache) == (200, 'HIT'), "Normalized query should hit the cache"
+            
+            status, _, body = await get("/glyph?text=Hi&n=64&precision=12")
+            glyph = json.loads(body)
+            _, gx, gy = glyph_curve("Hi", 64)
+            assert np.allclose(glyph['x'], gx, atol=1e-12) and np.allclose(glyph['y'], gy, atol=1e-12), \
+                "Glyph mismatch"
+            
+            # Precision does not apply to binary output, so it is not part of the key
+            status, cache, _ = await get("/curve?a=3&b=2&delta=0.5&n=50&format=npy&precision=2")
+            assert (status, cache) == (200, 'HIT'), "npy precision should not split the cache"
+            
+            # Repeated letters share one voice; long glyphs are built in blocks
+            _, lx, ly = glyph_curve("AB" * 128, 200_000)
+            _, sx, sy = glyph_curve("AB", 200_000)
+            assert np.allclose(lx, sx) and np.allclose(ly, sy), "Blocked glyph mismatch"
+            try:
+                glyph_curve("AB", 10, f0=0.0)
+                assert False, "f0 = 0 should raise"
+            except ValueError:
+                pass
+            
+            # Oversized request heads are answered, not dropped
+            raw = lambda data: loop.run_in_executor(None, _http_raw, service.port, data)
+            assert await raw(b"GET /" + b"a" * 10000 + b" HTTP/1.1\r\n\r\n") == 400, \
+                "Long request line should be 400"
+            assert await raw(b"GET /health HTTP/1.1\r\nX: " + b"a" * 10000 + b"\r\n\r\n") == 431, \
+                "Long header should be 431"
+            assert await raw(b"GET /health HTTP/1.1\r\n" + b"X: 1\r\n" * 200 + b"\r\n") == 431, \
+                "Too many headers should be 431"
+            assert await raw(b"GET /health HTTP/1.1\r\nContent-Length: 1000000000\r\n\r\n") == 413, \
+                "Oversized body should be 413"
+            assert await raw(b"GET /health HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n") == 400, \
+                "Chunked body should be 400"
+            assert await raw(b"GET /health HTTP/1.1\r\nContent-Length: 5\r\n\r\nhello") == 200, \
+                "Small bodies should be skipped"
+            
+            # Out-of-range parameters are rejected before any work is done
+            for path in ("/metrics?a=1e9", "/curve?b=-2000", "/glyph?text=A&f0=0",
+                         "/glyph?text=A&cycles=0", "/curve?A=1e300", "/curve?n=1"):
+                assert (await get(path))[0] == 400, f"{path} should be rejected"
+            
+            status, _, body = await get("/metrics?a=3&b=2&delta=0")
+            metrics = json.loads(body)
+            assert metrics['symmetry_group'] == 'D2', "Metrics should include the symmetry group"
+            
+            assert (await get("/curve?n=abc"))[0] == 400, "Bad parameter should be rejected"
+            assert (await get("/unknown"))[0] == 404, "Unknown endpoint should be 404"
+            
+            result = await run_load_test(port=service.port, concurrency=4, requests=200,
+                                         paths=["/curve?a=3&b=2&delta=0.5&n=50&format=npy"])
+            assert result['requests'] == 200 and result['errors'] == 0, "Load test failed"
+            assert service.cache.hits >= 200, "Repeated shapes should be served from cache"
+        finally:
+            await service.close()
+    
+    async def broken_pool():
+        # A killed worker breaks the pool; the service replaces it and retries
+        service = LissajousService(workers=1, cache_size=0)
+        await service.start(port=0)
+        loop = asyncio.get_running_loop()
+        get = lambda path: loop.run_in_executor(None, _http_get, service.port, path)
+        try:
+            assert (await get("/curve?n=10"))[0] == 200, "Pool request failed"
+            for process in list(service._executor._processes.values()):
+                process.kill()
+                process.join()
+            assert (await get("/curve?n=10"))[0] == 200, "Broken pool should be replaced"
+        finally:
+            await service.close()
+    
+    asyncio.run(scenario())
+    asyncio.run(broken_pool())
+    print("  ✓ PASSED")
+
+
+def test_text_sonification():
+    """Test block rendering, queue output and the WAV and socket sinks."""
+    print("Running: test_text_sonification")
+    
+    # One letter: left channel at f(A) = 220 Hz, right at its 2nd harmonic
+    sonifier = TextSonifier(sample_rate=48000, block_size=480, note_seconds=0.2)
+    sonifier.feed("a")
+    blocks = []
+    while sonifier.pending():
+        blocks.append(sonifier.render_block())
+    assert all(b.shape == (480, 2) and b.dtype == np.int16 for b in blocks), "Bad block format"
+    pcm = np.concatenate(blocks).astype(float)
+    peaks = np.argmax(np.abs(np.fft.rfft(pcm, axis=0)), axis=0) * 48000 / len(pcm)
+    assert np.allclose(peaks, [220.0, 440.0], atol=48000 / len(pcm)), "Wrong channel frequencies"
+    
+    # Block tables match direct per-sample synthesis of the same voice
+    n = np.arange(len(pcm))
+    envelope = sonifier._envelope[480:480 + len(pcm)]
+    expected = 0.25 * envelope * np.sin(2 * np.pi * 220.0 * n / 48000 + np.pi / 2)
+    assert np.max(np.abs(pcm[:, 0] / 32767 - expected)) < 1e-3, "Oscillator tables drift"
+    
+    # Polyphony cap drops the oldest voices
+    crowded = TextSonifier(max_voices=4, note_seconds=0.5, letter_seconds=0.001)
+    crowded.feed("ABCDEFGHIJ")
+    for _ in range(20):
+        crowded.render_block()
+    assert crowded.stats['peak_voices'] == 4 and crowded.stats['dropped_voices'] == 6, \
+        "Voice cap not enforced"
+    
+    async def scenario(directory):
+        path = os.path.join(directory, "hi.wav")
+        queue = asyncio.Queue(maxsize=2)
+        stats, frames = await asyncio.gather(
+            TextSonifier().run(iterate_text("HI"), queue, realtime=False),
+            write_wav(queue, path))
+        assert frames == stats['blocks'] * 512, "WAV frame count mismatch"
+        assert stats['latency_bound_ms'] == 3 * 512 / 48000 * 1000, "Latency bound wrong"
+        with wave.open(path, 'rb') as f:
+            assert (f.getnchannels(), f.getframerate(), f.getnframes()) == (2, 48000, frames)
+        
+        # Real-time pacing into a local socket
+        received = bytearray()
+        
+        async def receive(reader, writer):
+            received.extend(await reader.read())
+            writer.close()
+        
+        server = await asyncio.start_server(receive, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        queue = asyncio.Queue(maxsize=4)
+        start = time.perf_counter()
+        stats, frames = await asyncio.gather(
+            TextSonifier(note_seconds=0.1).run(iterate_text("OK"), queue, realtime=True),
+            send_to_socket(queue, port=port))
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0.05)
+        server.close()
+        await server.wait_closed()
+        assert len(received) == frames * 4, "Socket PCM byte count mismatch"
+        assert elapsed >= stats['audio_seconds'] - 2 * 512 / 48000, "Real-time pacing not applied"
+        assert stats['realtime_factor'] > 1, "Renderer slower than real time"
+        
+        # A failing source ends the stream and surfaces its error
+        async def failing_source():
+            yield "AB"
+            raise OSError("source closed")
+        
+        queue = asyncio.Queue(maxsize=2)
+        results = await asyncio.wait_for(asyncio.gather(
+            TextSonifier(note_seconds=0.05).run(failing_source(), queue, realtime=False),
+            write_wav(queue, os.path.join(directory, "ab.wav")),
+            return_exceptions=True), timeout=10)
+        assert isinstance(results[0], OSError), "Source error should be re-raised"
+        assert results[1] > 0, "Text fed before the error should still be written"
+    
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(scenario(directory))
+    print("  ✓ PASSED")
+
+
+def test_rotor_meshes():
+    """Test 3D rotor evaluation, tube and revolution meshes, PLY and STL output."""
+    print("Running: test_rotor_meshes")
+    
+    rotor = LissajousRotor(frequency_x=3, frequency_y=2, frequency_z=5, num_points=200)
+    x, y, z = rotor.generate_curve_3d()
+    x2, y2 = LissajousGeometry(1.0, 1.0, 3, 2, np.pi/2, 200).generate_curve()
+    assert np.array_equal(x, x2) and np.array_equal(y, y2), "x/y channels differ from 2D curve"
+    assert np.allclose(z, np.sin(5 * rotor.t)), "z channel wrong"
+    assert rotor.is_closed, "Integer frequencies should give a closed curve"
+    
+    # Tube: every ring lies at the radius from the curve, triangles face outward
+    rows, sides, radius = 300, 8, 0.01
+    mesh = tube_mesh(rotor, radius, rows=rows, sides=sides)
+    vertices, faces = mesh.vertices(), mesh.faces()
+    assert mesh.num_faces == 2 * rows * sides and faces.max() == rows * sides - 1, "Bad tube topology"
+    t = np.linspace(0, 2 * np.pi, rows, endpoint=False)
+    center = np.stack(rotor.evaluate_3d(t), axis=-1)
+    distance = np.linalg.norm(vertices.reshape(rows, sides, 3) - center[:, None], axis=-1)
+    assert np.allclose(distance, radius), "Tube vertices off the radius"
+    corners = vertices[faces]
+    normal = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    outward = corners.mean(axis=1) - center[faces[:, 0] // sides]
+    assert np.all(np.sum(normal * outward, axis=-1) > 0), "Tube triangles not outward"
+    
+    # Every edge of the closed tube is shared by exactly two triangles
+    edges = np.sort(np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    assert np.all(counts == 2), "Closed tube should be watertight"
+    
+    # Planar rotor: the rotation-minimizing frame does not flip at inflections
+    planar = LissajousRotor(amplitude_z=0.0)
+    for rows in (397, 1237):
+        tube = tube_mesh(planar, 0.01, rows=rows, sides=sides)
+        ring = tube.vertices().reshape(rows, sides, 3)
+        s = np.linspace(0, 2 * np.pi, rows, endpoint=False)
+        ring_center = np.stack(planar.evaluate_3d(s), axis=-1)
+        velocity, _ = planar.evaluate_derivatives_3d(np.roll(s, -1))
+        ring_tangent = velocity / np.linalg.norm(velocity, axis=-1, keepdims=True)
+        offset = (ring[:, 0] - ring_center) / 0.01
+        carried = offset - np.sum(offset * ring_tangent, -1, keepdims=True) * ring_tangent
+        carried /= np.linalg.norm(carried, axis=-1, keepdims=True)
+        twist = np.degrees(np.arccos(np.clip(np.sum(carried * np.roll(offset, -1, axis=0), -1), -1, 1)))
+        assert twist.max() < 1.0, f"Tube rings twist by {twist.max():.2f}° at rows={rows}"
+        ring_corners = ring.reshape(-1, 3)[tube.faces()]
+        ring_normal = np.cross(ring_corners[:, 1] - ring_corners[:, 0], ring_corners[:, 2] - ring_corners[:, 0])
+        ring_outward = ring_corners.mean(axis=1) - ring_center[tube.faces()[:, 0] // sides]
+        assert np.all(np.sum(ring_normal * ring_outward, axis=-1) > 0), "Planar tube triangles not outward"
+    
+    # Revolution of a planar profile about z keeps each ring's radius and height
+    planar = LissajousRotor(amplitude_z=0.0, num_points=50)
+    ring = revolution_mesh(planar, segments=12, closed=False).vertices().reshape(50, 12, 3)
+    px, py = planar.generate_curve()
+    assert np.allclose(np.hypot(ring[..., 0], ring[..., 1]), np.hypot(px, py)[:, None]), \
+        "Revolution radius wrong"
+    assert ring.shape == (50, 12, 3) and np.allclose(ring[..., 2], 0.0), "Revolution height wrong"
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ply_path = os.path.join(tmpdir, "rotor.ply")
+        result = write_ply(ply_path, mesh, chunk_rows=7)
+        assert os.path.getsize(ply_path) == result['bytes'], "PLY size mismatch"
+        ply_vertices, ply_faces = read_ply(ply_path)
+        assert np.allclose(ply_vertices, vertices, atol=1e-6), "PLY vertices mismatch"
+        assert np.array_equal(ply_faces, faces), "PLY faces mismatch"
+        del ply_vertices, ply_faces
+        
+        stl_path = os.path.join(tmpdir, "rotor.stl")
+        result = write_stl(stl_path, mesh, chunk_rows=7)
+        triangles = np.fromfile(stl_path, dtype=STL_TRIANGLE_DTYPE, offset=84)
+        assert len(triangles) == mesh.num_faces, "STL triangle count mismatch"
+        assert np.allclose(triangles['vertices'], corners, atol=1e-6), "STL vertices mismatch"
+        unit = normal / np.linalg.norm(normal, axis=-1, keepdims=True)
+        assert np.allclose(triangles['normal'], unit, atol=1e-5), "STL normals mismatch"
+    
+    print("  ✓ PASSED")
+
+
+def _check_backend_routing(name):
+    """Catalogue and sweep metrics computed through backend ``name`` match 'numpy'."""
+    p, q = np.array([3.0, 5.0, 7.0]), np.array([2.0, 4.0, 3.0])
+    phase = np.array([0.0, 0.5, 1.5])
+    expected = compute_metrics(p, q, phase, num_points=300, backend='numpy')
+    actual = compute_metrics(p, q, phase, num_points=300, backend=name)
+    for column in expected:
+        assert np.allclose(actual[column], expected[column], rtol=1e-12, atol=1e-12), \
+            f"{name} catalogue {column} mismatch"
+    
+    grid = {'amplitude_x': [1.0], 'amplitude_y': [1.0, 2.0], 'frequency_x': [1, 3],
+            'frequency_y': [2, 5], 'phase_shift': np.linspace(0, np.pi, 3)}
+    tables = []
+    for backend in ('numpy', name):
+        with tempfile.TemporaryDirectory() as tmp:
+            plan_sweep(tmp, grid, shard_size=10, num_points=150)
+            run_sweep(tmp, workers=1, backend=backend)
+            tables.append(merge_shards(tmp))
+    for column in tables[0].dtype.names:
+        assert np.allclose(tables[1][column], tables[0][column], rtol=1e-12, atol=1e-12), \
+            f"{name} sweep {column} mismatch"
+
+
+def test_kernel_backends():
+    """Test the backend registry and kernel parity against the NumPy reference."""
+    print("Running: test_kernel_backends")
+    
+    assert 'numpy' in available_backends(), "Reference backend missing"
+    assert get_backend().name in available_backends(), "Default backend not registered"
+    try:
+        get_backend('no-such-backend')
+        assert False, "Unknown backend should raise"
+    except ValueError:
+        pass
+    previous = os.environ.get('LISSAJOUS_BACKEND')
+    os.environ['LISSAJOUS_BACKEND'] = 'numpy'
+    try:
+        assert get_backend().name == 'numpy', "LISSAJOUS_BACKEND not honored"
+    finally:
+        if previous is None:
+            del os.environ['LISSAJOUS_BACKEND']
+        else:
+            os.environ['LISSAJOUS_BACKEND'] = previous
+    
+    reference = get_backend('numpy')
+    rng = np.random.default_rng(7)
+    a = rng.integers(1, 8, 12).astype(float)
+    b = rng.integers(1, 8, 12).astype(float)
+    delta = rng.uniform(0, np.pi, 12)
+    amplitude = np.r_[rng.uniform(0.5, 2.0, 11), 0.0]
+    x, y = reference.generate_curves(amplitude, 1.5, a, b, delta, 101)
+    x1, y1 = LissajousGeometry(amplitude[0], 1.5, a[0], b[0], delta[0], 101).generate_curve()
+    assert np.array_equal(x[0], x1) and np.array_equal(y[0], y1), "Reference curves mismatch"
+    
+    frequencies = rng.uniform(200.0, 900.0, 20)
+    starts = np.r_[-40, rng.integers(0, 3000, 19)]
+    envelope = np.hanning(500)
+    
+    # Every registered backend, plus the loop kernels run uncompiled
+    candidates = [get_backend(name) for name in available_backends()]
+    candidates.append(_loop_backend('loop', lambda kernel: kernel))
+    for backend in candidates:
+        for n in (100, 101):
+            expected = reference.batch_metrics(amplitude, 1.5, a, b, delta, n)
+            actual = backend.batch_metrics(amplitude, 1.5, a, b, delta, n)
+            for name in expected:
+                assert np.allclose(actual[name], expected[name], rtol=1e-12, atol=1e-12), \
+                    f"{backend.name} batch_metrics {name} mismatch"
+        
+        xb, yb = backend.generate_curves(amplitude, 1.5, a, b, delta, 101)
+        assert np.allclose(xb, x, atol=1e-14) and np.allclose(yb, y, atol=1e-14), \
+            f"{backend.name} generate_curves mismatch"
+        
+        for expected, actual in zip(reference.resample_uniform(x, y, 64),
+                                    backend.resample_uniform(x, y, 64)):
+            assert np.allclose(actual, expected, atol=1e-10), f"{backend.name} resample mismatch"
+        
+        expected = reference.overlap_add(frequencies, starts, envelope, 3300, 48000.0, (1, 2), 0.3)
+        actual = backend.overlap_add(frequencies, starts, envelope, 3300, 48000.0, (1, 2), 0.3)
+        assert np.allclose(actual, expected, atol=1e-12), f"{backend.name} overlap_add mismatch"
+    
+    # The catalogue and the sweep take their metrics from the chosen backend
+    register_backend(candidates[-1])
+    try:
+        _check_backend_routing('loop')
+    finally:
+        del BACKENDS['loop']
+    
+    # Offline overlap-add rendering reproduces the streamed blocks
+    sonifier = TextSonifier()
+    offline = sonifier.render_offline("HI THERE", backend='numpy')
+    sonifier.feed("HI THERE")
+    blocks = []
+    while sonifier.pending():
+        blocks.append(sonifier.render_block())
+    streamed = np.concatenate(blocks)
+    assert np.abs(streamed[:len(offline)].astype(int) - offline).max() <= 1, "Offline render mismatch"
+    assert not np.any(streamed[len(offline):]), "Streamed tail should be silent"
+    
+    timings = benchmark_backends(num_curves=20, num_points=64, resample_points=32,
+                                 num_grains=4, repeats=1, backends=['numpy'])
+    assert set(timings['numpy']) == set(KERNELS), "Benchmark should time every kernel"
+    print("  ✓ PASSED")
+
+
+def test_numba_backend():
+    """Test the compiled numba kernels, including uneven per-thread row blocks."""
+    print("Running: test_numba_backend")
+    try:
+        import numba
+    except ImportError:
+        # Reported as a skip by pytest and by run_all_tests
+        raise unittest.SkipTest("numba is not installed")
+    
+    backend, reference = get_backend('numba'), get_backend('numpy')
+    rng = np.random.default_rng(11)
+    for rows in (1, numba.get_num_threads() + 1, 37):
+        a = rng.integers(1, 8, rows).astype(float)
+        b = rng.integers(1, 8, rows).astype(float)
+        delta = rng.uniform(0, np.pi, rows)
+        x, y = reference.generate_curves(1.0, 1.0, a, b, delta, 257)
+        for expected, actual in zip(reference.resample_uniform(x, y, 100),
+                                    backend.resample_uniform(x, y, 100)):
+            assert np.allclose(actual, expected, atol=1e-10), f"Resample mismatch for {rows} rows"
+        expected = reference.batch_metrics(1.0, 1.0, a, b, delta, 257)
+        actual = backend.batch_metrics(1.0, 1.0, a, b, delta, 257)
+        for name in expected:
+            assert np.allclose(actual[name], expected[name], rtol=1e-12, atol=1e-12), \
+                f"batch_metrics {name} mismatch for {rows} rows"
+    
+    _check_backend_routing('numba')
+    print("  ✓ PASSED")
+
+
 def run_all_tests():
     """Run all unit tests."""
     print("=" * 60)
@@ -211,16 +1199,36 @@ def run_all_tests():
         test_validation_metrics_amplitude,
         test_validation_metrics_smoothness,
         test_frequency_ratio_effect,
+        test_adaptive_sampling_tolerance,
+        test_analytic_arc_length,
+        test_uniform_arc_length_resampling,
+        test_lod_pyramid,
+        test_compact_storage_round_trip,
+        test_svg_export,
+        test_catalogue_queries,
+        test_sharded_sweep_resume_and_merge,
+        test_symmetry_detection,
+        test_spectral_analysis,
+        test_inverse_fitting,
+        test_http_service,
+        test_text_sonification,
+        test_rotor_meshes,
+        test_kernel_backends,
+        test_numba_backend,
     ]
     
     passed = 0
     failed = 0
+    skipped = 0
     errors = []
     
     for test in tests:
         try:
             test()
             passed += 1
+        except unittest.SkipTest as e:
+            skipped += 1
+            print(f"  - SKIPPED: {e}")
         except AssertionError as e:
             failed += 1
             errors.append((test.__name__, str(e)))
@@ -235,6 +1243,7 @@ def run_all_tests():
     print(f"TEST RESULTS")
     print(f"Passed: {passed}/{len(tests)}")
     print(f"Failed: {failed}/{len(tests)}")
+    print(f"Skipped: {skipped}/{len(tests)}")
     print("=" * 60)
     
     if errors:
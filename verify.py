@@ -14,8 +14,13 @@ import numpy as np
 import csv
 import os
 import sys
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional, Union
 import json
+import warnings
+
+from lissajous_lod import build_lod_pyramid, write_lod_pyramid
+from lissajous_spectral import validate_frequencies
+from lissajous_symmetry import analyze_symmetry
 
 
 class LissajousGeometry:
@@ -65,7 +70,125 @@ class LissajousGeometry:
         x = self.A * np.sin(self.a * self.t + self.delta)
         y = self.B * np.sin(self.b * self.t)
         return x, y
-    
+
+    def evaluate(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the curve at arbitrary parameter values.
+
+        Args:
+            t: Parameter values
+
+        Returns:
+            Tuple of (x, y) numpy arrays
+        """
+        x = self.A * np.sin(self.a * t + self.delta)
+        y = self.B * np.sin(self.b * t)
+        return x, y
+
+    def evaluate_derivatives(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray,
+                                                            np.ndarray, np.ndarray]:
+        """
+        Evaluate the analytic first and second derivatives of the curve.
+
+        Args:
+            t: Parameter values
+
+        Returns:
+            Tuple of (dx/dt, dy/dt, d²x/dt², d²y/dt²) numpy arrays
+        """
+        phase_x = self.a * t + self.delta
+        phase_y = self.b * t
+        dx = self.A * self.a * np.cos(phase_x)
+        dy = self.B * self.b * np.cos(phase_y)
+        ddx = -self.A * self.a**2 * np.sin(phase_x)
+        ddy = -self.B * self.b**2 * np.sin(phase_y)
+        return dx, dy, ddx, ddy
+
+    def _chord_deviation(self, t0: np.ndarray, t1: np.ndarray,
+                         x0: np.ndarray, y0: np.ndarray,
+                         x1: np.ndarray, y1: np.ndarray) -> np.ndarray:
+        """
+        Estimate the maximum distance between each curve segment and its chord.
+
+        Combines the exact offsets at the quarter points and midpoint with
+        the second-order estimate h²/8 · |r''(t_mid)·n|, where n is the chord
+        normal, so S-shaped segments whose midpoint happens to sit on the
+        chord are not mistaken for flat runs.
+        """
+        cx = x1 - x0
+        cy = y1 - y0
+        chord = np.hypot(cx, cy)
+        safe = np.where(chord > 0, chord, 1.0)
+        nx = -cy / safe
+        ny = cx / safe
+
+        h = t1 - t0
+        offset = np.zeros_like(h)
+        for fraction in (0.25, 0.5, 0.75):
+            xs, ys = self.evaluate(t0 + fraction * h)
+            # Degenerate chords (cusps, retraced segments) fall back to the
+            # distance from the start point
+            offset = np.maximum(offset, np.where(
+                chord > 0,
+                np.abs((xs - x0) * nx + (ys - y0) * ny),
+                np.hypot(xs - x0, ys - y0)))
+
+        _, _, ddx, ddy = self.evaluate_derivatives(t0 + 0.5 * h)
+        bend = np.abs(ddx * nx + ddy * ny)
+        return np.maximum(offset, bend * h**2 / 8)
+
+    def generate_adaptive_curve(self, tolerance: float = 1e-3,
+                                max_points: int = 1_000_000
+                                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Generate curve coordinates with curvature-adaptive sampling.
+
+        Segments are subdivided until the estimated maximum distance between
+        the curve and each chord is within ``tolerance``, so tight turns get
+        dense sampling and flat stretches stay sparse. The output covers the
+        same [0, 2π] range as ``generate_curve`` and can be passed directly
+        to ``calculate_arc_length``.
+
+        Args:
+            tolerance: Maximum allowed chord deviation (in curve units)
+            max_points: Upper bound on the number of returned points
+
+        Returns:
+            Tuple of (t, x, y) numpy arrays with non-uniform t
+        """
+        if tolerance <= 0:
+            raise ValueError("tolerance must be positive")
+
+        # Seed with a few samples per half-period so no lobe is skipped
+        max_freq = max(abs(self.a), abs(self.b), 1.0)
+        t = np.linspace(0, 2 * np.pi, int(8 * np.ceil(max_freq)) + 1)
+        x, y = self.evaluate(t)
+
+        while len(t) < max_points:
+            deviation = self._chord_deviation(t[:-1], t[1:], x[:-1], y[:-1], x[1:], y[1:])
+            split = np.nonzero(deviation > tolerance)[0]
+            if len(split) == 0:
+                break
+            # Deviation scales with h², so split each failing segment into
+            # just enough equal pieces rather than blindly bisecting
+            pieces = np.ceil(np.sqrt(deviation[split] / tolerance)).astype(np.int64)
+            pieces = np.maximum(pieces, 2)
+            budget = max_points - len(t)
+            keep = np.cumsum(pieces - 1) <= budget
+            split, pieces = split[keep], pieces[keep]
+            if len(split) == 0:
+                break
+
+            owner = np.repeat(split, pieces - 1)
+            offsets = np.arange(len(owner)) - np.repeat(np.cumsum(pieces - 1) - (pieces - 1), pieces - 1) + 1
+            t_new = t[owner] + (t[owner + 1] - t[owner]) * offsets / np.repeat(pieces, pieces - 1)
+            x_new, y_new = self.evaluate(t_new)
+            t = np.insert(t, owner + 1, t_new)
+            x = np.insert(x, owner + 1, x_new)
+            y = np.insert(y, owner + 1, y_new)
+
+        return t, x, y
+
     def calculate_arc_length(self, x: np.ndarray, y: np.ndarray) -> float:
         """
         Calculate approximate arc length of the curve.
@@ -81,7 +204,43 @@ class LissajousGeometry:
         dy = np.diff(y)
         segments = np.sqrt(dx**2 + dy**2)
         return np.sum(segments)
+
+    @staticmethod
+    def calculate_cumulative_arc_length(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Calculate the running arc length at every point.
+
+        Uses the same chord lengths as ``calculate_arc_length``. Works along
+        the last axis, so (n_curves, n_points) batches are supported.
+
+        Args:
+            x: x-coordinates
+            y: y-coordinates
+
+        Returns:
+            Array shaped like x, starting at 0 and ending at the total length
+        """
+        segments = np.hypot(np.diff(x, axis=-1), np.diff(y, axis=-1))
+        cumulative = np.zeros(np.shape(x))
+        np.cumsum(segments, axis=-1, out=cumulative[..., 1:])
+        return cumulative
     
+    def calculate_analytic_arc_length(self, tolerance: float = 1e-10) -> float:
+        """
+        Calculate the arc length by integrating the analytic speed.
+
+        Unlike ``calculate_arc_length`` this does not depend on
+        ``num_points`` and needs no curve samples at all.
+
+        Args:
+            tolerance: Requested relative accuracy
+
+        Returns:
+            Arc length over t in [0, 2π]
+        """
+        return float(analytic_arc_length(self.A, self.B, self.a, self.b,
+                                         self.delta, tolerance=tolerance))
+
     def calculate_bounding_box(self, x: np.ndarray, y: np.ndarray) -> Dict[str, float]:
         """
         Calculate bounding box dimensions.
@@ -104,6 +263,10 @@ class LissajousGeometry:
         """
         Calculate symmetry score of the curve.
         
+        Compares the curve with its reversed samples, so it only sees
+        point symmetry about the start of sampling; use
+        ``calculate_symmetry_group`` to detect rotations and reflections.
+        
         Args:
             x: x-coordinates
             y: y-coordinates
@@ -123,6 +286,273 @@ class LissajousGeometry:
             symmetry = 1.0
             
         return max(0.0, min(1.0, symmetry))
+    
+    def calculate_symmetry_group(self, x: np.ndarray, y: np.ndarray,
+                                 tolerance: float = 1e-6) -> Dict:
+        """
+        Detect the rotations and reflections that map the curve onto itself.
+        
+        Uses FFT circular cross-correlation (``lissajous_symmetry``), so the
+        result does not depend on where sampling starts. The samples must
+        cover one full period, as from ``generate_curve`` with integer
+        frequencies.
+        
+        Args:
+            x: x-coordinates
+            y: y-coordinates
+            tolerance: A symmetry is accepted when its score is ≥ 1 - tolerance
+            
+        Returns:
+            Dictionary with 'group' (e.g. 'D2'), 'rotation_order',
+            'rotation_angles', 'reflection_axes', their scores, 'center'
+            and 'best_score'
+        """
+        return analyze_symmetry(x, y, tolerance=tolerance)
+
+
+# Gauss–Kronrod 7/15 rule on [-1, 1] (QUADPACK qk15). The Kronrod nodes
+# extend the Gauss nodes, so one set of 15 evaluations yields both the
+# integral and an error estimate.
+_KRONROD_NODES = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.000000000000000000000000000000000])
+_KRONROD_WEIGHTS = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+_GAUSS_WEIGHTS = np.array([
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327])
+
+_GK_NODES = np.concatenate([-_KRONROD_NODES[:-1], _KRONROD_NODES[::-1]])
+_GK_WEIGHTS = np.concatenate([_KRONROD_WEIGHTS[:-1], _KRONROD_WEIGHTS[::-1]])
+_G_WEIGHTS = np.zeros(15)
+_G_WEIGHTS[[1, 3, 5]] = _GAUSS_WEIGHTS[:3]
+_G_WEIGHTS[[13, 11, 9]] = _GAUSS_WEIGHTS[:3]
+_G_WEIGHTS[7] = _GAUSS_WEIGHTS[3]
+
+# Initial panels integrated together by analytic_arc_length; larger batches
+# are split into groups of about this size
+ARC_LENGTH_GROUP_PANELS = 65536
+
+
+def analytic_arc_length(amplitude_x, amplitude_y, frequency_x, frequency_y,
+                        phase_shift, tolerance: float = 1e-10,
+                        t_max: float = 2 * np.pi,
+                        max_panels: int = 100_000,
+                        strict: bool = False) -> Union[float, np.ndarray]:
+    """
+    Integrate the Lissajous speed √((Aa·cos(at+δ))² + (Bb·cos(bt))²) over [0, t_max].
+
+    Uses vectorized adaptive Gauss–Kronrod quadrature: every configuration
+    starts with one panel per half-period, each panel is integrated with the
+    7/15-point rule, and only panels whose error estimate (the larger of the
+    Gauss–Kronrod and parent-versus-halves differences) exceeds their share
+    of the tolerance are bisected. Panels containing a cusp (where
+    the speed has a kink) are therefore refined locally without touching
+    the rest of the curve.
+
+    All parameters broadcast against each other, so a whole batch of
+    configurations is integrated in one call. Configurations are processed
+    in groups of about ``ARC_LENGTH_GROUP_PANELS`` initial panels, so memory
+    does not grow with the batch size.
+
+    Args:
+        amplitude_x: Amplitude(s) in x-direction
+        amplitude_y: Amplitude(s) in y-direction
+        frequency_x: Frequency ratio(s) in x-direction
+        frequency_y: Frequency ratio(s) in y-direction
+        phase_shift: Phase shift(s) (in radians)
+        tolerance: Requested relative accuracy per configuration
+        t_max: Upper integration limit
+        max_panels: Cap on the live panels of each configuration. A
+            configuration whose first refinement would exceed it raises
+            ValueError; one that reaches it later is accepted as it is and
+            a RuntimeWarning reports the relative error bound achieved
+        strict: Raise RuntimeError instead of warning when the cap is hit
+
+    Returns:
+        Arc length as a float for scalar input, otherwise an array with the
+        broadcast shape of the parameters
+    """
+    if tolerance <= 0:
+        raise ValueError("tolerance must be positive")
+    if not t_max > 0:
+        raise ValueError("t_max must be positive")
+
+    A, B, a, b, delta = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (
+        amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift)))
+    shape = A.shape
+    A, B, a, b, delta = (p.ravel() for p in (A, B, a, b, delta))
+    n_configs = A.size
+
+    # One panel per half-period of the faster component, checked against
+    # the cap before anything is allocated (the first pass splits them all)
+    initial = np.maximum(2 * np.ceil(np.maximum(np.abs(a), np.abs(b)) * t_max / (2 * np.pi)), 1)
+    if not np.all(2 * initial <= max_panels):
+        raise ValueError(f"Frequencies must be finite and at most about "
+                         f"{max_panels * np.pi / (2 * t_max):g} for max_panels={max_panels}")
+    panels_per_config = initial.astype(np.int64)
+
+    total = np.zeros(n_configs)
+    unresolved = np.zeros(n_configs)
+    ends = np.cumsum(panels_per_config)
+    start = 0
+    while start < n_configs:
+        limit = ends[start] - panels_per_config[start] + ARC_LENGTH_GROUP_PANELS
+        stop = max(int(np.searchsorted(ends, limit, side='right')), start + 1)
+        group = slice(start, stop)
+        total[group], unresolved[group] = _integrate_speed(
+            A[group], B[group], a[group], b[group], delta[group],
+            panels_per_config[group], tolerance, t_max, max_panels)
+        start = stop
+
+    if np.any(unresolved > 0):
+        achieved = np.max(unresolved / np.maximum(total, 1.0))
+        message = (f"analytic_arc_length hit max_panels={max_panels} before reaching "
+                   f"tolerance {tolerance:g}; achieved relative error bound {achieved:.3g}")
+        if strict:
+            raise RuntimeError(message)
+        warnings.warn(message, RuntimeWarning, stacklevel=2)
+
+    total = total.reshape(shape)
+    return float(total) if total.ndim == 0 else total
+
+
+def _integrate_speed(A, B, a, b, delta, panels_per_config, tolerance, t_max,
+                     max_panels) -> Tuple[np.ndarray, np.ndarray]:
+    """Adaptive quadrature of one group; returns (lengths, unresolved error)."""
+    n_configs = A.size
+
+    def integrate(owner, lo, hi):
+        half = 0.5 * (hi - lo)
+        t = 0.5 * (hi + lo)[:, None] + half[:, None] * _GK_NODES[None, :]
+        speed = np.hypot(A[owner, None] * a[owner, None] * np.cos(a[owner, None] * t + delta[owner, None]),
+                         B[owner, None] * b[owner, None] * np.cos(b[owner, None] * t))
+        kronrod = speed @ _GK_WEIGHTS
+        gauss = speed @ _G_WEIGHTS
+        # QUADPACK error heuristic: scale |K - G| against the variation of
+        # the integrand so smooth panels are not refined needlessly
+        variation = np.abs(speed - 0.5 * kronrod[:, None]) @ _GK_WEIGHTS
+        raw = np.abs(kronrod - gauss)
+        safe = np.where(variation > 0, variation, 1.0)
+        error = np.where(variation > 0,
+                         variation * np.minimum(1.0, (200 * raw / safe) ** 1.5),
+                         raw)
+        return half * kronrod, half * error
+
+    owner = np.repeat(np.arange(n_configs), panels_per_config)
+    first = np.repeat(np.cumsum(panels_per_config) - panels_per_config, panels_per_config)
+    index = np.arange(len(owner)) - first
+    width = t_max / panels_per_config[owner]
+    lo = index * width
+    hi = lo + width
+
+    total = np.zeros(n_configs)
+    unresolved = np.zeros(n_configs)
+    budget = None
+    parent = None
+    while len(owner) > 0:
+        value, error = integrate(owner, lo, hi)
+        if budget is None:
+            # Scale the absolute error budget by the first length estimate;
+            # initial panels are always split once so every accepted panel
+            # has a parent to be checked against
+            rough = np.bincount(owner, weights=value, minlength=n_configs)
+            budget = tolerance * np.maximum(rough, 1.0)
+            error = np.full(len(owner), np.inf)
+        else:
+            # Children are laid out as [left halves, right halves]; the
+            # parent-versus-children difference catches panels where the
+            # Gauss and Kronrod estimates agree by coincidence
+            n = len(owner) // 2
+            split_error = 0.5 * np.abs(parent[:n] - (value[:n] + value[n:]))
+            error = np.maximum(error, np.concatenate([split_error, split_error]))
+        allowed = budget[owner] * (hi - lo) / t_max
+        done = (error <= allowed) | (hi - lo <= 1e-12 * t_max)
+
+        # Configurations whose next refinement exceeds the cap keep their
+        # current panels and record the error left unresolved
+        capped = 2 * np.bincount(owner[~done], minlength=n_configs) > max_panels
+        stuck = ~done & capped[owner]
+        unresolved += np.bincount(owner[stuck], weights=error[stuck], minlength=n_configs)
+        done |= stuck
+        total += np.bincount(owner[done], weights=value[done], minlength=n_configs)
+
+        owner, lo, hi, value = owner[~done], lo[~done], hi[~done], value[~done]
+        mid = 0.5 * (lo + hi)
+        owner = np.concatenate([owner, owner])
+        lo, hi = np.concatenate([lo, mid]), np.concatenate([mid, hi])
+        parent = np.concatenate([value, value])
+    return total, unresolved
+
+
+def calculate_batch_metrics(amplitude_x, amplitude_y, frequency_x, frequency_y,
+                            phase_shift, num_points: int = 1000,
+                            arc_length_tolerance: Optional[float] = None,
+                            batch_size: int = 4096) -> Dict[str, np.ndarray]:
+    """
+    Compute curve metrics for many configurations at once.
+
+    Equivalent to calling ``calculate_arc_length``, ``calculate_bounding_box``,
+    ``calculate_symmetry_score`` and the closure distance of
+    ``ValidationMetrics.validate_periodicity`` on ``LissajousGeometry``
+    curves of ``num_points`` samples, but vectorized over configurations.
+    Samples are generated ``batch_size`` curves at a time to bound memory.
+
+    Args:
+        amplitude_x: Amplitude(s) in x-direction
+        amplitude_y: Amplitude(s) in y-direction
+        frequency_x: Frequency ratio(s) in x-direction
+        frequency_y: Frequency ratio(s) in y-direction
+        phase_shift: Phase shift(s) (in radians)
+        num_points: Samples per curve
+        arc_length_tolerance: When given, integrate the arc length with
+            ``analytic_arc_length`` at this tolerance instead of summing
+            chords of the samples
+        batch_size: Curves sampled at once
+
+    Returns:
+        Dictionary of 1-D arrays: 'arc_length', 'x_min', 'x_max', 'y_min',
+        'y_max', 'symmetry_score' and 'closure' (start/end distance
+        normalized by the largest coordinate)
+    """
+    A, B, a, b, delta = (p.ravel() for p in np.broadcast_arrays(*(
+        np.asarray(p, dtype=float) for p in (
+            amplitude_x, amplitude_y, frequency_x, frequency_y, phase_shift))))
+    n = A.size
+    names = ('arc_length', 'x_min', 'x_max', 'y_min', 'y_max', 'symmetry_score', 'closure')
+    metrics = {name: np.empty(n) for name in names}
+
+    t = np.linspace(0, 2 * np.pi, num_points)
+    for start in range(0, n, batch_size):
+        rows = slice(start, min(start + batch_size, n))
+        x = A[rows, None] * np.sin(a[rows, None] * t + delta[rows, None])
+        y = B[rows, None] * np.sin(b[rows, None] * t)
+
+        metrics['arc_length'][rows] = np.sum(np.hypot(np.diff(x, axis=1), np.diff(y, axis=1)), axis=1)
+        metrics['x_min'][rows] = x.min(axis=1)
+        metrics['x_max'][rows] = x.max(axis=1)
+        metrics['y_min'][rows] = y.min(axis=1)
+        metrics['y_max'][rows] = y.max(axis=1)
+
+        max_deviation = np.maximum(np.abs(x).max(axis=1), np.abs(y).max(axis=1))
+        deviation = (np.mean(np.abs(x + x[:, ::-1]), axis=1) +
+                     np.mean(np.abs(y + y[:, ::-1]), axis=1))
+        safe = np.where(max_deviation > 0, max_deviation, 1.0)
+        symmetry = np.where(max_deviation > 0, 1 - deviation / (4 * safe), 1.0)
+        metrics['symmetry_score'][rows] = np.clip(symmetry, 0.0, 1.0)
+
+        closure = np.hypot(x[:, 0] - x[:, -1], y[:, 0] - y[:, -1])
+        metrics['closure'][rows] = np.where(max_deviation > 0, closure / safe, 0.0)
+
+    if arc_length_tolerance is not None:
+        metrics['arc_length'] = np.atleast_1d(analytic_arc_length(
+            A, B, a, b, delta, tolerance=arc_length_tolerance))
+    return metrics
 
 
 class ValidationMetrics:
@@ -130,10 +560,15 @@ class ValidationMetrics:
     Validation metrics for Lissajous geometry system.
     """
     
+    # Default tolerances, shared with tools that report against them
+    AMPLITUDE_TOLERANCE = 0.01
+    PERIODICITY_TOLERANCE = 0.1
+    FREQUENCY_TOLERANCE = 0.1
+    
     @staticmethod
     def validate_amplitude_bounds(x: np.ndarray, y: np.ndarray, 
                                   expected_a: float, expected_b: float,
-                                  tolerance: float = 0.01) -> bool:
+                                  tolerance: float = AMPLITUDE_TOLERANCE) -> bool:
         """
         Validate that generated curve respects amplitude bounds.
         
@@ -158,7 +593,7 @@ class ValidationMetrics:
     @staticmethod
     def validate_periodicity(x: np.ndarray, y: np.ndarray, 
                            freq_x: float, freq_y: float,
-                           tolerance: float = 0.1) -> bool:
+                           tolerance: float = PERIODICITY_TOLERANCE) -> bool:
         """
         Validate periodicity of the curve.
         
@@ -186,6 +621,30 @@ class ValidationMetrics:
         
         return True
     
+    @staticmethod
+    def validate_spectral_frequencies(x: np.ndarray, y: np.ndarray,
+                                      freq_x: float, freq_y: float,
+                                      tolerance: float = FREQUENCY_TOLERANCE) -> bool:
+        """
+        Validate the generated frequencies from the curve's spectrum.
+        
+        Spectral counterpart to ``validate_periodicity``: the dominant FFT
+        peak of each coordinate must lie within ``tolerance`` of the
+        expected frequency. Accepts (n_curves, n_points) arrays as well
+        (see ``lissajous_spectral.validate_frequencies``).
+        
+        Args:
+            x: x-coordinates over t in [0, 2π], as from ``generate_curve``
+            y: y-coordinates
+            freq_x: Expected frequency in x direction
+            freq_y: Expected frequency in y direction
+            tolerance: Acceptable absolute frequency error
+            
+        Returns:
+            True if validation passes
+        """
+        return validate_frequencies(x, y, freq_x, freq_y, tolerance=tolerance)
+    
     @staticmethod
     def validate_smoothness(x: np.ndarray, y: np.ndarray,
                           max_curvature: float = 100.0) -> bool:
@@ -216,29 +675,36 @@ class ValidationMetrics:
         return max_ddx < max_curvature and max_ddy < max_curvature
 
 
-def generate_csv_datasets(output_dir: str = "datasets"):
+# Standard dataset configurations (Section 6)
+DATASET_CONFIGURATIONS = [
+    # (amp_x, amp_y, freq_x, freq_y, phase, name)
+    (1.0, 1.0, 1.0, 1.0, 0.0, "circle"),
+    (1.0, 1.0, 1.0, 1.0, np.pi/2, "diagonal"),
+    (1.0, 1.0, 3.0, 2.0, np.pi/2, "standard_3_2"),
+    (1.0, 1.0, 5.0, 4.0, np.pi/2, "standard_5_4"),
+    (1.5, 1.0, 3.0, 2.0, 0.0, "asymmetric_3_2"),
+    (1.0, 1.0, 2.0, 3.0, np.pi/4, "inverted_2_3"),
+]
+
+
+def generate_csv_datasets(output_dir: str = "datasets", build_lod: bool = False,
+                          write_compact: bool = False):
     """
     Generate CSV datasets for various Lissajous curve configurations.
     Section 6: Dataset Generation
     
     Args:
         output_dir: Directory to save CSV files
+        build_lod: Also write a level-of-detail pyramid per curve
+            (lissajous_<name>.lod, see lissajous_lod.py)
+        write_compact: Also write each curve in the compact binary format
+            (lissajous_<name>.lsjz, see lissajous_compact.py)
     """
     os.makedirs(output_dir, exist_ok=True)
     
-    configurations = [
-        # (amp_x, amp_y, freq_x, freq_y, phase, name)
-        (1.0, 1.0, 1.0, 1.0, 0.0, "circle"),
-        (1.0, 1.0, 1.0, 1.0, np.pi/2, "diagonal"),
-        (1.0, 1.0, 3.0, 2.0, np.pi/2, "standard_3_2"),
-        (1.0, 1.0, 5.0, 4.0, np.pi/2, "standard_5_4"),
-        (1.5, 1.0, 3.0, 2.0, 0.0, "asymmetric_3_2"),
-        (1.0, 1.0, 2.0, 3.0, np.pi/4, "inverted_2_3"),
-    ]
-    
     summary_data = []
     
-    for amp_x, amp_y, freq_x, freq_y, phase, name in configurations:
+    for amp_x, amp_y, freq_x, freq_y, phase, name in DATASET_CONFIGURATIONS:
         lissajous = LissajousGeometry(
             amplitude_x=amp_x,
             amplitude_y=amp_y,
@@ -258,10 +724,21 @@ def generate_csv_datasets(output_dir: str = "datasets"):
             for i, (xi, yi) in enumerate(zip(x, y)):
                 writer.writerow([lissajous.t[i], xi, yi])
         
+        if build_lod:
+            lod_path = os.path.join(output_dir, f"lissajous_{name}.lod")
+            write_lod_pyramid(lod_path, build_lod_pyramid(x, y))
+        
+        if write_compact:
+            # Imported here because lissajous_compact imports this module
+            from lissajous_compact import write_compact_curve
+            compact_path = os.path.join(output_dir, f"lissajous_{name}.lsjz")
+            write_compact_curve(compact_path, lissajous, x, y)
+        
         # Calculate metrics
         arc_length = lissajous.calculate_arc_length(x, y)
         bbox = lissajous.calculate_bounding_box(x, y)
         symmetry = lissajous.calculate_symmetry_score(x, y)
+        group = lissajous.calculate_symmetry_group(x, y)
         
         summary_data.append({
             'name': name,
@@ -275,7 +752,8 @@ def generate_csv_datasets(output_dir: str = "datasets"):
             'x_max': bbox['x_max'],
             'y_min': bbox['y_min'],
             'y_max': bbox['y_max'],
-            'symmetry_score': symmetry
+            'symmetry_score': symmetry,
+            'symmetry_group': group['group']
         })
         
         print(f"Generated dataset: {name}")
@@ -404,6 +882,21 @@ def run_verification_suite() -> Dict[str, any]:
         results['tests_failed'] += 1
         results['test_details'].append({'test': 'Symmetry Score', 'status': 'FAILED', 'error': str(e)})
     
+    # Test 7: Spectral frequency check
+    print("\nTest 7: Spectral Frequency Validation")
+    try:
+        lissajous = LissajousGeometry(frequency_x=5.0, frequency_y=4.0)
+        x, y = lissajous.generate_curve()
+        valid = ValidationMetrics.validate_spectral_frequencies(x, y, 5.0, 4.0)
+        assert valid, "Dominant frequencies do not match 5:4"
+        print(f"  ✓ PASSED: Dominant frequencies match 5:4")
+        results['tests_passed'] += 1
+        results['test_details'].append({'test': 'Spectral Frequencies', 'status': 'PASSED'})
+    except Exception as e:
+        print(f"  ✗ FAILED: {e}")
+        results['tests_failed'] += 1
+        results['test_details'].append({'test': 'Spectral Frequencies', 'status': 'FAILED', 'error': str(e)})
+    
     print("\n" + "=" * 60)
     print(f"VERIFICATION COMPLETE")
     print(f"Tests Passed: {results['tests_passed']}")